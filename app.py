@@ -5,22 +5,30 @@
 import streamlit as st
 import os
 import json
-import urllib.request
-import urllib.parse
-import urllib.error
 import re
 from datetime import datetime
 import pandas as pd
 import matplotlib.pyplot as plt
 import matplotlib.font_manager as fm
 
+from naver_rank.naver_client import get_client, DEFAULT_MAX_CONCURRENCY, PAGE_SIZE, MAX_RANK
+from naver_rank.page_cache import DEFAULT_TTL, DEFAULT_DISK_PATH
+from naver_rank.items import product_list_row
+from naver_rank.rank_series import RankSeries
+from naver_rank.result_cache import get_result_cache
+from naver_rank.rank_scanner import RankTarget, analyze_competitors, scan_ranks
+from naver_rank.batch_engine import parse_keywords
+from naver_rank.job_runner import get_job_runner, CANCELLED, FAILED
+from naver_rank.key_pool import get_key_pool, parse_credentials, LEAST_USED, ROUND_ROBIN
+from naver_rank.credential_check import get_verifier, DEFAULT_VALIDITY
+from naver_rank.tracking_store import get_tracking_store, set_tracking_backend, get_tracking_backend, SQLITE_BACKEND
+
 # 한글 폰트 설정
 plt.rcParams['font.family'] = 'Malgun Gothic'
 plt.rcParams['axes.unicode_minus'] = False
 
 # API 키 저장 파일
 API_CONFIG_FILE = "api_config.json"
-RANK_TRACKING_FILE = "rank_tracking.json"
 
 # 세션 상태 초기화
 if 'api_verified' not in st.session_state:
@@ -35,6 +43,10 @@ if 'access_license' not in st.session_state:
     st.session_state.access_license = ""
 if 'secret_key' not in st.session_state:
     st.session_state.secret_key = ""
+if 'extra_credentials' not in st.session_state:
+    st.session_state.extra_credentials = []
+if 'key_strategy' not in st.session_state:
+    st.session_state.key_strategy = LEAST_USED
 
 def load_api_config():
     """저장된 API 설정 불러오기"""
@@ -47,6 +59,16 @@ def load_api_config():
                 st.session_state.customer_id = config.get("customer_id", "")
                 st.session_state.access_license = config.get("access_license", "")
                 st.session_state.secret_key = config.get("secret_key", "")
+                st.session_state.extra_credentials = [
+                    (c["client_id"], c["client_secret"]) for c in config.get("extra_credentials", [])
+                ]
+                st.session_state.key_strategy = config.get("key_strategy", LEAST_USED)
+                get_client().max_concurrency = int(config.get("max_concurrency", DEFAULT_MAX_CONCURRENCY))
+                get_client().cache.ttl = int(config.get("cache_ttl", DEFAULT_TTL))
+                get_result_cache().ttl = get_client().cache.ttl
+                get_client().cache.set_disk_path(DEFAULT_DISK_PATH if config.get("cache_on_disk") else None)
+                set_tracking_backend(config.get("tracking_backend", SQLITE_BACKEND))
+                get_verifier().validity = int(config.get("verify_ttl", DEFAULT_VALIDITY))
                 return True
         except Exception as e:
             st.error(f"⚠️ API 설정 로드 실패: {e}")
@@ -59,7 +81,17 @@ def save_api_config():
         "client_secret": st.session_state.client_secret,
         "customer_id": st.session_state.customer_id,
         "access_license": st.session_state.access_license,
-        "secret_key": st.session_state.secret_key
+        "secret_key": st.session_state.secret_key,
+        "extra_credentials": [
+            {"client_id": cid, "client_secret": secret}
+            for cid, secret in st.session_state.extra_credentials
+        ],
+        "key_strategy": st.session_state.key_strategy,
+        "max_concurrency": get_client().max_concurrency,
+        "cache_ttl": get_client().cache.ttl,
+        "cache_on_disk": get_client().cache.disk_path is not None,
+        "tracking_backend": get_tracking_backend(),
+        "verify_ttl": get_verifier().validity
     }
     try:
         with open(API_CONFIG_FILE, "w", encoding="utf-8") as f:
@@ -69,257 +101,180 @@ def save_api_config():
         st.error(f"⚠️ API 설정 저장 실패: {e}")
         return False
 
-def verify_naver_api(client_id_val, client_secret_val):
-    """네이버 API 인증 확인"""
-    try:
-        test_query = urllib.parse.quote("테스트")
-        test_url = f"https://openapi.naver.com/v1/search/shop.json?query={test_query}&display=1&start=1"
-        request = urllib.request.Request(test_url)
-        request.add_header("X-Naver-Client-Id", client_id_val)
-        request.add_header("X-Naver-Client-Secret", client_secret_val)
-        response = urllib.request.urlopen(request, timeout=5)
-        result = json.loads(response.read())
-        return "items" in result and len(result.get("items", [])) > 0
-    except urllib.error.HTTPError as e:
-        if e.code == 401:
-            return False
-        return False
-    except Exception as e:
-        return False
+def get_credentials():
+    """현재 세션의 네이버 API 인증 정보 (추가 키가 있으면 키 풀)"""
+    primary = (st.session_state.client_id, st.session_state.client_secret)
+    if st.session_state.extra_credentials:
+        return get_key_pool(
+            [primary] + list(st.session_state.extra_credentials),
+            strategy=st.session_state.key_strategy,
+            quota=get_client().quota,
+        )
+    return primary
 
-def get_top_ranked_product_by_mall(keyword, mall_name):
-    """특정 판매처의 최고 순위 상품 찾기"""
-    encText = urllib.parse.quote(keyword)
-    seen_titles = set()
-    best_product = None
-    try:
-        for start in range(1, 1001, 100):
-            url = f"https://openapi.naver.com/v1/search/shop.json?query={encText}&display=100&start={start}"
-            request = urllib.request.Request(url)
-            request.add_header("X-Naver-Client-Id", st.session_state.client_id)
-            request.add_header("X-Naver-Client-Secret", st.session_state.client_secret)
-            try:
-                response = urllib.request.urlopen(request, timeout=10)
-                result = json.loads(response.read())
-                items = result.get("items", [])
-                if not items:
-                    break
-                for idx, item in enumerate(items, start=1):
-                    if item.get("mallName") and mall_name in item["mallName"]:
-                        title_clean = re.sub(r"<.*?>", "", item.get("title", ""))
-                        if title_clean in seen_titles:
-                            continue
-                        seen_titles.add(title_clean)
-                        rank = start + idx - 1
-                        cat1 = item.get("category1", "")
-                        cat2 = item.get("category2", "")
-                        cat3 = item.get("category3", "")
-                        category = " > ".join(filter(None, [cat1, cat2, cat3]))
-                        
-                        product = {
-                            "rank": rank,
-                            "title": title_clean,
-                            "price": item.get("lprice", "0"),
-                            "link": item.get("link", ""),
-                            "mallName": item.get("mallName", ""),
-                            "brand": item.get("brand", ""),
-                            "category": category
-                        }
-                        if not best_product or rank < best_product["rank"]:
-                            best_product = product
-            except (urllib.error.URLError, urllib.error.HTTPError, TimeoutError) as e:
-                break
-    except Exception as e:
-        pass
-    return best_product
+def verify_naver_api(client_id_val, client_secret_val):
+    """네이버 API 인증 확인 (항상 새로 요청하고 결과를 캐시에 기록)"""
+    return get_verifier().verify((client_id_val, client_secret_val), force=True)
 
-def get_product_list(keyword, max_rank=100):
-    """1~100위 상품 리스트 수집"""
-    encText = urllib.parse.quote(keyword)
-    seen_titles = set()
-    products = []
+def cached_result(key, compute):
+    """모든 세션이 공유하는 결과 캐시에서 조회 (같은 조회가 진행 중이면 그 결과를 기다림)
     
-    try:
-        url = f"https://openapi.naver.com/v1/search/shop.json?query={encText}&display=100&start=1"
-        request = urllib.request.Request(url)
-        request.add_header("X-Naver-Client-Id", st.session_state.client_id)
-        request.add_header("X-Naver-Client-Secret", st.session_state.client_secret)
-        
-        response = urllib.request.urlopen(request, timeout=10)
-        result = json.loads(response.read())
-        items = result.get("items", [])
-        
-        for idx, item in enumerate(items, start=1):
-            if idx > max_rank:
-                break
-            
-            title_clean = re.sub(r"<.*?>", "", item.get("title", ""))
-            if title_clean in seen_titles:
-                continue
-            seen_titles.add(title_clean)
-            
-            cat1 = item.get("category1", "")
-            cat2 = item.get("category2", "")
-            cat3 = item.get("category3", "")
-            category = " > ".join(filter(None, [cat1, cat2, cat3]))
-            
-            product = {
-                "순위": idx,
-                "상품명": title_clean,
-                "가격": int(item.get("lprice", 0)),
-                "카테고리": category,
-                "판매처": item.get("mallName", ""),
-                "브랜드": item.get("brand", ""),
-                "제조사": item.get("maker", ""),
-                "상품링크": item.get("link", ""),
-                "이미지": item.get("image", "")
-            }
-            products.append(product)
-    except Exception as e:
-        st.error(f"오류 발생: {str(e)}")
-    
-    return products
+    반환값은 여러 세션이 함께 쓰므로 수정하지 말고 복사해서 사용해야 합니다.
+    """
+    return get_result_cache().get_or_compute(key, compute)
+
+def make_rank_product(product):
+    """Product를 순위 조회용 상품 정보로 변환"""
+    return {
+        "rank": product.rank,
+        "title": product.title,
+        "price": product.price,
+        "link": product.link,
+        "mallName": product.mall_name
+    }
+
+def get_product_ranks(keyword, targets):
+    """검색어 한 번의 스캔으로 여러 판매처/상품의 순위 조회 (추적 기록용)
+    
+    targets는 RankTarget 목록이며, 찾은 대상만 {RankTarget: 상품 정보}로 반환합니다.
+    결과를 지금 시각으로 추적 기록에 남기므로 결과 캐시와 페이지 캐시를 거치지 않고 항상 새로 조회합니다.
+    API 호출 실패(429 재시도 초과, 일일 한도 소진 등)는 예외로 전달됩니다.
+    """
+    best, _ = scan_ranks(keyword, get_credentials(), targets, use_cache=False)
+    return {target: make_rank_product(product) for target, product in best.items()}
 
 def get_product_rank(keyword, mall_name, product_name=None):
     """특정 상품의 순위 조회"""
-    encText = urllib.parse.quote(keyword)
-    seen_titles = set()
-    best_product = None
-    
-    try:
-        for start in range(1, 1001, 100):
-            url = f"https://openapi.naver.com/v1/search/shop.json?query={encText}&display=100&start={start}"
-            request = urllib.request.Request(url)
-            request.add_header("X-Naver-Client-Id", st.session_state.client_id)
-            request.add_header("X-Naver-Client-Secret", st.session_state.client_secret)
-            
-            response = urllib.request.urlopen(request, timeout=10)
-            result = json.loads(response.read())
-            items = result.get("items", [])
-            
-            if not items:
-                break
-                
-            for idx, item in enumerate(items, start=1):
-                if item.get("mallName") and mall_name in item["mallName"]:
-                    title_clean = re.sub(r"<.*?>", "", item.get("title", ""))
-                    
-                    if product_name and product_name.strip():
-                        if product_name.strip() not in title_clean:
-                            continue
-                    
-                    if title_clean in seen_titles:
-                        continue
-                    seen_titles.add(title_clean)
-                    
-                    rank = start + idx - 1
-                    product = {
-                        "rank": rank,
-                        "title": title_clean,
-                        "price": int(item.get("lprice", 0)),
-                        "link": item.get("link", ""),
-                        "mallName": item.get("mallName", "")
-                    }
-                    
-                    if not best_product or rank < best_product["rank"]:
-                        best_product = product
-                        
-        return best_product
-    except Exception as e:
-        return None
+    target = RankTarget(mall_name, product_name)
+    return get_product_ranks(keyword, [target]).get(target)
 
 def get_competitor_products(keyword, target_mall_name, competitor_count=10):
-    """입력한 판매처 상품 주변의 경쟁사 상품들 조회"""
-    encText = urllib.parse.quote(keyword)
-    target_product = None
-    all_products = []
-    
-    try:
-        for start in range(1, 1001, 100):
-            url = f"https://openapi.naver.com/v1/search/shop.json?query={encText}&display=100&start={start}"
-            request = urllib.request.Request(url)
-            request.add_header("X-Naver-Client-Id", st.session_state.client_id)
-            request.add_header("X-Naver-Client-Secret", st.session_state.client_secret)
-            
-            response = urllib.request.urlopen(request, timeout=10)
-            result = json.loads(response.read())
-            items = result.get("items", [])
-            
-            if not items:
-                break
-            
-            for idx, item in enumerate(items, start=1):
-                rank = start + idx - 1
-                title_clean = re.sub(r"<.*?>", "", item.get("title", ""))
-                mall_name = item.get("mallName", "")
-                
-                product = {
-                    "rank": rank,
-                    "title": title_clean,
-                    "price": int(item.get("lprice", 0)),
-                    "link": item.get("link", ""),
-                    "mallName": mall_name
-                }
-                
-                if not target_product and mall_name and target_mall_name in mall_name:
-                    target_product = product
-                
-                all_products.append(product)
-        
-        if not target_product:
-            return None, []
-        
-        target_rank = target_product["rank"]
-        competitors = []
-        seen_malls = set()
-        
-        for product in all_products:
-            if product["mallName"] and target_mall_name in product["mallName"]:
-                continue
-            
-            rank_diff = abs(product["rank"] - target_rank)
-            if rank_diff <= 5 and product["rank"] != target_rank:
-                if product["mallName"] not in seen_malls:
-                    competitors.append(product)
-                    seen_malls.add(product["mallName"])
-        
-        if len(competitors) < competitor_count:
-            for product in all_products:
-                if product["mallName"] and target_mall_name in product["mallName"]:
-                    continue
-                
-                rank_diff = abs(product["rank"] - target_rank)
-                if 5 < rank_diff <= 10 and product["mallName"] not in seen_malls:
-                    competitors.append(product)
-                    seen_malls.add(product["mallName"])
-                    if len(competitors) >= competitor_count:
-                        break
-        
-        competitors.sort(key=lambda x: x["rank"])
-        
-        return target_product, competitors[:competitor_count]
-        
-    except Exception as e:
+    """입력한 판매처 상품 주변의 경쟁사 상품들 조회
+    
+    API 호출 실패는 예외로 전달됩니다.
+    """
+    # 한 번의 스캔으로 판매처 상품과 주변 순위 상품을 함께 수집 (타겟 상품 위아래 ±5위, 부족하면 ±10위)
+    target_product, competitors = cached_result(
+        ("competitors", keyword, target_mall_name, competitor_count),
+        lambda: analyze_competitors(
+            keyword, get_credentials(), [target_mall_name], count=competitor_count
+        )[target_mall_name],
+    )
+    if target_product is None:
         return None, []
+    return make_rank_product(target_product), [make_rank_product(product) for product in competitors]
 
-def load_tracking_data():
-    """순위 추적 데이터 불러오기"""
-    if os.path.exists(RANK_TRACKING_FILE):
-        try:
-            with open(RANK_TRACKING_FILE, "r", encoding="utf-8") as f:
-                return json.load(f)
-        except Exception as e:
-            pass
-    return {}
+def show_rank_results(results, errors):
+    """순위 확인 결과 표시 ({검색어: 결과}, {검색어: 오류})"""
+    if results:
+        st.success(f"✅ {len([r for r in results.values() if isinstance(r, dict)])}개 검색어에 대한 결과를 찾았습니다.")
 
-def save_tracking_data(data):
-    """순위 추적 데이터 저장"""
-    try:
-        with open(RANK_TRACKING_FILE, "w", encoding="utf-8") as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
-        return True
-    except Exception as e:
-        return False
+        for keyword, result in results.items():
+            with st.expander(f"🔍 {keyword}", expanded=True):
+                if isinstance(result, dict):
+                    st.markdown(f"**순위:** {result['rank']}위")
+                    st.markdown(f"**상품명:** {result['title']}")
+                    st.markdown(f"**판매처:** {result.get('mallName', '-')}")
+                    st.markdown(f"**브랜드:** {result.get('brand', '-')}")
+                    st.markdown(f"**상품타입:** {result.get('category', '-')}")
+                    st.markdown(f"**가격:** {int(result['price']):,}원")
+                    st.markdown(f"**링크:** [상품 보기]({result['link']})")
+                elif result == "조회 실패":
+                    st.warning(f"⚠️ 조회 실패: {errors.get(keyword, '')}")
+                else:
+                    st.error("❌ 검색 결과 없음")
+
+        # 엑셀 다운로드
+        excel_data = []
+        for keyword, result in results.items():
+            if isinstance(result, dict) and result != "검색 결과 없음":
+                excel_data.append({
+                    "검색어": keyword,
+                    "순위": result.get("rank", ""),
+                    "상품명": result.get("title", ""),
+                    "판매처": result.get("mallName", ""),
+                    "브랜드": result.get("brand", "") if result.get("brand") else "",
+                    "상품타입": result.get("category", "") if result.get("category") else "",
+                    "가격": int(result.get("price", 0)) if result.get("price") else 0,
+                    "링크": result.get("link", "")
+                })
+            else:
+                excel_data.append({
+                    "검색어": keyword,
+                    "순위": "",
+                    "상품명": result,
+                    "판매처": "",
+                    "브랜드": "",
+                    "상품타입": "",
+                    "가격": 0,
+                    "링크": ""
+                })
+
+        df = pd.DataFrame(excel_data)
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        csv = df.to_csv(index=False, encoding='utf-8-sig')
+        st.download_button(
+            label="📊 엑셀 다운로드",
+            data=csv,
+            file_name=f"순위확인결과_{timestamp}.csv",
+            mime="text/csv"
+        )
+
+def show_rank_job(job):
+    """순위 확인 작업의 진행 상황과 지금까지의 결과 표시"""
+    results, errors = job.snapshot()
+    if not job.finished:
+        st.progress(job.progress, text=f"{job.description} - {job.status} ({job.done}/{job.total})")
+        st.button("⏹ 중지", key=f"stop_rank_job_{job.id}", on_click=job.cancel)
+        if not hasattr(st, "fragment"):
+            st.button("🔄 진행 상황 새로고침", key=f"refresh_rank_job_{job.id}")
+    elif job.status == CANCELLED:
+        st.warning(f"⏹ 중지됨 - 검색어 {job.total}개 중 {job.done}개 확인 (같은 조건으로 다시 실행하면 이어서 확인)")
+    elif job.status == FAILED:
+        st.error(f"⚠️ 작업 실패: {job.error}")
+    
+    # 결과는 끝난 순서대로 오므로 입력 순서로 정렬
+    show_rank_results({k: results[k] for k in job.params["keywords"] if k in results}, errors)
+
+def product_list_rows(job):
+    """상품 리스트 작업에서 지금까지 받은 상품 행 (순위 순)"""
+    pages, _ = job.snapshot()
+    return [product_list_row(product) for start in sorted(pages) for product in pages[start]]
+
+def show_product_list_job(job):
+    """상품 리스트 수집 작업의 진행 상황과 지금까지 받은 상품 표시"""
+    rows = product_list_rows(job)
+    st.progress(job.progress, text=f"{job.description} - {job.status} ({len(rows)}개 수집)")
+    st.button("⏹ 중지", key=f"stop_list_job_{job.id}", on_click=job.cancel)
+    if not hasattr(st, "fragment"):
+        st.button("🔄 진행 상황 새로고침", key=f"refresh_list_job_{job.id}")
+    if rows:
+        st.dataframe(pd.DataFrame(rows), use_container_width=True, height=400)
+
+def select_job(job_id):
+    """작업 목록에서 고른 작업을 해당 탭에 표시"""
+    job = get_job_runner().get(job_id)
+    if job is not None and job.params.get("kind") == "product_list":
+        st.session_state.product_list_job_id = job_id
+    else:
+        st.session_state.rank_job_id = job_id
+
+def show_job_list():
+    """백그라운드 작업 목록 (다른 세션에서 등록한 작업 포함)"""
+    jobs = get_job_runner().jobs()
+    if not jobs:
+        return
+    running = sum(not job.finished for job in jobs)
+    with st.expander(f"📋 백그라운드 작업 ({running}개 진행 중 / 전체 {len(jobs)}개)"):
+        for job in jobs:
+            col1, col2, col3 = st.columns([6, 1, 1])
+            with col1:
+                st.caption(f"#{job.id} {job.created_at} · {job.description} · {job.status} ({job.done}/{job.total})")
+            with col2:
+                st.button("보기", key=f"view_job_{job.id}", on_click=select_job, args=(job.id,))
+            with col3:
+                if not job.finished:
+                    st.button("중지", key=f"stop_job_{job.id}", on_click=job.cancel)
 
 # 페이지 설정
 st.set_page_config(
@@ -330,10 +285,19 @@ st.set_page_config(
 )
 
 # 프로그램 시작 시 저장된 설정 불러오기
+saved_api_pending = False
 if not st.session_state.api_verified:
     if load_api_config():
-        if st.session_state.client_id and st.session_state.client_secret:
-            if verify_naver_api(st.session_state.client_id, st.session_state.client_secret):
+        saved_credentials = (st.session_state.client_id, st.session_state.client_secret)
+        if all(saved_credentials):
+            # 유효 시간 안에 확인한 결과가 있으면 바로 사용하고,
+            # 없으면 백그라운드에서 확인해 재실행마다 기다리지 않음
+            verified = get_verifier().cached(saved_credentials)
+            if verified is None:
+                future = get_verifier().verify_async(saved_credentials)
+                verified = future.result() if future.done() else None
+                saved_api_pending = verified is None
+            if verified:
                 st.session_state.api_verified = True
 
 # 메인 타이틀
@@ -344,6 +308,9 @@ st.markdown("---")
 with st.sidebar:
     st.header("⚙️ API 설정")
     
+    if saved_api_pending:
+        st.info("🔄 저장된 API 키를 확인하는 중입니다. 잠시 후 화면을 다시 조작하면 반영됩니다.")
+    
     client_id_input = st.text_input(
         "Client ID",
         value=st.session_state.client_id,
@@ -396,6 +363,52 @@ with st.sidebar:
         st.success("✅ 인증 완료")
     else:
         st.warning("⚠️ API 인증 필요")
+    
+    # 추가 API 키 (키 풀)
+    with st.expander("🔑 추가 API 키 (호출 한도 분산)"):
+        extra_keys_input = st.text_area(
+            "한 줄에 하나씩 client_id:client_secret",
+            value="\n".join(f"{cid}:{secret}" for cid, secret in st.session_state.extra_credentials),
+            height=100
+        )
+        strategy_labels = {LEAST_USED: "가장 적게 쓴 키 우선", ROUND_ROBIN: "순서대로 돌아가며"}
+        key_strategy_input = st.selectbox(
+            "분산 방식",
+            options=list(strategy_labels),
+            format_func=strategy_labels.get,
+            index=list(strategy_labels).index(st.session_state.key_strategy)
+        )
+        if st.button("💾 추가 키 저장"):
+            st.session_state.extra_credentials = parse_credentials(extra_keys_input)
+            st.session_state.key_strategy = key_strategy_input
+            if save_api_config():
+                st.success(f"추가 API 키 {len(st.session_state.extra_credentials)}개 저장 완료")
+        
+        credentials = get_credentials()
+        if not isinstance(credentials, tuple):
+            st.dataframe(pd.DataFrame(credentials.status()), use_container_width=True)
+    
+    # 검색 결과 캐시 통계
+    st.subheader("📦 검색 결과 캐시")
+    cache_stats = get_client().cache.stats()
+    st.caption(
+        f"적중 {cache_stats['hits']}회 (디스크 {cache_stats['disk_hits']}회) · "
+        f"실패 {cache_stats['misses']}회 · 적중률 {cache_stats['hit_rate']:.0%} · "
+        f"저장된 페이지 {cache_stats['entries']}개"
+    )
+    st.caption(
+        f"오늘 API 호출 {get_client().quota.used(st.session_state.client_id):,} / "
+        f"{get_client().quota.limit:,}회"
+    )
+    result_stats = get_result_cache().stats()
+    st.caption(
+        f"조회 결과 {result_stats['entries']}개 보관 · 재사용 {result_stats['hits']}회 · "
+        f"다른 세션 조회 공유 {result_stats['shared']}회"
+    )
+    if st.button("🗑️ 캐시 비우기"):
+        get_client().cache.clear()
+        get_result_cache().clear()
+        st.rerun()
 
 # 탭 생성
 tab1, tab2, tab3, tab4, tab5 = st.tabs(["메인", "상품 리스트", "순위 추적", "경쟁사 분석", "도움말"])
@@ -409,7 +422,7 @@ with tab1:
     
     with col1:
         keywords_input = st.text_area(
-            "검색어 (최대 10개, 쉼표로 구분)",
+            "검색어 (쉼표 또는 줄바꿈으로 구분)",
             height=100,
             placeholder="예: 키보드, 마우스, 충전기"
         )
@@ -420,91 +433,50 @@ with tab1:
             placeholder="예: OO스토어"
         )
     
+    resume_check = st.checkbox(
+        "중지한 확인 이어서 하기", value=True,
+        help="해제하면 이전에 확인한 결과를 버리고 모든 검색어를 처음부터 확인합니다."
+    )
+    
     if st.button("🌿 순위 확인", type="primary"):
         if not st.session_state.api_verified:
             st.error("⚠️ 먼저 사이드바에서 API 키를 인증하세요.")
         elif not keywords_input or not mall_name_input:
             st.warning("검색어와 판매처명을 모두 입력하세요.")
         else:
-            keywords = [k.strip() for k in keywords_input.split(",") if k.strip()]
-            if len(keywords) > 10:
-                st.warning("검색어는 최대 10개까지 가능합니다.")
-            else:
-                results = {}
-                progress_bar = st.progress(0)
-                status_text = st.empty()
-                
-                for i, keyword in enumerate(keywords):
-                    status_text.text(f"검색 중: {keyword} ({i+1}/{len(keywords)})")
-                    result = get_top_ranked_product_by_mall(keyword, mall_name_input)
-                    if result:
-                        results[keyword] = result
-                    else:
-                        results[keyword] = "검색 결과 없음"
-                    progress_bar.progress((i+1) / len(keywords))
-                
-                status_text.empty()
-                progress_bar.empty()
-                
-                # 결과 표시
-                if results:
-                    st.success(f"✅ {len([r for r in results.values() if r != '검색 결과 없음'])}개 검색어에 대한 결과를 찾았습니다.")
-                    
-                    for keyword, result in results.items():
-                        with st.expander(f"🔍 {keyword}", expanded=True):
-                            if isinstance(result, dict) and result != "검색 결과 없음":
-                                st.markdown(f"**순위:** {result['rank']}위")
-                                st.markdown(f"**상품명:** {result['title']}")
-                                st.markdown(f"**판매처:** {result.get('mallName', '-')}")
-                                st.markdown(f"**브랜드:** {result.get('brand', '-')}")
-                                st.markdown(f"**상품타입:** {result.get('category', '-')}")
-                                st.markdown(f"**가격:** {int(result['price']):,}원")
-                                st.markdown(f"**링크:** [상품 보기]({result['link']})")
-                            else:
-                                st.error("❌ 검색 결과 없음")
-                    
-                    # 엑셀 다운로드
-                    excel_data = []
-                    for keyword, result in results.items():
-                        if isinstance(result, dict) and result != "검색 결과 없음":
-                            excel_data.append({
-                                "검색어": keyword,
-                                "순위": result.get("rank", ""),
-                                "상품명": result.get("title", ""),
-                                "판매처": result.get("mallName", ""),
-                                "브랜드": result.get("brand", "") if result.get("brand") else "",
-                                "상품타입": result.get("category", "") if result.get("category") else "",
-                                "가격": int(result.get("price", 0)) if result.get("price") else 0,
-                                "링크": result.get("link", "")
-                            })
-                        else:
-                            excel_data.append({
-                                "검색어": keyword,
-                                "순위": "",
-                                "상품명": "검색 결과 없음",
-                                "판매처": "",
-                                "브랜드": "",
-                                "상품타입": "",
-                                "가격": 0,
-                                "링크": ""
-                            })
-                    
-                    df = pd.DataFrame(excel_data)
-                    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                    csv = df.to_csv(index=False, encoding='utf-8-sig')
-                    st.download_button(
-                        label="📊 엑셀 다운로드",
-                        data=csv,
-                        file_name=f"순위확인결과_{timestamp}.csv",
-                        mime="text/csv"
-                    )
+            keywords = parse_keywords(keywords_input)
+            if keywords:
+                # 스캔은 백그라운드 작업으로 실행 (화면을 조작하거나 탭을 닫아도 끊기지 않음)
+                job = get_job_runner().submit_rank_check(
+                    keywords, mall_name_input, get_credentials(), resume=resume_check
+                )
+                st.session_state.rank_job_id = job.id
+    
+    # 선택한 작업의 진행 상황과 결과 표시 (다시 실행되어도 유지)
+    rank_job = get_job_runner().get(st.session_state.get("rank_job_id"))
+    if rank_job is not None:
+        if rank_job.finished or not hasattr(st, "fragment"):
+            show_rank_job(rank_job)
+        else:
+            # 진행 중에는 이 부분만 2초마다 다시 그림
+            @st.fragment(run_every=2)
+            def poll_rank_job():
+                show_rank_job(rank_job)
+                if rank_job.finished:
+                    st.rerun()
+            poll_rank_job()
+    
+    show_job_list()
 
 # 탭 2: 상품 리스트
 with tab2:
     st.header("📋 상품 리스트 추출")
-    st.markdown("검색어를 입력하면 1위~100위까지의 상품 리스트를 추출합니다.")
+    st.markdown("검색어를 입력하면 1위부터 지정한 순위(최대 1000위)까지의 상품 리스트를 추출합니다.")
     
     keyword_input = st.text_input("검색어", placeholder="예: 키보드, 마우스, 노트북")
+    list_depth = st.number_input(
+        "수집 범위 (위까지)", min_value=PAGE_SIZE, max_value=MAX_RANK, value=PAGE_SIZE, step=PAGE_SIZE
+    )
     
     col1, col2 = st.columns([1, 4])
     with col1:
@@ -516,32 +488,70 @@ with tab2:
         elif not keyword_input:
             st.warning("검색어를 입력하세요.")
         else:
-            with st.spinner("상품 리스트 수집 중..."):
-                products = get_product_list(keyword_input, max_rank=100)
-            
-            if products:
-                st.success(f"✅ {len(products)}개 상품이 추출되었습니다.")
-                
-                # 데이터프레임으로 표시
-                df = pd.DataFrame(products)
-                df_display = df[["순위", "상품명", "판매처", "브랜드", "카테고리", "가격", "상품링크"]].copy()
-                df_display["가격"] = df_display["가격"].apply(lambda x: f"{x:,}원")
-                df_display.rename(columns={"상품링크": "링크"}, inplace=True)
-                
-                st.dataframe(df_display, use_container_width=True, height=400)
-                
-                # 엑셀 다운로드
-                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                safe_keyword = re.sub(r'[<>:"/\\|?*]', '_', keyword_input)
-                csv = df.to_csv(index=False, encoding='utf-8-sig')
-                st.download_button(
-                    label="📊 엑셀 다운로드",
-                    data=csv,
-                    file_name=f"상품리스트_{safe_keyword}_{timestamp}.csv",
-                    mime="text/csv"
-                )
+            # 수집은 백그라운드 작업으로 실행하고, 화면은 받은 페이지까지의 진행 상황만 읽어 그림
+            # (다른 세션과 공유하는 수집 안에서는 st 함수를 호출하지 않음)
+            job = get_job_runner().submit_product_list(
+                keyword_input, get_credentials(), max_rank=int(list_depth), cache=get_result_cache()
+            )
+            st.session_state.product_list_job_id = job.id
+    
+    list_job = get_job_runner().get(st.session_state.get("product_list_job_id"))
+    if list_job is not None:
+        if not list_job.finished:
+            if hasattr(st, "fragment"):
+                # 진행 중에는 이 부분만 2초마다 다시 그림
+                @st.fragment(run_every=2)
+                def poll_product_list_job():
+                    show_product_list_job(list_job)
+                    if list_job.finished:
+                        st.rerun()
+                poll_product_list_job()
             else:
-                st.warning("검색 결과가 없습니다.")
+                show_product_list_job(list_job)
+        else:
+            # 끝난 작업의 결과는 세션에 옮겨 두고 다시 실행되어도 유지
+            del st.session_state.product_list_job_id
+            if list_job.status == FAILED:
+                st.session_state.product_list_result = (list_job.params["keyword"], [])
+                st.session_state.product_list_error = list_job.error
+            else:
+                st.session_state.product_list_result = (list_job.params["keyword"], product_list_rows(list_job))
+                st.session_state.pop("product_list_error", None)
+            st.session_state.product_list_cancelled = list_job.status == CANCELLED
+    
+    # 결과 표시 (다운로드 버튼 등으로 다시 실행되어도 유지)
+    if "product_list_result" in st.session_state:
+        list_keyword, products = st.session_state.product_list_result
+        if st.session_state.get("product_list_error"):
+            st.error(f"오류 발생: {st.session_state.product_list_error}")
+        elif products:
+            if st.session_state.get("product_list_cancelled"):
+                st.warning(f"⏹ 중지됨 - 중지하기 전까지 받은 {len(products)}개 상품만 표시합니다.")
+            else:
+                st.success(f"✅ {len(products)}개 상품이 추출되었습니다.")
+            
+            # 데이터프레임으로 표시
+            df = pd.DataFrame(products)
+            df_display = df[["순위", "상품명", "판매처", "브랜드", "카테고리", "가격", "상품링크"]].copy()
+            df_display["가격"] = df_display["가격"].apply(lambda x: f"{x:,}원")
+            df_display.rename(columns={"상품링크": "링크"}, inplace=True)
+            
+            st.dataframe(df_display, use_container_width=True, height=400)
+            
+            # 엑셀 다운로드
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            safe_keyword = re.sub(r'[<>:"/\\|?*]', '_', list_keyword)
+            csv = df.to_csv(index=False, encoding='utf-8-sig')
+            st.download_button(
+                label="📊 엑셀 다운로드",
+                data=csv,
+                file_name=f"상품리스트_{safe_keyword}_{timestamp}.csv",
+                mime="text/csv"
+            )
+        elif st.session_state.get("product_list_cancelled"):
+            st.warning("⏹ 중지됨 - 중지하기 전에 받은 상품이 없습니다.")
+        else:
+            st.warning("검색 결과가 없습니다.")
 
 # 탭 3: 순위 추적
 with tab3:
@@ -562,6 +572,8 @@ with tab3:
     col1, col2 = st.columns([1, 4])
     with col1:
         track_button = st.button("🌿 순위 체크", type="primary")
+    with col2:
+        track_all_button = st.button("🔁 전체 대상 체크")
     
     if track_button:
         if not st.session_state.api_verified:
@@ -569,57 +581,96 @@ with tab3:
         elif not tracking_keyword or not tracking_mall:
             st.warning("검색어와 판매처명을 입력하세요.")
         else:
-            with st.spinner("순위 확인 중..."):
-                product = get_product_rank(tracking_keyword, tracking_mall, tracking_product)
+            try:
+                with st.spinner("순위 확인 중..."):
+                    product = get_product_rank(tracking_keyword, tracking_mall, tracking_product)
+                track_error = None
+            except Exception as e:
+                product, track_error = None, e
             
-            if product:
-                # 추적 데이터 저장
-                tracking_data = load_tracking_data()
-                tracking_key = f"{tracking_keyword}_{tracking_mall}"
-                
-                if tracking_key not in tracking_data:
-                    tracking_data[tracking_key] = {
-                        "keyword": tracking_keyword,
-                        "mall_name": tracking_mall,
-                        "product_name": tracking_product,
-                        "history": []
-                    }
-                
-                record = {
-                    "datetime": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-                    "rank": product["rank"],
-                    "title": product["title"],
-                    "price": product["price"]
-                }
-                
-                tracking_data[tracking_key]["history"].append(record)
-                save_tracking_data(tracking_data)
-                
-                st.success(f"✅ 순위 확인 완료! 현재 순위: {product['rank']}위")
-                st.info(f"상품명: {product['title']}")
-                
-                # 그래프 및 테이블 표시
-                history = tracking_data[tracking_key]["history"]
-                if len(history) > 1:
-                    dates = [h["datetime"] for h in history]
-                    ranks = [h["rank"] for h in history]
-                    
-                    fig, ax = plt.subplots(figsize=(10, 5))
-                    ax.plot(range(len(dates)), ranks, marker='o', linewidth=2, markersize=5, color='#4caf50')
-                    ax.set_xlabel("체크 횟수", fontsize=10)
-                    ax.set_ylabel("순위", fontsize=10)
-                    ax.set_title(f"순위 추이 - {tracking_keyword} ({tracking_mall})", fontsize=12, fontweight='bold')
-                    ax.grid(True, alpha=0.3)
-                    ax.invert_yaxis()
-                    plt.tight_layout()
-                    st.pyplot(fig)
+            if product and not track_error:
+                # 추적 데이터 저장 (버튼을 눌렀을 때 한 번만)
+                get_tracking_store().record(tracking_keyword, tracking_mall, tracking_product, product)
+            st.session_state.track_result = (tracking_keyword, tracking_mall, product, track_error)
+    
+    # 결과 표시 (다운로드 버튼 등으로 다시 실행되어도 유지)
+    if "track_result" in st.session_state:
+        result_keyword, result_mall, product, track_error = st.session_state.track_result
+        if track_error:
+            st.error(f"⚠️ 순위 조회 실패: {track_error}")
+        elif product:
+            st.success(f"✅ 순위 확인 완료! 현재 순위: {product['rank']}위")
+            st.info(f"상품명: {product['title']}")
+            
+            # 그래프 및 테이블 표시
+            history = get_tracking_store().history(result_keyword, result_mall) or []
+            if len(history) > 1:
+                # 기록이 많으면 구간별 최고/최저 순위만 그림
+                dates, ranks = RankSeries(history).display_points()
                 
-                # 테이블 표시
-                if history:
-                    history_df = pd.DataFrame(history)
-                    st.dataframe(history_df, use_container_width=True)
+                fig, ax = plt.subplots(figsize=(10, 5))
+                ax.plot(dates, ranks, marker='o', linewidth=2, markersize=5, color='#4caf50')
+                fig.autofmt_xdate()
+                ax.set_xlabel("확인 시각", fontsize=10)
+                ax.set_ylabel("순위", fontsize=10)
+                ax.set_title(f"순위 추이 - {result_keyword} ({result_mall})", fontsize=12, fontweight='bold')
+                ax.grid(True, alpha=0.3)
+                ax.invert_yaxis()
+                plt.tight_layout()
+                st.pyplot(fig)
+            
+            # 테이블 표시
+            if history:
+                history_df = pd.DataFrame(history)
+                st.dataframe(history_df, use_container_width=True)
+        else:
+            st.error("❌ 검색 결과를 찾을 수 없습니다.")
+    
+    if track_all_button:
+        if not st.session_state.api_verified:
+            st.error("⚠️ 먼저 사이드바에서 API 키를 인증하세요.")
+        else:
+            store = get_tracking_store()
+            tracking_targets = store.targets()
+            if not tracking_targets:
+                st.info("저장된 추적 대상이 없습니다.")
             else:
-                st.error("❌ 검색 결과를 찾을 수 없습니다.")
+                # 검색어별로 추적 대상을 묶어 검색어당 한 번만 스캔
+                targets_by_keyword = {}
+                for entry in tracking_targets:
+                    target = RankTarget(entry["mall_name"], entry["product_name"])
+                    targets_by_keyword.setdefault(entry["keyword"], []).append((entry, target))
+                
+                now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+                records = []
+                summary = []
+                failed_keywords = {}  # 검색어 -> 실패 이유 (한도 소진, 401/429 등은 '찾지 못함'과 구분)
+                with st.spinner(f"검색어 {len(targets_by_keyword)}개 확인 중..."):
+                    for keyword, entries in targets_by_keyword.items():
+                        try:
+                            products = get_product_ranks(keyword, [target for _, target in entries])
+                        except Exception as e:
+                            failed_keywords[keyword] = str(e)
+                            products = {}
+                        for entry, target in entries:
+                            product = products.get(target)
+                            if product:
+                                records.append((entry["keyword"], entry["mall_name"], entry["product_name"], product))
+                            summary.append({
+                                "검색어": keyword,
+                                "판매처": target.mall_name,
+                                "상품명": target.product_name,
+                                "순위": product["rank"] if product else ("조회 실패" if keyword in failed_keywords else "-")
+                            })
+                store.record_many(records, checked_at=now)
+                st.session_state.track_all_result = (len(targets_by_keyword), summary, failed_keywords)
+    
+    if "track_all_result" in st.session_state:
+        keyword_count, summary, failed_keywords = st.session_state.track_all_result
+        st.success(f"✅ 전체 체크 완료! 검색어 {keyword_count}개, 대상 {len(summary)}개")
+        if failed_keywords:
+            st.warning("⚠️ 조회 실패:\n" + "\n".join(f"- {keyword}: {error}" for keyword, error in failed_keywords.items()))
+        st.dataframe(pd.DataFrame(summary), use_container_width=True)
 
 # 탭 4: 경쟁사 분석
 with tab4:
@@ -640,55 +691,67 @@ with tab4:
         elif not competitor_keyword or not competitor_mall:
             st.warning("검색어와 판매처명을 입력하세요.")
         else:
-            with st.spinner("경쟁사 분석 중..."):
-                target_product, competitors = get_competitor_products(competitor_keyword, competitor_mall, competitor_count=10)
+            try:
+                with st.spinner("경쟁사 분석 중..."):
+                    target_product, competitors = get_competitor_products(competitor_keyword, competitor_mall, competitor_count=10)
+                comp_error = None
+            except Exception as e:
+                target_product, competitors = None, []
+                comp_error = e
             
-            if not target_product:
-                st.error(f"'{competitor_mall}' 판매처의 상품을 찾을 수 없습니다.")
-            else:
-                # 결과 준비
-                results = []
+            st.session_state.competitor_result = (competitor_mall, target_product, competitors, comp_error)
+    
+    # 결과 표시 (다운로드 버튼 등으로 다시 실행되어도 유지)
+    if "competitor_result" in st.session_state:
+        result_mall, target_product, competitors, comp_error = st.session_state.competitor_result
+        if comp_error:
+            st.error(f"⚠️ 경쟁사 조회 실패: {comp_error}")
+        elif not target_product:
+            st.error(f"'{result_mall}' 판매처의 상품을 찾을 수 없습니다.")
+        else:
+            # 결과 준비
+            results = []
+            results.append({
+                "판매처": target_product["mallName"],
+                "순위": target_product["rank"],
+                "상품명": target_product["title"],
+                "가격": target_product["price"],
+                "is_target": True
+            })
+            
+            for comp in competitors:
                 results.append({
-                    "판매처": target_product["mallName"],
-                    "순위": target_product["rank"],
-                    "상품명": target_product["title"],
-                    "가격": target_product["price"],
-                    "is_target": True
+                    "판매처": comp["mallName"],
+                    "순위": comp["rank"],
+                    "상품명": comp["title"],
+                    "가격": comp["price"],
+                    "is_target": False
                 })
-                
-                for comp in competitors:
-                    results.append({
-                        "판매처": comp["mallName"],
-                        "순위": comp["rank"],
-                        "상품명": comp["title"],
-                        "가격": comp["price"],
-                        "is_target": False
-                    })
-                
-                results.sort(key=lambda x: x["순위"])
-                
-                # 결과 표시
-                st.success(f"✅ 분석 완료! 타겟: {target_product['mallName']} ({target_product['rank']}위)")
-                
-                df = pd.DataFrame(results)
-                df_display = df[["판매처", "순위", "상품명", "가격"]].copy()
-                df_display["가격"] = df_display["가격"].apply(lambda x: f"{x:,}원" if x > 0 else "-")
-                
-                # 타겟 상품 강조
-                st.dataframe(df_display, use_container_width=True)
-                
-                # 통계
-                avg_price = sum(r["가격"] for r in results if r["가격"] > 0) / len([r for r in results if r["가격"] > 0]) if results else 0
-                target_price = target_product["price"]
-                price_diff = avg_price - target_price if avg_price > 0 else 0
-                
-                col1, col2, col3 = st.columns(3)
-                with col1:
-                    st.metric("타겟 순위", f"{target_product['rank']}위")
-                with col2:
-                    st.metric("경쟁사 수", f"{len(competitors)}개")
-                with col3:
-                    st.metric("평균 가격", f"{avg_price:,.0f}원", f"{price_diff:+,.0f}원")
+            
+            results.sort(key=lambda x: x["순위"])
+            
+            # 결과 표시
+            st.success(f"✅ 분석 완료! 타겟: {target_product['mallName']} ({target_product['rank']}위)")
+            
+            df = pd.DataFrame(results)
+            df_display = df[["판매처", "순위", "상품명", "가격"]].copy()
+            df_display["가격"] = df_display["가격"].apply(lambda x: f"{x:,}원" if x > 0 else "-")
+            
+            # 타겟 상품 강조
+            st.dataframe(df_display, use_container_width=True)
+            
+            # 통계
+            avg_price = sum(r["가격"] for r in results if r["가격"] > 0) / len([r for r in results if r["가격"] > 0]) if results else 0
+            target_price = target_product["price"]
+            price_diff = avg_price - target_price if avg_price > 0 else 0
+            
+            col1, col2, col3 = st.columns(3)
+            with col1:
+                st.metric("타겟 순위", f"{target_product['rank']}위")
+            with col2:
+                st.metric("경쟁사 수", f"{len(competitors)}개")
+            with col3:
+                st.metric("평균 가격", f"{avg_price:,.0f}원", f"{price_diff:+,.0f}원")
 
 # 탭 5: 도움말
 with tab5:
@@ -701,11 +764,12 @@ with tab5:
        - API 키는 `api_config.json` 파일에 저장됩니다.
     
     2. **메인 탭**
-       - 검색어(최대 10개)와 판매처명을 입력하여 순위를 확인합니다.
+       - 검색어(개수 제한 없음)와 판매처명을 입력하여 순위를 확인합니다.
+       - 중간에 끊긴 확인은 같은 검색어로 다시 실행하면 이어서 진행됩니다.
        - 결과를 엑셀로 다운로드할 수 있습니다.
     
     3. **상품 리스트 탭**
-       - 검색어로 1~100위 상품 리스트를 추출합니다.
+       - 검색어로 1위부터 최대 1000위까지의 상품 리스트를 추출합니다.
        - 결과를 엑셀로 다운로드할 수 있습니다.
     
     4. **순위 추적 탭**
@@ -0,0 +1,110 @@
+"""
+모듈별 import 시간 측정 (프로그램 시작 속도 확인용)
+
+모듈마다 새 파이썬 프로세스에서 `python -X importtime`으로 불러와
+이미 불러온 모듈의 영향 없이 처음 불러올 때(cold start) 걸리는 시간을 잽니다.
+
+    python bench_import_time.py              # 주요 모듈별 시간
+    python bench_import_time.py --app        # 데스크톱 앱 파일을 불러올 때 무거운 import 순위 포함
+    python bench_import_time.py -r 5 pandas  # 지정한 모듈만 5번 재서 중앙값
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+APP_FILE = "main_rankCheckerV4.0611.py"
+
+DEFAULT_MODULES = [
+    "PySide6.QtWidgets",
+    "requests",
+    "pandas",
+    "matplotlib.pyplot",
+    "matplotlib.backends.backend_qt5agg",
+    "naver_rank.naver_client",
+    "naver_rank.rank_scanner",
+    "naver_rank.batch_engine",
+    "naver_rank.tracking_store",
+]
+
+# 앱 파일 이름에 점이 있어 import 문 대신 파일 경로로 불러옴
+APP_IMPORT_CODE = (
+    "import importlib.util as u;"
+    f"s = u.spec_from_file_location('rank_checker_app', {APP_FILE!r});"
+    "s.loader.exec_module(u.module_from_spec(s))"
+)
+
+
+def run_importtime(code):
+    """code를 새 프로세스에서 실행하고 [(자체 µs, 누적 µs, 깊이, 모듈명)] 반환"""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True, text=True, cwd=os.path.dirname(os.path.abspath(__file__)),
+    )
+    if proc.returncode != 0:
+        last_line = proc.stderr.strip().splitlines()[-1] if proc.stderr.strip() else "알 수 없는 오류"
+        raise RuntimeError(last_line)
+
+    entries = []
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|", 2)
+        depth = (len(name) - len(name.lstrip())) // 2
+        entries.append((int(self_us), int(cumulative_us), depth, name.strip()))
+    return entries
+
+
+def startup_modules():
+    """인터프리터 시작만으로 불러오는 모듈 (encodings, site 등) - 측정에서 제외"""
+    return {name for _, _, _, name in run_importtime("pass")}
+
+
+def top_level_ms(entries, exclude=()):
+    """최상위 import들의 누적 시간 합계 (ms)"""
+    base = min((depth for _, _, depth, _ in entries), default=0)
+    return sum(
+        cumulative for _, cumulative, depth, name in entries
+        if depth == base and name not in exclude
+    ) / 1000
+
+
+def measure(code, repeat, exclude=()):
+    """repeat번 측정한 중앙값 (ms)"""
+    return statistics.median(top_level_ms(run_importtime(code), exclude) for _ in range(repeat))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="모듈별 import 시간 측정")
+    parser.add_argument("modules", nargs="*", help="측정할 모듈 (기본: 주요 모듈)")
+    parser.add_argument("-r", "--repeat", type=int, default=3, help="측정 반복 횟수 (중앙값 사용)")
+    parser.add_argument("--app", action="store_true", help=f"{APP_FILE} 전체를 불러오는 시간도 측정")
+    parser.add_argument("--top", type=int, default=15, help="--app 사용 시 표시할 무거운 import 수")
+    args = parser.parse_args()
+
+    exclude = startup_modules()
+    print(f"{'모듈':<40} {'시간(ms)':>10}")
+    print("-" * 51)
+    for module in args.modules or DEFAULT_MODULES:
+        try:
+            print(f"{module:<40} {measure(f'import {module}', args.repeat, exclude):>10.1f}")
+        except RuntimeError as e:
+            print(f"{module:<40} {'실패':>10}  ({e})")
+
+    if args.app:
+        try:
+            entries = run_importtime(APP_IMPORT_CODE)
+        except RuntimeError as e:
+            print(f"\n⚠️ {APP_FILE} 불러오기 실패: {e}")
+            return
+        print(f"\n{APP_FILE} 시작 시 import 합계: {top_level_ms(entries, exclude):.1f} ms")
+        print(f"\n자체 시간이 긴 import 상위 {args.top}개:")
+        entries = [entry for entry in entries if entry[3] not in exclude]
+        for self_us, cumulative_us, _, name in sorted(entries, reverse=True)[:args.top]:
+            print(f"  {name:<50} 자체 {self_us / 1000:>8.1f} ms  누적 {cumulative_us / 1000:>8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""
+검색 결과 item 정리 속도 측정
+
+item마다 re.sub(r"<.*?>", ...)와 카테고리 join을 따로 하던 기존 방식과
+naver_rank.items.normalize_page로 페이지를 한 번에 정리하는 방식을 비교합니다.
+네트워크 없이 만든 가짜 item으로 측정합니다.
+
+    python bench_normalize.py              # 1000개 item (검색어 하나 전체 스캔 분량)
+    python bench_normalize.py -n 100 -r 20
+"""
+
+import argparse
+import random
+import re
+import statistics
+import time
+
+from naver_rank.items import normalize_page
+from naver_rank.naver_client import PAGE_SIZE
+
+
+def make_items(count, seed=0):
+    """API 응답과 같은 모양의 가짜 item 목록 (상품명 절반 정도에 <b> 태그 포함)"""
+    rng = random.Random(seed)
+    words = ["무선", "키보드", "마우스", "게이밍", "블루투스", "기계식", "저소음", "USB", "C타입", "세트"]
+    items = []
+    for i in range(count):
+        name = " ".join(rng.sample(words, 4))
+        if rng.random() < 0.5:
+            name = name.replace("키보드", "<b>키보드</b>")
+        items.append({
+            "title": f"{name} {i}",
+            "link": f"https://search.shopping.naver.com/gate.nhn?id={i}",
+            "image": f"https://shopping-phinf.pstatic.net/{i}.jpg",
+            "lprice": str(rng.randint(1000, 300000)),
+            "hprice": "",
+            "mallName": rng.choice(["네이버", "OO스토어", "XX몰", "스마트샵"]),
+            "productId": str(80000000000 + i),
+            "productType": "2",
+            "brand": rng.choice(["", "로지텍", "앱코"]),
+            "maker": rng.choice(["", "로지텍", "앱코"]),
+            "category1": "디지털/가전",
+            "category2": "PC주변기기",
+            "category3": rng.choice(["키보드", "마우스", ""]),
+            "category4": "",
+        })
+    return items
+
+
+def legacy_normalize(start, items):
+    """기존 방식: item마다 컴파일하지 않은 정규식과 filter로 정리"""
+    products = []
+    for idx, item in enumerate(items, start=start):
+        cat1 = item.get("category1", "")
+        cat2 = item.get("category2", "")
+        cat3 = item.get("category3", "")
+        category = " > ".join(filter(None, [cat1, cat2, cat3]))
+        products.append({
+            "rank": idx,
+            "title": re.sub(r"<.*?>", "", item.get("title", "")),
+            "price": int(item.get("lprice", 0)),
+            "link": item.get("link", ""),
+            "mallName": item.get("mallName", ""),
+            "brand": item.get("brand", ""),
+            "category": category,
+        })
+    return products
+
+
+def run_pages(normalize, items):
+    for offset in range(0, len(items), PAGE_SIZE):
+        normalize(offset + 1, items[offset:offset + PAGE_SIZE])
+
+
+def measure(normalize, items, repeat):
+    """repeat번 측정한 중앙값 (ms)"""
+    times = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        run_pages(normalize, items)
+        times.append((time.perf_counter() - started) * 1000)
+    return statistics.median(times)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="검색 결과 item 정리 속도 비교")
+    parser.add_argument("-n", "--items", type=int, default=1000, help="item 수 (기본: 1000)")
+    parser.add_argument("-r", "--repeat", type=int, default=50, help="측정 반복 횟수 (중앙값 사용)")
+    args = parser.parse_args()
+
+    items = make_items(args.items)
+    # 두 방식의 결과가 같은지 먼저 확인
+    for old, new in zip(legacy_normalize(1, items), normalize_page(1, items)):
+        assert (old["rank"], old["title"], old["price"], old["category"]) == \
+            (new.rank, new.title, new.price, new.category), (old, new)
+
+    legacy_ms = measure(legacy_normalize, items, args.repeat)
+    batch_ms = measure(normalize_page, items, args.repeat)
+    print(f"item {args.items}개, {args.repeat}회 중앙값")
+    print(f"  기존 (item별 re.sub):   {legacy_ms:8.3f} ms")
+    print(f"  normalize_page:         {batch_ms:8.3f} ms  ({legacy_ms / batch_ms:.1f}배)")
+
+
+if __name__ == "__main__":
+    main()
@@ -5,29 +5,49 @@
 import sys
 import os
 import json
-import urllib.request
-import urllib.parse
-import urllib.error
 import re
+import tempfile
+import threading
 from datetime import datetime
-import pandas as pd
+import requests
 from PySide6.QtWidgets import (
     QApplication, QWidget, QVBoxLayout, QHBoxLayout, QLabel,
-    QLineEdit, QPushButton, QTextBrowser, QTextEdit,
+    QLineEdit, QPushButton, QTextEdit,
     QMessageBox, QSpacerItem, QSizePolicy, QProgressBar,
-    QTabWidget, QGroupBox, QTableWidget, QTableWidgetItem, QHeaderView,
+    QTabWidget, QGroupBox, QTableView, QHeaderView,
     QFileDialog, QComboBox, QCheckBox, QSpinBox
 )
-from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
-from matplotlib.figure import Figure
-import matplotlib.font_manager as fm
-import matplotlib.pyplot as plt
+from PySide6.QtCore import Qt, QThread, Signal, Slot, QTimer, QObject, QAbstractTableModel, QModelIndex, QUrl
+from PySide6.QtGui import QFont, QKeyEvent, QIcon, QColor, QDesktopServices
 
-# 한글 폰트 설정
-plt.rcParams['font.family'] = 'Malgun Gothic'  # Windows 기본 한글 폰트
-plt.rcParams['axes.unicode_minus'] = False  # 마이너스 기호 깨짐 방지
-from PySide6.QtCore import Qt, QThread, Signal, QTimer
-from PySide6.QtGui import QFont, QKeyEvent, QIcon, QColor
+from naver_rank.naver_client import get_client, DEFAULT_MAX_CONCURRENCY, PAGE_SIZE, MAX_RANK
+from naver_rank.page_cache import DEFAULT_TTL, DEFAULT_DISK_PATH
+from naver_rank.rank_scanner import RankTarget, analyze_competitors, iter_product_list, scan_ranks
+from naver_rank.batch_engine import BatchRankChecker, parse_keywords
+from naver_rank.key_pool import get_key_pool, parse_credentials, LEAST_USED, ROUND_ROBIN
+from naver_rank.credential_check import get_verifier, DEFAULT_VALIDITY
+from naver_rank.cancellation import CancelToken, CancelledError
+from naver_rank.product_export import ProductListWriter, copy_product_list
+from naver_rank.rank_series import RankSeries, parse_time
+from naver_rank.tracking_daemon import group_targets
+from naver_rank.tracking_store import get_tracking_store, set_tracking_backend, get_tracking_backend, SQLITE_BACKEND
+
+# pandas/matplotlib는 불러오는 데 오래 걸려 창이 늦게 뜨므로
+# 엑셀 저장이나 순위 추이 그래프를 처음 사용할 때 불러옵니다.
+_matplotlib = None
+
+def load_matplotlib():
+    """(Figure, FigureCanvas) 클래스 반환, 처음 호출할 때 matplotlib을 불러옴"""
+    global _matplotlib
+    if _matplotlib is None:
+        import matplotlib
+        from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
+        from matplotlib.figure import Figure
+        # 한글 폰트 설정
+        matplotlib.rcParams['font.family'] = 'Malgun Gothic'  # Windows 기본 한글 폰트
+        matplotlib.rcParams['axes.unicode_minus'] = False  # 마이너스 기호 깨짐 방지
+        _matplotlib = (Figure, FigureCanvas)
+    return _matplotlib
 
 # API 키 설정 (기본값 - 사용자가 직접 입력)
 client_id = ""
@@ -35,14 +55,25 @@ client_secret = ""
 CUSTOMER_ID = ""
 ACCESS_LICENSE = ""
 SECRET_KEY = ""
+# 추가 네이버 API 키 [(client_id, client_secret), ...] - 여러 키에 요청을 분산
+EXTRA_CREDENTIALS = []
+KEY_STRATEGY = LEAST_USED
 
 # API 키 저장 파일
 API_CONFIG_FILE = "api_config.json"
-RANK_TRACKING_FILE = "rank_tracking.json"
+
+FRAME_INTERVAL_MS = 33  # Worker 결과/진행률을 화면에 반영하는 최소 간격 (약 30fps)
+
+TARGET_COLOR = QColor(0, 100, 0)  # 진한 녹색
+NOT_FOUND_COLOR = QColor(255, 0, 0)
+LINK_COLOR = QColor(0, 0, 255)
+FAILED_COLOR = QColor(230, 81, 0)
+RANK_COLORS = (QColor(0, 128, 0), QColor(184, 134, 11), QColor(255, 140, 0))  # darkGreen, darkYellow, orange
 
 def load_api_config():
     """저장된 API 설정 불러오기"""
     global client_id, client_secret, CUSTOMER_ID, ACCESS_LICENSE, SECRET_KEY
+    global EXTRA_CREDENTIALS, KEY_STRATEGY
     if os.path.exists(API_CONFIG_FILE):
         try:
             with open(API_CONFIG_FILE, "r", encoding="utf-8") as f:
@@ -52,6 +83,19 @@ def load_api_config():
                 CUSTOMER_ID = config.get("customer_id", "")
                 ACCESS_LICENSE = config.get("access_license", "")
                 SECRET_KEY = config.get("secret_key", "")
+                EXTRA_CREDENTIALS = [
+                    (c["client_id"], c["client_secret"]) for c in config.get("extra_credentials", [])
+                ]
+                KEY_STRATEGY = config.get("key_strategy", LEAST_USED)
+                # 동시 페이지 요청 수 (네이버 초당 호출 한도에 맞게 조정)
+                get_client().max_concurrency = int(config.get("max_concurrency", DEFAULT_MAX_CONCURRENCY))
+                # 검색 결과 페이지 캐시 (유효 시간, 디스크 저장 여부)
+                get_client().cache.ttl = int(config.get("cache_ttl", DEFAULT_TTL))
+                get_client().cache.set_disk_path(DEFAULT_DISK_PATH if config.get("cache_on_disk") else None)
+                # 순위 추적 저장 방식 ("sqlite" 또는 JSONL 저널 "journal")
+                set_tracking_backend(config.get("tracking_backend", SQLITE_BACKEND))
+                # 인증 확인 결과를 다시 쓰는 시간 (초)
+                get_verifier().validity = int(config.get("verify_ttl", DEFAULT_VALIDITY))
         except Exception as e:
             print(f"⚠️ API 설정 로드 실패: {e}")
 
@@ -62,7 +106,16 @@ def save_api_config():
         "client_secret": client_secret,
         "customer_id": CUSTOMER_ID,
         "access_license": ACCESS_LICENSE,
-        "secret_key": SECRET_KEY
+        "secret_key": SECRET_KEY,
+        "extra_credentials": [
+            {"client_id": cid, "client_secret": secret} for cid, secret in EXTRA_CREDENTIALS
+        ],
+        "key_strategy": KEY_STRATEGY,
+        "max_concurrency": get_client().max_concurrency,
+        "cache_ttl": get_client().cache.ttl,
+        "cache_on_disk": get_client().cache.disk_path is not None,
+        "tracking_backend": get_tracking_backend(),
+        "verify_ttl": get_verifier().validity
     }
     try:
         with open(API_CONFIG_FILE, "w", encoding="utf-8") as f:
@@ -72,27 +125,15 @@ def save_api_config():
         print(f"⚠️ API 설정 저장 실패: {e}")
         return False
 
-def verify_naver_api(client_id_val, client_secret_val):
-    """네이버 API 인증 확인"""
-    try:
-        # 간단한 검색 요청으로 인증 확인 (한글 쿼리는 URL 인코딩 필요)
-        test_query = urllib.parse.quote("테스트")
-        test_url = f"https://openapi.naver.com/v1/search/shop.json?query={test_query}&display=1&start=1"
-        request = urllib.request.Request(test_url)
-        request.add_header("X-Naver-Client-Id", client_id_val)
-        request.add_header("X-Naver-Client-Secret", client_secret_val)
-        response = urllib.request.urlopen(request, timeout=5)
-        result = json.loads(response.read())
-        # 응답에 items가 있으면 인증 성공
-        return "items" in result and len(result.get("items", [])) > 0
-    except urllib.error.HTTPError as e:
-        if e.code == 401:
-            return False  # 인증 실패
-        print(f"⚠️ HTTP 오류: {e.code} - {e.reason}")
-        return False
-    except Exception as e:
-        print(f"⚠️ API 인증 확인 중 오류: {e}")
-        return False
+def get_credentials():
+    """검색에 사용할 인증 정보 (추가 키가 있으면 키 풀)"""
+    if EXTRA_CREDENTIALS:
+        return get_key_pool(
+            [(client_id, client_secret)] + EXTRA_CREDENTIALS,
+            strategy=KEY_STRATEGY,
+            quota=get_client().quota,
+        )
+    return (client_id, client_secret)
 
 # 프로그램 시작 시 저장된 설정 불러오기
 load_api_config()
@@ -104,347 +145,675 @@ class CustomTextEdit(QTextEdit):
         else:
             super().keyPressEvent(event)
 
+def rank_result_row(keyword, result, error=None):
+    """순위 확인 결과 하나를 결과 표 행으로 변환
+    
+    (검색어, 순위, 상품명, 판매처, 브랜드, 상품타입, 가격, 링크, 조회 실패 여부)이며,
+    찾지 못했거나 조회에 실패하면 순위는 0이고 상품명 자리에 사유가 들어갑니다.
+    """
+    if result:
+        return (keyword, result["rank"], result["title"], result.get("mallName") or "", result.get("brand") or "",
+                result.get("category") or "", int(result["price"] or 0), result["link"], False)
+    if error is not None:
+        return (keyword, 0, f"조회 실패: {error}", "", "", "", 0, "", True)
+    return (keyword, 0, "검색 결과 없음", "", "", "", 0, "", False)
+
 class Worker(QThread):
-    result_ready = Signal(str)
-    progress_update = Signal(int, str)
+    """메인 탭 순위 확인 Worker
+    
+    검색어마다 시그널을 보내지 않고 결과 행과 진행률을 updates(UpdateBatcher)에 넣으면,
+    화면은 프레임마다 모인 결과를 한 번에 표에 추가합니다.
+    """
     finished_all = Signal(dict)
 
-    def __init__(self, keywords, mall_name):
+    def __init__(self, keywords, mall_name, updates, resume=True):
         super().__init__()
         self.keywords = keywords
         self.mall_name = mall_name
+        self.updates = updates
         self.all_results = {}
+        # 검색어 수 제한 없이 Worker 풀로 나눠 확인
+        # (resume이면 중단 시 체크포인트에서 이어서 확인, 아니면 처음부터 확인)
+        self.batch = BatchRankChecker(keywords, mall_name, get_credentials(), resume=resume)
 
-    def get_top_ranked_product_by_mall(self, keyword, mall_name):
-        encText = urllib.parse.quote(keyword)
-        seen_titles = set()
-        best_product = None
-        try:
-            for start in range(1, 1001, 100):
-                url = f"https://openapi.naver.com/v1/search/shop.json?query={encText}&display=100&start={start}"
-                request = urllib.request.Request(url)
-                request.add_header("X-Naver-Client-Id", client_id)
-                request.add_header("X-Naver-Client-Secret", client_secret)
-                try:
-                    response = urllib.request.urlopen(request, timeout=10)
-                    result = json.loads(response.read())
-                    items = result.get("items", [])
-                    if not items:
-                        break  # 더 이상 결과가 없으면 중단
-                    for idx, item in enumerate(items, start=1):
-                        if item.get("mallName") and mall_name in item["mallName"]:
-                            title_clean = re.sub(r"<.*?>", "", item.get("title", ""))
-                            if title_clean in seen_titles:
-                                continue
-                            seen_titles.add(title_clean)
-                            rank = start + idx - 1
-                            # 카테고리 정보 수집
-                            cat1 = item.get("category1", "")
-                            cat2 = item.get("category2", "")
-                            cat3 = item.get("category3", "")
-                            category = " > ".join(filter(None, [cat1, cat2, cat3]))
-                            
-                            product = {
-                                "rank": rank,
-                                "title": title_clean,
-                                "price": item.get("lprice", "0"),
-                                "link": item.get("link", ""),
-                                "mallName": item.get("mallName", ""),
-                                "brand": item.get("brand", ""),
-                                "category": category
-                            }
-                            if not best_product or rank < best_product["rank"]:
-                                best_product = product
-                except (urllib.error.URLError, urllib.error.HTTPError, TimeoutError) as e:
-                    print(f"⚠️ 네이버 API 호출 실패 (start={start}): {e}")
-                    break
-        except Exception as e:
-            print(f"⚠️ 검색 중 오류 발생: {e}")
-        return best_product
+    def cancel(self):
+        """남은 검색어 확인 중단 (이미 확인한 결과는 finished_all로 전달)"""
+        self.batch.cancel()
+
+    @property
+    def cancelled(self):
+        return self.batch.cancelled
 
     def run(self):
-        total = len(self.keywords)
-        for i, keyword in enumerate(self.keywords):
-            result = self.get_top_ranked_product_by_mall(keyword, self.mall_name)
+        total = len(self.batch.keywords)
+        for i, (keyword, result) in enumerate(self.batch.iter_results(), start=1):
             if result:
-                link_html = f'<a href="{result["link"]}" style="color:blue;">{result["link"]}</a>'
-                brand_text = result.get("brand", "") if result.get("brand") else "-"
-                category_text = result.get("category", "") if result.get("category") else "-"
-                html = (
-                    f"<b>✅ {keyword}</b><br>"
-                    f" - 순위: {result['rank']}위<br>"
-                    f" - 상품명: {result['title']}<br>"
-                    f" - 판매처: {result.get('mallName', '-')}<br>"
-                    f" - 브랜드: {brand_text}<br>"
-                    f" - 상품타입: {category_text}<br>"
-                    f" - 가격: {int(result['price']):,}원<br>"
-                    f" - 링크: {link_html}<br><br>"
-                )
                 self.all_results[keyword] = result
+                row = rank_result_row(keyword, result)
+            elif keyword in self.batch.errors:
+                # API 호출 실패는 '검색 결과 없음'과 구분해서 표시
+                self.all_results[keyword] = "조회 실패"
+                row = rank_result_row(keyword, None, self.batch.errors[keyword])
             else:
-                html = f"<b style='color:red;'>❌ {keyword} → 검색 결과 없음</b><br><br>"
                 self.all_results[keyword] = "검색 결과 없음"
-            percent = int(((i+1)/total)*100)
-            self.result_ready.emit(html)
-            self.progress_update.emit(percent, keyword)
-        self.finished_all.emit(self.all_results)
+                row = rank_result_row(keyword, None)
+            self.updates.add_rows(self, [row])
+            self.updates.set_progress(self, int((i / total) * 100), keyword)
+        # 결과는 끝난 순서대로 오므로 엑셀 저장용으로 입력 순서로 정렬
+        ordered = {k: self.all_results[k] for k in self.batch.keywords if k in self.all_results}
+        self.finished_all.emit(ordered)
+
+class TrackingWorker(QThread):
+    """추적 대상 순위 확인 Worker (검색어별로 한 번씩 스캔해 추적 저장소에 기록)
+    
+    진행률은 updates(UpdateBatcher)에 넣어 프레임마다 마지막 값만 화면에 반영합니다.
+    """
+    finished_all = Signal(list, dict)  # 기록한 (검색어, 판매처, 상품명, 상품 정보) 목록, {검색어: 오류}
+
+    def __init__(self, entries, updates):
+        super().__init__()
+        self.updates = updates
+        self.groups = group_targets(entries)
+        self.records = []
+        self.errors = {}
+        self.cancel_token = CancelToken()
+
+    def cancel(self):
+        self.cancel_token.cancel()
+
+    @property
+    def cancelled(self):
+        return self.cancel_token.cancelled
+
+    def run(self):
+        now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        total = len(self.groups)
+        for i, (keyword, entries) in enumerate(self.groups.items()):
+            if self.cancelled:
+                break
+            self.updates.set_progress(self, int(i / total * 100), keyword)
+            try:
+                # 취소되어도 그때까지 찾은 대상의 순위는 정확하므로 기록
+                products = get_product_ranks(
+                    keyword, [target for _, target in entries], cancel=self.cancel_token,
+                    on_page=lambda start, _, i=i: self.updates.set_progress(
+                        self, int((i + min(start + PAGE_SIZE - 1, MAX_RANK) / MAX_RANK) / total * 100), keyword
+                    )
+                )
+            except Exception as e:
+                print(f"⚠️ 순위 조회 실패 ({keyword}): {e}")
+                self.errors[keyword] = str(e)
+                continue
+            for entry, target in entries:
+                product = products.get(target)
+                if product:
+                    self.records.append((entry["keyword"], entry["mall_name"], entry["product_name"], product))
+        try:
+            get_tracking_store().record_many(self.records, checked_at=now)
+        except Exception as e:
+            print(f"⚠️ 추적 데이터 저장 실패: {e}")
+        self.updates.set_progress(self, 100, "")
+        self.finished_all.emit(self.records, self.errors)
+
+class CompetitorWorker(QThread):
+    """경쟁사 분석 Worker (진행률은 updates(UpdateBatcher)로 전달)"""
+    finished_result = Signal(str, str, object, list)  # 검색어, 판매처, 타겟 상품(없으면 None), 경쟁사 목록
+    error_occurred = Signal(str, str)  # 검색어, 오류 메시지
+
+    def __init__(self, keyword, mall_name, updates, competitor_count=10):
+        super().__init__()
+        self.updates = updates
+        self.keyword = keyword
+        self.mall_name = mall_name
+        self.competitor_count = competitor_count
+        self.cancel_token = CancelToken()
+
+    def cancel(self):
+        self.cancel_token.cancel()
+
+    @property
+    def cancelled(self):
+        return self.cancel_token.cancelled
+
+    def run(self):
+        try:
+            target_product, competitors = get_competitor_products(
+                self.keyword, self.mall_name, competitor_count=self.competitor_count,
+                cancel=self.cancel_token,
+                on_page=lambda start, _: self.updates.set_progress(
+                    self, int(min(start + PAGE_SIZE - 1, MAX_RANK) / MAX_RANK * 100), f"{start}위~ 확인 중..."
+                )
+            )
+        except Exception as e:
+            self.error_occurred.emit(self.keyword, str(e))
+            return
+        # 중간에 취소된 스캔은 경쟁사 목록이 불완전하므로 결과를 내보내지 않음
+        if not self.cancelled:
+            self.finished_result.emit(self.keyword, self.mall_name, target_product, competitors)
+
+class VerifyWorker(QThread):
+    """API 키 인증 확인 Worker (force=False면 캐시된 결과가 없을 때만 요청)"""
+    verified = Signal(bool)
+
+    def __init__(self, credentials, force=False):
+        super().__init__()
+        self.credentials = credentials
+        self.force = force
+
+    def run(self):
+        self.verified.emit(get_verifier().verify(self.credentials, force=self.force))
 
 class ProductListWorker(QThread):
-    """1~100위 상품 리스트 수집 Worker"""
-    progress_update = Signal(int, str)
-    finished = Signal(list)
+    """상품 리스트 수집 Worker (1위~max_rank위, 최대 1000위)
+    
+    페이지를 동시에 받아 오며, 받은 페이지의 상품을 바로 updates(UpdateBatcher)에 넣고 임시 CSV(spool_path)에도
+    기록합니다. 엑셀 저장은 이 파일을 옮기므로 상품 목록 전체를 메모리에 따로 모아 두지 않습니다.
+    """
+    finished_products = Signal(int)  # 수집한 상품 수 (QThread.finished를 가리지 않도록 다른 이름 사용)
     error_occurred = Signal(str)
 
-    def __init__(self, keyword):
+    def __init__(self, keyword, updates, max_rank=PAGE_SIZE):
         super().__init__()
         self.keyword = keyword
-        self.products = []
+        self.updates = updates
+        self.max_rank = max_rank
+        self.count = 0
+        self.cancel_token = CancelToken()
+        fd, self.spool_path = tempfile.mkstemp(prefix="product_list_", suffix=".csv")
+        os.close(fd)
+
+    def cancel(self):
+        self.cancel_token.cancel()
+
+    @property
+    def cancelled(self):
+        return self.cancel_token.cancelled
 
     def run(self):
         try:
-            encText = urllib.parse.quote(self.keyword)
-            seen_titles = set()
-            
-            # 1~100위까지 수집 (display=100, start=1)
-            url = f"https://openapi.naver.com/v1/search/shop.json?query={encText}&display=100&start=1"
-            request = urllib.request.Request(url)
-            request.add_header("X-Naver-Client-Id", client_id)
-            request.add_header("X-Naver-Client-Secret", client_secret)
-            
-            response = urllib.request.urlopen(request, timeout=10)
-            result = json.loads(response.read())
-            items = result.get("items", [])
-            
-            for idx, item in enumerate(items, start=1):
-                if idx > 100:
-                    break
-                
-                title_clean = re.sub(r"<.*?>", "", item.get("title", ""))
-                if title_clean in seen_titles:
-                    continue
-                seen_titles.add(title_clean)
-                
-                # 카테고리 정리
-                cat1 = item.get("category1", "")
-                cat2 = item.get("category2", "")
-                cat3 = item.get("category3", "")
-                category = " > ".join(filter(None, [cat1, cat2, cat3]))
-                
-                product = {
-                    "순위": idx,
-                    "상품명": title_clean,
-                    "가격": int(item.get("lprice", 0)),
-                    "카테고리": category,
-                    "판매처": item.get("mallName", ""),
-                    "브랜드": item.get("brand", ""),
-                    "제조사": item.get("maker", ""),
-                    "상품링크": item.get("link", ""),
-                    "이미지": item.get("image", "")
-                }
-                self.products.append(product)
-                
-                # 진행률 업데이트
-                percent = int((idx / 100) * 100)
-                self.progress_update.emit(percent, f"{idx}위 수집 중...")
-            
-            self.finished.emit(self.products)
+            with ProductListWriter(self.spool_path, "csv") as writer:
+                try:
+                    for start, products in iter_product_list(
+                        self.keyword, get_credentials(), max_rank=self.max_rank, cancel=self.cancel_token
+                    ):
+                        writer.write_page(products)
+                        self.count += len(products)
+                        self.updates.add_rows(self, products)
+                        
+                        # 진행률은 받은 페이지 기준
+                        last_rank = min(start + PAGE_SIZE - 1, self.max_rank)
+                        self.updates.set_progress(
+                            self, int(last_rank / self.max_rank * 100), f"{last_rank}위까지 수집 ({self.count}개)"
+                        )
+                except CancelledError:
+                    pass  # 그때까지 받은 상품은 그대로 사용
+            self.finished_products.emit(self.count)
             
-        except urllib.error.HTTPError as e:
-            self.error_occurred.emit(f"HTTP 오류: {e.code} - {e.reason}")
+        except requests.HTTPError as e:
+            self.error_occurred.emit(f"HTTP 오류: {e.response.status_code} - {e.response.reason}")
         except Exception as e:
             self.error_occurred.emit(f"오류 발생: {str(e)}")
 
-def save_to_excel(products, keyword, save_path=None):
-    """상품 리스트를 엑셀 파일로 저장 (순위, 상품명, 판매처, 브랜드, 상품타입, 가격, 카테고리, 링크 순서)"""
+def remove_file(path):
+    """임시 파일 삭제 (없으면 무시)"""
     try:
-        if not products:
-            return False, "저장할 상품이 없습니다."
-        
-        # 순위, 상품명, 판매처, 브랜드, 상품타입, 가격, 링크 순서로 데이터 정리
-        excel_data = []
-        for product in products:
-            excel_data.append({
-                "순위": product.get("순위", ""),
-                "상품명": product.get("상품명", ""),
-                "판매처": product.get("판매처", ""),
-                "브랜드": product.get("브랜드", "") if product.get("브랜드") else "",
-                "상품타입": product.get("카테고리", ""),
-                "가격": product.get("가격", 0),
-                "링크": product.get("상품링크", "")
-            })
-        
-        # DataFrame 생성
-        df = pd.DataFrame(excel_data)
-        
-        if save_path:
-            filename = save_path
-        else:
-            # 파일명 생성 (검색어_날짜시간.xlsx)
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            safe_keyword = re.sub(r'[<>:"/\\|?*]', '_', keyword)  # 파일명에 사용할 수 없는 문자 제거
-            filename = f"상품리스트_{safe_keyword}_{timestamp}.xlsx"
-        
-        # 엑셀 파일로 저장
-        df.to_excel(filename, index=False, engine='openpyxl')
-        
-        return True, filename
-    except Exception as e:
-        return False, f"엑셀 저장 실패: {str(e)}"
+        if path and os.path.exists(path):
+            os.remove(path)
+    except OSError as e:
+        print(f"⚠️ 임시 파일 삭제 실패: {e}")
 
-def load_tracking_data():
-    """순위 추적 데이터 불러오기"""
-    if os.path.exists(RANK_TRACKING_FILE):
-        try:
-            with open(RANK_TRACKING_FILE, "r", encoding="utf-8") as f:
-                return json.load(f)
-        except Exception as e:
-            print(f"⚠️ 추적 데이터 로드 실패: {e}")
-    return {}
 
-def save_tracking_data(data):
-    """순위 추적 데이터 저장"""
-    try:
-        with open(RANK_TRACKING_FILE, "w", encoding="utf-8") as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
-        return True
-    except Exception as e:
-        print(f"⚠️ 추적 데이터 저장 실패: {e}")
-        return False
+def make_rank_product(product):
+    """Product를 순위 조회용 상품 정보로 변환"""
+    return {
+        "rank": product.rank,
+        "title": product.title,
+        "price": product.price,
+        "link": product.link,
+        "mallName": product.mall_name
+    }
+
+def get_product_ranks(keyword, targets, cancel=None, on_page=None):
+    """검색어 한 번의 스캔으로 여러 판매처/상품의 순위 조회 (추적 기록용)
+    
+    targets는 RankTarget 목록이며, 찾은 대상만 {RankTarget: 상품 정보}로 반환합니다.
+    결과를 지금 시각으로 추적 기록에 남기므로 페이지 캐시를 거치지 않고 항상 새로 조회합니다.
+    API 호출 실패(429 재시도 초과, 일일 한도 소진 등)는 예외로 전달됩니다.
+    """
+    best, _ = scan_ranks(keyword, get_credentials(), targets, cancel=cancel, on_page=on_page, use_cache=False)
+    return {target: make_rank_product(product) for target, product in best.items()}
 
 def get_product_rank(keyword, mall_name, product_name=None):
     """특정 상품의 순위 조회"""
-    encText = urllib.parse.quote(keyword)
-    seen_titles = set()
-    best_product = None
+    target = RankTarget(mall_name, product_name)
+    return get_product_ranks(keyword, [target]).get(target)
+
+def get_competitor_products(keyword, target_mall_name, competitor_count=10, cancel=None, on_page=None):
+    """입력한 판매처 상품 주변의 경쟁사 상품들 조회
     
-    try:
-        for start in range(1, 1001, 100):
-            url = f"https://openapi.naver.com/v1/search/shop.json?query={encText}&display=100&start={start}"
-            request = urllib.request.Request(url)
-            request.add_header("X-Naver-Client-Id", client_id)
-            request.add_header("X-Naver-Client-Secret", client_secret)
-            
-            response = urllib.request.urlopen(request, timeout=10)
-            result = json.loads(response.read())
-            items = result.get("items", [])
-            
-            if not items:
-                break
-                
-            for idx, item in enumerate(items, start=1):
-                if item.get("mallName") and mall_name in item["mallName"]:
-                    title_clean = re.sub(r"<.*?>", "", item.get("title", ""))
-                    
-                    # 상품명이 지정된 경우 정확히 일치하는지 확인
-                    if product_name and product_name.strip():
-                        if product_name.strip() not in title_clean:
-                            continue
-                    
-                    if title_clean in seen_titles:
-                        continue
-                    seen_titles.add(title_clean)
-                    
-                    rank = start + idx - 1
-                    product = {
-                        "rank": rank,
-                        "title": title_clean,
-                        "price": int(item.get("lprice", 0)),
-                        "link": item.get("link", ""),
-                        "mallName": item.get("mallName", "")
-                    }
-                    
-                    if not best_product or rank < best_product["rank"]:
-                        best_product = product
-                        
-        return best_product
-    except Exception as e:
-        print(f"⚠️ 순위 조회 중 오류: {e}")
+    API 호출 실패는 예외로 전달됩니다.
+    """
+    # 한 번의 스캔으로 판매처 상품과 주변 순위 상품을 함께 수집 (타겟 상품 위아래 ±5위, 부족하면 ±10위)
+    target_product, competitors = analyze_competitors(
+        keyword, get_credentials(), [target_mall_name], count=competitor_count, cancel=cancel, on_page=on_page
+    )[target_mall_name]
+    if target_product is None:
+        return None, []
+    return make_rank_product(target_product), [make_rank_product(product) for product in competitors]
+
+class TrackingChart:
+    """순위 추이 그래프 (새 기록만 덧붙여 다시 그림)
+    
+    축을 지우고 전체를 다시 그리는 대신 선 하나의 데이터만 바꾸고,
+    기록이 많으면 RankSeries.display_points로 줄인 점만 그립니다. x축은 확인 시각입니다.
+    """
+
+    def __init__(self):
+        Figure, FigureCanvas = load_matplotlib()
+        import matplotlib.dates as mdates
+        self._date2num = mdates.date2num
+        self.figure = Figure(figsize=(5, 3))
+        self.canvas = FigureCanvas(self.figure)
+        self.canvas.setFixedSize(400, 250)  # 고정 크기로 설정
+        self.ax = self.figure.add_subplot(111)
+        self.line, = self.ax.plot([], [], marker='o', linewidth=2, markersize=5, color='#4caf50')
+        
+        locator = mdates.AutoDateLocator(maxticks=5)
+        self.ax.xaxis.set_major_locator(locator)
+        self.ax.xaxis.set_major_formatter(mdates.ConciseDateFormatter(locator))
+        self.ax.tick_params(labelsize=7)
+        self.ax.set_xlabel("확인 시각", fontsize=8)
+        self.ax.set_ylabel("순위", fontsize=8)
+        self.ax.grid(True, alpha=0.3)
+        self.ax.invert_yaxis()  # 순위는 낮을수록 좋으므로 Y축 반전
+        
+        self.key = None  # 표시 중인 (검색어, 판매처명)
+        self.series = RankSeries()
+        self.set_title("순위 추이")
+        self.figure.tight_layout()
+
+    def set_title(self, text):
+        self.ax.set_title(text, fontsize=10, fontweight='bold')
+
+    def reset(self, key=None, history=()):
+        """표시할 대상을 바꾸고 기록 전체로 다시 채움 (key가 None이면 빈 그래프)"""
+        self.key = key
+        self.series = RankSeries(history)
+        if key is None:
+            self.set_title("순위 추이")
+        else:
+            keyword, mall_name = key
+            self.set_title(f"{keyword}\n({mall_name})" if len(keyword) + len(mall_name) > 20 else f"순위 추이 - {keyword} ({mall_name})")
+        self.refresh()
+
+    def append(self, history):
+        """새 기록만 덧붙임"""
+        self.series.extend(history)
+        self.refresh()
+
+    def refresh(self):
+        times, ranks = self.series.display_points()
+        self.line.set_data(self._date2num(times), ranks)
+        if ranks:
+            self.ax.relim()
+            self.ax.autoscale_view()
+        self.canvas.draw_idle()
+
+class UpdateBatcher(QObject):
+    """Worker 스레드의 화면 갱신을 모아 GUI 스레드에서 프레임마다 한 번씩 반영
+    
+    Worker는 결과 행(add_rows)과 진행률(set_progress)을 채널(보통 Worker 자신)별로 넣기만 하고,
+    GUI 스레드는 FRAME_INTERVAL_MS마다 채널별로 모인 행을 한 번에, 진행률은 마지막 값만 처리합니다.
+    Worker 수나 결과 수와 관계없이 GUI 스레드로 가는 시그널은 한 프레임에 한 번입니다.
+    """
+    _wake = Signal()
+
+    def __init__(self, interval=FRAME_INTERVAL_MS, parent=None):
+        super().__init__(parent)
+        self._lock = threading.Lock()
+        self._rows = {}  # 채널 -> 아직 반영하지 않은 행 목록
+        self._progress = {}  # 채널 -> 마지막 진행률 인자
+        self._handlers = {}  # 채널 -> (on_rows, on_progress)
+        self._scheduled = False
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(interval)
+        self._timer.timeout.connect(self.flush)
+        self._wake.connect(self._schedule)
+
+    def subscribe(self, channel, on_rows=None, on_progress=None):
+        """channel의 행 묶음은 on_rows(rows), 진행률은 on_progress(*values)로 받음 (GUI 스레드)"""
+        self._handlers[channel] = (on_rows, on_progress)
+
+    def unsubscribe(self, channel, deliver=True):
+        """channel 구독 해제 (deliver가 True면 남은 갱신을 먼저 반영, False면 버림)"""
+        if deliver:
+            self.flush()
+        self._handlers.pop(channel, None)
+        with self._lock:
+            self._rows.pop(channel, None)
+            self._progress.pop(channel, None)
+
+    def add_rows(self, channel, rows):
+        """행 추가 (아무 스레드에서나 호출 가능)"""
+        with self._lock:
+            self._rows.setdefault(channel, []).extend(rows)
+            wake = not self._scheduled
+            self._scheduled = True
+        if wake:
+            self._wake.emit()
+
+    def set_progress(self, channel, *values):
+        """진행률 갱신 (아무 스레드에서나 호출 가능, 프레임 안의 마지막 값만 반영)"""
+        with self._lock:
+            self._progress[channel] = values
+            wake = not self._scheduled
+            self._scheduled = True
+        if wake:
+            self._wake.emit()
+
+    @Slot()
+    def _schedule(self):
+        if not self._timer.isActive():
+            self._timer.start()
+
+    def flush(self):
+        """모인 갱신을 지금 반영 (GUI 스레드)"""
+        with self._lock:
+            rows, self._rows = self._rows, {}
+            progress, self._progress = self._progress, {}
+            self._scheduled = False
+        for channel, items in rows.items():
+            on_rows = self._handlers.get(channel, (None, None))[0]
+            if on_rows:
+                on_rows(items)
+        for channel, values in progress.items():
+            on_progress = self._handlers.get(channel, (None, None))[1]
+            if on_progress:
+                on_progress(*values)
+
+
+class RowTableModel(QAbstractTableModel):
+    """행을 튜플로만 보관하는 읽기 전용 표 모델
+    
+    셀마다 QTableWidgetItem을 만들지 않고, 글자·색·정렬은 뷰가 화면에 보이는 셀을 그릴 때
+    data()에서 그때그때 계산합니다. 정렬과 필터는 원본 값으로 표시 순서(행 번호 목록)만 다시 만듭니다.
+    하위 클래스는 headers(열 머리글 튜플)와 cell(row, column, role)을 정의합니다.
+    cell은 행 row의 column 열을 role(DisplayRole, ForegroundRole 등)에 맞게 표시할 값을
+    반환하고, 해당 role을 쓰지 않으면 None을 반환합니다.
+    필요하면 sort_key()와 matches()를 바꿉니다.
+    """
+    headers = ()
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows = []
+        self._view = []  # 표시 순서의 행 번호 (정렬·필터 결과)
+        self._sort_column = None
+        self._sort_order = Qt.SortOrder.AscendingOrder
+        self._filter = ""
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._view)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.headers)
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return self.headers[section]
+        return None
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        return self.cell(self._rows[self._view[index.row()]], index.column(), role)
+
+    def sort_key(self, row, column):
+        return row[column]
+
+    def matches(self, row, text):
+        """필터 문자열(소문자) text에 맞는 행인지"""
+        return True
+
+    def row_at(self, view_row):
+        """표시 순서 view_row번째 행"""
+        return self._rows[self._view[view_row]]
+
+    def __len__(self):
+        return len(self._rows)
+
+    def set_rows(self, rows):
+        """모든 행을 rows로 바꿈"""
+        self.beginResetModel()
+        self._rows = list(rows)
+        self._view = self._build_view()
+        self.endResetModel()
+
+    def clear(self):
+        self.set_rows(())
+
+    def append_rows(self, rows):
+        """행을 뒤에 덧붙임 (정렬 중이면 정렬 순서에 맞게 배치)"""
+        first = len(self._rows)
+        self._rows.extend(rows)
+        added = [i for i in range(first, len(self._rows)) if self._accepts(self._rows[i])]
+        if not added:
+            return
+        if self._sort_column is not None:
+            self._relayout(lambda: self._view.extend(added))
+            return
+        start = len(self._view)
+        self.beginInsertRows(QModelIndex(), start, start + len(added) - 1)
+        self._view.extend(added)
+        self.endInsertRows()
+
+    def sort(self, column, order=Qt.SortOrder.AscendingOrder):
+        """column 열로 정렬 (column이 음수면 들어온 순서로)"""
+        self._sort_column = column if column >= 0 else None
+        self._sort_order = order
+        self._relayout(self._view.sort if self._sort_column is None else lambda: None)
+
+    def set_filter(self, text):
+        """text가 들어간 행만 표시 (빈 문자열이면 모두)"""
+        self._filter = text.strip().lower()
+        self.beginResetModel()
+        self._view = self._build_view()
+        self.endResetModel()
+
+    def _accepts(self, row):
+        return not self._filter or self.matches(row, self._filter)
+
+    def _build_view(self):
+        view = [i for i, row in enumerate(self._rows) if self._accepts(row)]
+        self._sort_view(view)
+        return view
+
+    def _sort_view(self, view):
+        if self._sort_column is None:
+            return
+        rows, column = self._rows, self._sort_column
+        view.sort(key=lambda i: self.sort_key(rows[i], column),
+                  reverse=self._sort_order == Qt.SortOrder.DescendingOrder)
+
+    def _relayout(self, change):
+        """표시 순서를 바꾸고 선택 등 뷰가 잡고 있는 인덱스를 같은 행으로 옮김"""
+        self.layoutAboutToBeChanged.emit()
+        persistent = self.persistentIndexList()
+        held = [(self._view[index.row()], index.column()) for index in persistent]
+        change()
+        self._sort_view(self._view)
+        position = {row: i for i, row in enumerate(self._view)}
+        self.changePersistentIndexList(
+            persistent, [self.index(position[row], column) for row, column in held]
+        )
+        self.layoutChanged.emit()
+
+
+def rank_color(rank):
+    """순위 구간별 글자색 (10위/50위/100위 이내)"""
+    if rank <= 10:
+        return RANK_COLORS[0]
+    if rank <= 50:
+        return RANK_COLORS[1]
+    if rank <= 100:
+        return RANK_COLORS[2]
+    return None
+
+
+def price_text(price):
+    return f"{price:,}원" if price > 0 else "-"
+
+
+RIGHT_ALIGNED = Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter
+
+
+class RankResultModel(RowTableModel):
+    """메인 탭 순위 확인 결과 표 (행은 rank_result_row)"""
+    headers = ("검색어", "순위", "상품명", "판매처", "브랜드", "상품타입", "가격", "링크")
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.bold_font = QFont()
+        self.bold_font.setBold(True)
+
+    def cell(self, row, column, role):
+        rank = row[1]
+        if role == Qt.ItemDataRole.DisplayRole:
+            if column == 1:
+                return f"{rank}위" if rank else "-"
+            if column == 6:
+                return price_text(row[6]) if rank else ""
+            if column in (4, 5) and rank:
+                return row[column] or "-"
+            return row[column]
+        if role == Qt.ItemDataRole.ForegroundRole:
+            if not rank and column in (0, 2):
+                return FAILED_COLOR if row[8] else NOT_FOUND_COLOR
+            if column == 1 and rank:
+                return rank_color(rank)
+            if column == 7:
+                return LINK_COLOR
+            return None
+        if role == Qt.ItemDataRole.FontRole:
+            return self.bold_font if column == 0 else None
+        if role == Qt.ItemDataRole.TextAlignmentRole:
+            if column == 1:
+                return Qt.AlignmentFlag.AlignCenter
+            if column == 6:
+                return RIGHT_ALIGNED
+        if role == Qt.ItemDataRole.ToolTipRole and column in (2, 7):
+            return row[column]
         return None
 
-def get_competitor_products(keyword, target_mall_name, competitor_count=10):
-    """입력한 판매처 상품 주변의 경쟁사 상품들 조회"""
-    encText = urllib.parse.quote(keyword)
-    target_product = None
-    all_products = []
+    def sort_key(self, row, column):
+        if column == 1:
+            return row[1] or MAX_RANK + 1  # 찾지 못한 검색어는 뒤로
+        return row[column]
+
+    def link(self, view_row):
+        return self.row_at(view_row)[7]
+
+
+class ProductListModel(RowTableModel):
+    """상품 리스트 표 (행은 Product)"""
+    headers = ("순위", "상품명", "판매처", "브랜드", "상품타입", "가격", "링크")
+    fields = ("rank", "title", "mall_name", "brand", "category", "price", "link")
+
+    def cell(self, product, column, role):
+        if role == Qt.ItemDataRole.DisplayRole:
+            if column == 5:
+                return f"{product.price:,}원"
+            return str(getattr(product, self.fields[column]))
+        if role == Qt.ItemDataRole.TextAlignmentRole:
+            if column == 0:
+                return Qt.AlignmentFlag.AlignCenter
+            if column == 5:
+                return RIGHT_ALIGNED
+        return None
+
+    def sort_key(self, product, column):
+        return getattr(product, self.fields[column])
+
+    def matches(self, product, text):
+        return any(text in value.lower() for value in (product.title, product.mall_name, product.brand, product.category))
+
+
+class TrackingHistoryModel(RowTableModel):
+    """추적 이력 표 (행은 (확인 시각, 순위, 상품명, 가격))"""
+    headers = ("날짜/시간", "순위", "상품명", "가격")
+
+    @staticmethod
+    def make_row(record):
+        return (record["datetime"], record["rank"], record["title"], record["price"])
+
+    def cell(self, row, column, role):
+        if role == Qt.ItemDataRole.DisplayRole:
+            if column == 2:
+                return row[2][:50]
+            if column == 3:
+                return f"{row[3]:,}원"
+            return str(row[column])
+        return None
+
+
+class CompetitorModel(RowTableModel):
+    """경쟁사 비교 표 (행은 (판매처, 순위, 상품명, 가격, 타겟 여부))
     
-    try:
-        # 먼저 입력한 판매처의 상품 찾기
-        for start in range(1, 1001, 100):
-            url = f"https://openapi.naver.com/v1/search/shop.json?query={encText}&display=100&start={start}"
-            request = urllib.request.Request(url)
-            request.add_header("X-Naver-Client-Id", client_id)
-            request.add_header("X-Naver-Client-Secret", client_secret)
-            
-            response = urllib.request.urlopen(request, timeout=10)
-            result = json.loads(response.read())
-            items = result.get("items", [])
-            
-            if not items:
-                break
-            
-            for idx, item in enumerate(items, start=1):
-                rank = start + idx - 1
-                title_clean = re.sub(r"<.*?>", "", item.get("title", ""))
-                mall_name = item.get("mallName", "")
-                
-                product = {
-                    "rank": rank,
-                    "title": title_clean,
-                    "price": int(item.get("lprice", 0)),
-                    "link": item.get("link", ""),
-                    "mallName": mall_name
-                }
-                
-                # 입력한 판매처의 상품 찾기
-                if not target_product and mall_name and target_mall_name in mall_name:
-                    target_product = product
-                
-                all_products.append(product)
-        
-        if not target_product:
-            return None, []
-        
-        target_rank = target_product["rank"]
-        
-        # 타겟 상품 주변의 다른 판매처 상품들 찾기
-        competitors = []
-        seen_malls = set()
-        
-        # 타겟 상품 위아래로 경쟁사 찾기
-        for product in all_products:
-            # 같은 판매처는 제외
-            if product["mallName"] and target_mall_name in product["mallName"]:
-                continue
-            
-            # 타겟 순위 주변 ±5개 범위
-            rank_diff = abs(product["rank"] - target_rank)
-            if rank_diff <= 5 and product["rank"] != target_rank:
-                # 중복 판매처 제거 (같은 판매처는 하나만)
-                if product["mallName"] not in seen_malls:
-                    competitors.append(product)
-                    seen_malls.add(product["mallName"])
-        
-        # 경쟁사가 부족하면 범위 확대
-        if len(competitors) < competitor_count:
-            for product in all_products:
-                if product["mallName"] and target_mall_name in product["mallName"]:
-                    continue
-                
-                rank_diff = abs(product["rank"] - target_rank)
-                if 5 < rank_diff <= 10 and product["mallName"] not in seen_malls:
-                    competitors.append(product)
-                    seen_malls.add(product["mallName"])
-                    if len(competitors) >= competitor_count:
-                        break
-        
-        # 순위 순으로 정렬
-        competitors.sort(key=lambda x: x["rank"])
-        
-        return target_product, competitors[:competitor_count]
-        
-    except Exception as e:
-        print(f"⚠️ 경쟁사 조회 중 오류: {e}")
-        return None, []
+    타겟 상품은 굵은 진한 녹색, 경쟁사 순위는 구간별 색으로 표시합니다.
+    """
+    headers = ("판매처", "순위", "상품명", "가격")
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.bold_font = QFont()
+        self.bold_font.setBold(True)
+
+    def cell(self, row, column, role):
+        mall, rank, title, price, is_target = row
+        if role == Qt.ItemDataRole.DisplayRole:
+            if column == 0:
+                return mall
+            if column == 1:
+                return str(rank)
+            if column == 2:
+                return title[:60] + "..." if len(title) > 60 else title
+            return price_text(price)
+        if role == Qt.ItemDataRole.FontRole:
+            return self.bold_font if is_target and (column != 3 or price > 0) else None
+        if role == Qt.ItemDataRole.ForegroundRole:
+            if is_target and column in (0, 1):
+                return TARGET_COLOR
+            if column == 1:
+                return rank_color(rank)
+            return None
+        if role == Qt.ItemDataRole.TextAlignmentRole:
+            if column == 1:
+                return Qt.AlignmentFlag.AlignCenter
+            if column == 3 and price > 0:
+                return RIGHT_ALIGNED
+        return None
+
+
+def make_table_view(model, resize_modes, sortable=False):
+    """model을 보여 주는 읽기 전용 표 (열 너비는 화면에 보이는 행만 기준으로 맞춤)
+    
+    sortable이면 머리글을 눌러 정렬할 수 있고, 처음에는 들어온 순서로 표시합니다.
+    """
+    view = QTableView()
+    view.setModel(model)
+    view.verticalHeader().setVisible(False)
+    header = view.horizontalHeader()
+    header.setResizeContentsPrecision(0)
+    for column, mode in enumerate(resize_modes):
+        header.setSectionResizeMode(column, mode)
+    view.setAlternatingRowColors(True)
+    view.setEditTriggers(QTableView.EditTrigger.NoEditTriggers)
+    if sortable:
+        header.setSortIndicator(-1, Qt.SortOrder.AscendingOrder)
+        view.setSortingEnabled(True)
+    return view
+
 
 def resource_path(relative_path):
     """PyInstaller 환경에서도 리소스 파일 경로를 올바르게 반환"""
@@ -459,6 +828,12 @@ class RankCheckerApp(QWidget):
         self.setWindowIcon(QIcon(resource_path("logo_inner.ico")))
         self.resize(1000, 900)  # 창 크기 확대
         self.api_verified = False  # API 인증 상태
+        # 동시에 여러 분석을 실행할 수 있도록 실행 중인 Worker를 보관
+        self.tracking_workers = set()
+        self.competitor_workers = set()
+        self.retired_workers = set()  # 취소 후 끝나기를 기다리는 Worker
+        # Worker들의 결과/진행률을 모아 프레임마다 한 번씩 화면에 반영
+        self.ui_updates = UpdateBatcher(parent=self)
         self.setup_ui()
         # GUI가 표시된 후에 체크 실행
         QTimer.singleShot(100, self.check_status_after_init)
@@ -554,7 +929,7 @@ class RankCheckerApp(QWidget):
                     stop:0 #66bb6a, stop:1 #4caf50);
                 border-radius: 6px;
             }
-            QTableWidget {
+            QTableView {
                 border: 2px solid #a5d6a7;
                 border-radius: 8px;
                 background-color: #ffffff;
@@ -562,14 +937,14 @@ class RankCheckerApp(QWidget):
                 selection-background-color: #c8e6c9;
                 selection-color: #1b5e20;
             }
-            QTableWidget::item {
+            QTableView::item {
                 padding: 8px;
                 border: none;
             }
-            QTableWidget::item:alternate {
+            QTableView::item:alternate {
                 background-color: #f1f8f4;
             }
-            QTableWidget::item:selected {
+            QTableView::item:selected {
                 background-color: #a5d6a7;
                 color: #1b5e20;
             }
@@ -582,12 +957,6 @@ class RankCheckerApp(QWidget):
                 font-weight: bold;
                 font-size: 10pt;
             }
-            QTextBrowser {
-                border: 2px solid #a5d6a7;
-                border-radius: 8px;
-                background-color: #ffffff;
-                padding: 10px;
-            }
             QLabel {
                 color: #2e7d32;
             }
@@ -606,7 +975,7 @@ class RankCheckerApp(QWidget):
         bold_font = QFont()
         bold_font.setBold(True)
 
-        self.label_keywords = QLabel("검색어(최대 10개, 쉼표로 구분)")
+        self.label_keywords = QLabel("검색어(쉼표 또는 줄바꿈으로 구분)")
         self.label_keywords.setFont(bold_font)
         self.input_keywords = CustomTextEdit(main_tab)
         self.input_keywords.setFixedHeight(70)
@@ -649,7 +1018,36 @@ class RankCheckerApp(QWidget):
         """)
         self.button_check.clicked.connect(self.start_check)
 
-        main_tab_layout.addWidget(self.button_check)
+        self.button_stop = QPushButton("⏹ 중지")
+        self.button_stop.setFont(bold_font)
+        self.button_stop.setStyleSheet("""
+            QPushButton {
+                background-color: #9e9e9e;
+                color: #ffffff;
+                border: none;
+                border-radius: 10px;
+                padding: 15px 30px;
+                font-weight: bold;
+                font-size: 12pt;
+                min-height: 25px;
+            }
+            QPushButton:disabled {
+                background-color: #e0e0e0;
+            }
+        """)
+        self.button_stop.setEnabled(False)
+        self.button_stop.clicked.connect(self.stop_check)
+
+        # 중지했던 같은 검색어/판매처 배치를 이어서 확인할지 (해제하면 처음부터 확인)
+        self.check_resume = QCheckBox("중지한 확인 이어서 하기")
+        self.check_resume.setChecked(True)
+        self.check_resume.setToolTip("해제하면 이전에 확인한 결과를 버리고 모든 검색어를 처음부터 확인합니다.")
+
+        check_button_layout = QHBoxLayout()
+        check_button_layout.addWidget(self.button_check, stretch=1)
+        check_button_layout.addWidget(self.button_stop)
+        main_tab_layout.addLayout(check_button_layout)
+        main_tab_layout.addWidget(self.check_resume)
         main_tab_layout.addSpacerItem(QSpacerItem(0, 10, QSizePolicy.Minimum, QSizePolicy.Fixed))
         
         # 엑셀 다운로드 버튼
@@ -686,8 +1084,20 @@ class RankCheckerApp(QWidget):
         main_tab_layout.addSpacerItem(QSpacerItem(0, 10, QSizePolicy.Minimum, QSizePolicy.Fixed))
 
         self.label_status = QLabel("")
-        self.result_display = QTextBrowser()
-        self.result_display.setOpenExternalLinks(True)
+        # 순위 확인 결과 표 (더블클릭하면 상품 링크 열기)
+        self.rank_result_model = RankResultModel(self)
+        self.result_display = make_table_view(self.rank_result_model, (
+            QHeaderView.ResizeMode.ResizeToContents,  # 검색어
+            QHeaderView.ResizeMode.ResizeToContents,  # 순위
+            QHeaderView.ResizeMode.Stretch,  # 상품명
+            QHeaderView.ResizeMode.ResizeToContents,  # 판매처
+            QHeaderView.ResizeMode.ResizeToContents,  # 브랜드
+            QHeaderView.ResizeMode.Interactive,  # 상품타입
+            QHeaderView.ResizeMode.ResizeToContents,  # 가격
+            QHeaderView.ResizeMode.Interactive,  # 링크
+        ), sortable=True)
+        self.result_display.setSelectionBehavior(QTableView.SelectionBehavior.SelectRows)
+        self.result_display.doubleClicked.connect(self.open_result_link)
 
         self.progress_bar = QProgressBar()
         main_tab_layout.addWidget(self.label_status)
@@ -862,6 +1272,62 @@ class RankCheckerApp(QWidget):
         api_group.setLayout(api_layout)
         layout.addWidget(api_group)
         
+        # 추가 API 키 (키 풀) 그룹
+        pool_group = QGroupBox("🔑 추가 API 키 (호출 한도 분산)")
+        pool_layout = QVBoxLayout()
+        pool_layout.setSpacing(10)
+        
+        pool_info = QLabel("한 줄에 하나씩 client_id:client_secret 형식으로 입력하세요.")
+        pool_info.setWordWrap(True)
+        pool_layout.addWidget(pool_info)
+        
+        self.settings_extra_keys = QTextEdit()
+        self.settings_extra_keys.setFixedHeight(80)
+        self.settings_extra_keys.setPlaceholderText("예: abcdEFGH1234:XyZ987secret")
+        self.settings_extra_keys.setPlainText("\n".join(f"{cid}:{secret}" for cid, secret in EXTRA_CREDENTIALS))
+        pool_layout.addWidget(self.settings_extra_keys)
+        
+        strategy_row = QHBoxLayout()
+        strategy_row.addWidget(QLabel("분산 방식:"))
+        self.settings_key_strategy = QComboBox()
+        self.settings_key_strategy.addItem("가장 적게 쓴 키 우선", LEAST_USED)
+        self.settings_key_strategy.addItem("순서대로 돌아가며", ROUND_ROBIN)
+        self.settings_key_strategy.setCurrentIndex(max(0, self.settings_key_strategy.findData(KEY_STRATEGY)))
+        strategy_row.addWidget(self.settings_key_strategy)
+        strategy_row.addStretch()
+        pool_layout.addLayout(strategy_row)
+        
+        self.save_extra_keys_button = QPushButton("💾 추가 키 저장")
+        self.save_extra_keys_button.setFont(bold_font)
+        self.save_extra_keys_button.clicked.connect(self.save_extra_keys)
+        pool_layout.addWidget(self.save_extra_keys_button)
+        
+        pool_group.setLayout(pool_layout)
+        layout.addWidget(pool_group)
+        
+        # 검색 결과 캐시 통계 그룹
+        cache_group = QGroupBox("📦 검색 결과 캐시")
+        cache_layout = QVBoxLayout()
+        cache_layout.setSpacing(10)
+        
+        self.cache_stats_label = QLabel("")
+        self.cache_stats_label.setWordWrap(True)
+        cache_layout.addWidget(self.cache_stats_label)
+        
+        self.clear_cache_button = QPushButton("🗑️ 캐시 비우기")
+        self.clear_cache_button.setFont(bold_font)
+        self.clear_cache_button.clicked.connect(self.clear_page_cache)
+        cache_layout.addWidget(self.clear_cache_button)
+        
+        cache_group.setLayout(cache_layout)
+        layout.addWidget(cache_group)
+        
+        # 캐시 통계는 주기적으로 갱신
+        self.update_cache_stats()
+        self.cache_stats_timer = QTimer(self)
+        self.cache_stats_timer.timeout.connect(self.update_cache_stats)
+        self.cache_stats_timer.start(2000)
+        
         layout.addSpacerItem(QSpacerItem(0, 0, QSizePolicy.Minimum, QSizePolicy.Expanding))
         
         # 저장된 설정이 있고 인증이 되어 있으면 필드 비활성화
@@ -869,13 +1335,50 @@ class RankCheckerApp(QWidget):
             # 저장된 설정으로 인증 확인
             QTimer.singleShot(500, self.check_saved_api_config)
     
+    def save_extra_keys(self):
+        """추가 API 키 목록 저장"""
+        global EXTRA_CREDENTIALS, KEY_STRATEGY
+        EXTRA_CREDENTIALS = parse_credentials(self.settings_extra_keys.toPlainText())
+        KEY_STRATEGY = self.settings_key_strategy.currentData()
+        if save_api_config():
+            self.update_cache_stats()
+            QMessageBox.information(self, "저장 완료", f"추가 API 키 {len(EXTRA_CREDENTIALS)}개가 저장되었습니다.")
+        else:
+            QMessageBox.warning(self, "저장 실패", "설정 저장에 실패했습니다.")
+    
+    def update_cache_stats(self):
+        """캐시 적중/실패 통계 표시"""
+        cache = get_client().cache
+        stats = cache.stats()
+        self.cache_stats_label.setText(
+            f"적중: {stats['hits']}회 (디스크 {stats['disk_hits']}회) | "
+            f"실패: {stats['misses']}회 | 적중률: {stats['hit_rate']:.0%}\n"
+            f"저장된 페이지: {stats['entries']}개 | 유효 시간: {cache.ttl}초 | "
+            f"디스크 저장: {'사용' if cache.disk_path else '사용 안 함'}\n"
+            f"오늘 API 호출: {get_client().quota.used(client_id):,} / {get_client().quota.limit:,}회"
+        )
+        credentials = get_credentials()
+        if not isinstance(credentials, tuple):
+            # 키 풀 상태: 키별 사용량과 제외 여부
+            lines = [
+                f"{row['client_id'][:6]}... {'✅' if row['active'] else '⛔'} "
+                f"{row['used']:,}회 사용 / 남은 {row['remaining']:,}회"
+                for row in credentials.status()
+            ]
+            self.cache_stats_label.setText(self.cache_stats_label.text() + "\n" + "\n".join(lines))
+    
+    def clear_page_cache(self):
+        """검색 결과 캐시 비우기"""
+        get_client().cache.clear()
+        self.update_cache_stats()
+    
     def setup_product_list_tab(self, parent, layout):
         """상품 리스트 추출 탭 UI 구성"""
         bold_font = QFont()
         bold_font.setBold(True)
         
         # 설명 라벨
-        info_label = QLabel("🌱 검색어를 입력하면 1위~100위까지의 상품 리스트를 추출하여 표시합니다.")
+        info_label = QLabel("🌱 검색어를 입력하면 1위부터 지정한 순위(최대 1000위)까지의 상품 리스트를 추출하여 표시합니다.")
         info_label.setWordWrap(True)
         info_label.setStyleSheet("""
             QLabel {
@@ -912,6 +1415,20 @@ class RankCheckerApp(QWidget):
         search_layout.addWidget(keyword_label)
         search_layout.addWidget(self.product_list_keyword)
         
+        depth_layout = QHBoxLayout()
+        depth_label = QLabel("수집 범위:")
+        depth_label.setFont(bold_font)
+        self.product_list_depth = QSpinBox()
+        self.product_list_depth.setRange(PAGE_SIZE, MAX_RANK)
+        self.product_list_depth.setSingleStep(PAGE_SIZE)
+        self.product_list_depth.setValue(PAGE_SIZE)
+        self.product_list_depth.setPrefix("1위 ~ ")
+        self.product_list_depth.setSuffix("위")
+        depth_layout.addWidget(depth_label)
+        depth_layout.addWidget(self.product_list_depth)
+        depth_layout.addStretch()
+        search_layout.addLayout(depth_layout)
+        
         search_group.setLayout(search_layout)
         layout.addWidget(search_group)
         
@@ -1007,27 +1524,24 @@ class RankCheckerApp(QWidget):
         """)
         layout.addWidget(result_label)
         
-        # 테이블 위젯 생성
-        self.product_list_table = QTableWidget()
-        self.product_list_table.setColumnCount(7)
-        self.product_list_table.setHorizontalHeaderLabels(["순위", "상품명", "판매처", "브랜드", "상품타입", "가격", "링크"])
-        
-        # 좌측 행 번호 숨기기
-        self.product_list_table.verticalHeader().setVisible(False)
-        
-        # 테이블 설정
-        header = self.product_list_table.horizontalHeader()
-        header.setSectionResizeMode(0, QHeaderView.ResizeMode.ResizeToContents)  # 순위
-        header.setSectionResizeMode(1, QHeaderView.ResizeMode.Stretch)  # 상품명
-        header.setSectionResizeMode(2, QHeaderView.ResizeMode.ResizeToContents)  # 판매처
-        header.setSectionResizeMode(3, QHeaderView.ResizeMode.ResizeToContents)  # 브랜드
-        header.setSectionResizeMode(4, QHeaderView.ResizeMode.Stretch)  # 상품타입
-        header.setSectionResizeMode(5, QHeaderView.ResizeMode.ResizeToContents)  # 가격
-        header.setSectionResizeMode(6, QHeaderView.ResizeMode.Stretch)  # 링크
-        
-        self.product_list_table.setAlternatingRowColors(True)
-        self.product_list_table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
-        self.product_list_table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+        # 결과 내 검색 (상품명/판매처/브랜드/상품타입)
+        self.product_list_filter = QLineEdit()
+        self.product_list_filter.setPlaceholderText("결과 내 검색 (상품명, 판매처, 브랜드, 상품타입)")
+        layout.addWidget(self.product_list_filter)
+        
+        # 테이블 생성 (상품은 모델에 보관하고 보이는 행만 그림)
+        self.product_list_model = ProductListModel(self)
+        self.product_list_filter.textChanged.connect(self.product_list_model.set_filter)
+        self.product_list_table = make_table_view(self.product_list_model, (
+            QHeaderView.ResizeMode.ResizeToContents,  # 순위
+            QHeaderView.ResizeMode.Stretch,  # 상품명
+            QHeaderView.ResizeMode.ResizeToContents,  # 판매처
+            QHeaderView.ResizeMode.ResizeToContents,  # 브랜드
+            QHeaderView.ResizeMode.Stretch,  # 상품타입
+            QHeaderView.ResizeMode.ResizeToContents,  # 가격
+            QHeaderView.ResizeMode.Stretch,  # 링크
+        ), sortable=True)
+        self.product_list_table.setSelectionBehavior(QTableView.SelectionBehavior.SelectRows)
         
         # 테이블이 더 많은 공간을 차지하도록 설정
         self.product_list_table.setMinimumHeight(500)  # 최소 높이 설정
@@ -1035,8 +1549,8 @@ class RankCheckerApp(QWidget):
         
         layout.addWidget(self.product_list_table, stretch=1)  # stretch를 1로 설정하여 더 많은 공간 할당
         
-        # 저장된 상품 데이터 (엑셀 다운로드용)
-        self.current_products = []
+        # 수집한 상품 리스트 임시 파일 (엑셀 다운로드용)
+        self.product_list_spool = None
     
     def start_product_extraction(self):
         """상품 리스트 추출 시작"""
@@ -1052,11 +1566,14 @@ class RankCheckerApp(QWidget):
         
         # 기존 Worker가 실행 중이면 중지
         if hasattr(self, 'product_list_worker') and self.product_list_worker.isRunning():
-            self.product_list_worker.terminate()
-            self.product_list_worker.wait()
+            old_worker = self.product_list_worker
+            self.retire_worker(old_worker, old_worker.finished_products, old_worker.error_occurred)
+            # 중지한 Worker의 임시 파일은 스레드가 끝난 뒤 삭제
+            old_worker.finished.connect(lambda path=old_worker.spool_path: remove_file(path))
+        self.remove_product_list_spool()
         
         # UI 초기화
-        self.product_list_table.setRowCount(0)  # 테이블 초기화
+        self.product_list_model.clear()  # 테이블 초기화
         self.product_list_progress.setValue(0)
         self.product_list_progress.setVisible(True)
         self.product_list_status.setText("🔄 상품 리스트 수집 중...")
@@ -1064,9 +1581,11 @@ class RankCheckerApp(QWidget):
         self.excel_download_button.setEnabled(False)  # 엑셀 다운로드 버튼도 비활성화
         
         # Worker 시작
-        self.product_list_worker = ProductListWorker(keyword)
-        self.product_list_worker.progress_update.connect(self.update_product_list_progress)
-        self.product_list_worker.finished.connect(self.on_product_extraction_finished)
+        self.product_list_worker = ProductListWorker(keyword, self.ui_updates, self.product_list_depth.value())
+        self.ui_updates.subscribe(
+            self.product_list_worker, self.append_product_rows, self.update_product_list_progress
+        )
+        self.product_list_worker.finished_products.connect(self.on_product_extraction_finished)
         self.product_list_worker.error_occurred.connect(self.on_product_extraction_error)
         self.product_list_worker.start()
     
@@ -1075,60 +1594,29 @@ class RankCheckerApp(QWidget):
         self.product_list_progress.setValue(percent)
         self.product_list_status.setText(f"🔄 {message}")
     
-    def on_product_extraction_finished(self, products):
-        """상품 리스트 추출 완료"""
+    def append_product_rows(self, products):
+        """받은 페이지의 상품(Product 목록)을 표에 추가"""
+        self.product_list_model.append_rows(products)
+    
+    def on_product_extraction_finished(self, count):
+        """상품 리스트 추출 완료 (중지한 경우 그때까지 받은 상품)"""
+        worker = self.product_list_worker
+        self.ui_updates.unsubscribe(worker)  # 남은 상품을 먼저 표에 반영
         self.product_list_progress.setValue(100)
         self.extract_button.setEnabled(True)
         
-        if not products:
+        if not count:
             self.product_list_status.setText("❌ 추출된 상품이 없습니다.")
             self.excel_download_button.setEnabled(False)
+            remove_file(worker.spool_path)
             QMessageBox.warning(self, "결과 없음", "검색 결과가 없습니다.")
             return
         
-        # 상품 데이터 저장 (엑셀 다운로드용)
-        self.current_products = products
-        
-        # 테이블에 데이터 표시
-        self.product_list_table.setRowCount(len(products))
-        
-        for row, product in enumerate(products):
-            # 순위
-            rank_item = QTableWidgetItem(str(product.get("순위", "")))
-            rank_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            self.product_list_table.setItem(row, 0, rank_item)
-            
-            # 상품명
-            name_item = QTableWidgetItem(product.get("상품명", ""))
-            self.product_list_table.setItem(row, 1, name_item)
-            
-            # 판매처
-            mall_item = QTableWidgetItem(product.get("판매처", ""))
-            self.product_list_table.setItem(row, 2, mall_item)
-            
-            # 브랜드
-            brand_item = QTableWidgetItem(product.get("브랜드", "") if product.get("브랜드") else "")
-            self.product_list_table.setItem(row, 3, brand_item)
-            
-            # 상품타입 (카테고리)
-            category_item = QTableWidgetItem(product.get("카테고리", ""))
-            self.product_list_table.setItem(row, 4, category_item)
-            
-            # 가격
-            price = product.get("가격", 0)
-            price_item = QTableWidgetItem(f"{price:,}원")
-            price_item.setTextAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
-            self.product_list_table.setItem(row, 5, price_item)
-            
-            # 링크
-            link_item = QTableWidgetItem(product.get("상품링크", ""))
-            self.product_list_table.setItem(row, 6, link_item)
-        
-        # 테이블 스크롤을 맨 위로
-        self.product_list_table.scrollToTop()
+        # 엑셀 다운로드는 Worker가 기록한 임시 파일을 사용
+        self.product_list_spool = worker.spool_path
         
         # 상태 업데이트
-        self.product_list_status.setText(f"✅ 추출 완료! {len(products)}개 상품 수집")
+        self.product_list_status.setText(f"✅ 추출 완료! {count}개 상품 수집")
         
         # 엑셀 다운로드 버튼 활성화
         self.excel_download_button.setEnabled(True)
@@ -1136,12 +1624,17 @@ class RankCheckerApp(QWidget):
         QMessageBox.information(
             self, 
             "추출 완료", 
-            f"총 {len(products)}개 상품이 추출되었습니다.\n\n엑셀 다운로드 버튼을 클릭하여 파일로 저장하세요."
+            f"총 {count}개 상품이 추출되었습니다.\n\n엑셀 다운로드 버튼을 클릭하여 파일로 저장하세요."
         )
     
+    def remove_product_list_spool(self):
+        """이전 상품 리스트 임시 파일 삭제"""
+        remove_file(self.product_list_spool)
+        self.product_list_spool = None
+    
     def download_to_excel(self):
         """엑셀 파일로 다운로드"""
-        if not self.current_products:
+        if not self.product_list_spool:
             QMessageBox.warning(self, "데이터 없음", "저장할 상품 데이터가 없습니다.")
             return
         
@@ -1155,32 +1648,33 @@ class RankCheckerApp(QWidget):
             self,
             "엑셀 파일 저장",
             default_filename,
-            "Excel Files (*.xlsx);;All Files (*)"
+            "Excel Files (*.xlsx);;CSV Files (*.csv);;All Files (*)"
         )
         
         if filename:
-            success, message = save_to_excel(self.current_products, keyword, filename)
-            
-            if success:
-                QMessageBox.information(
-                    self,
-                    "저장 완료",
-                    f"엑셀 파일이 저장되었습니다.\n\n파일명: {message}"
-                )
-            else:
-                QMessageBox.critical(self, "저장 실패", message)
+            try:
+                copy_product_list(self.product_list_spool, filename)
+            except Exception as e:
+                QMessageBox.critical(self, "저장 실패", f"엑셀 저장 실패: {str(e)}")
+                return
+            QMessageBox.information(
+                self,
+                "저장 완료",
+                f"엑셀 파일이 저장되었습니다.\n\n파일명: {filename}"
+            )
     
     def on_product_extraction_error(self, error_message):
         """상품 리스트 추출 오류"""
+        self.ui_updates.unsubscribe(self.product_list_worker)
         self.product_list_progress.setValue(0)
         self.extract_button.setEnabled(True)
+        self.excel_download_button.setEnabled(False)
+        remove_file(self.product_list_worker.spool_path)
         self.product_list_status.setText(f"❌ 오류: {error_message}")
         QMessageBox.critical(self, "오류 발생", error_message)
     
     def verify_api_keys(self):
-        """API 키 인증 확인"""
-        global client_id, client_secret, CUSTOMER_ID, ACCESS_LICENSE, SECRET_KEY
-        
+        """API 키 인증 확인 (화면을 멈추지 않도록 백그라운드에서 항상 새로 요청)"""
         input_client_id = self.settings_client_id.text().strip()
         input_client_secret = self.settings_client_secret.text().strip()
         
@@ -1188,18 +1682,31 @@ class RankCheckerApp(QWidget):
             QMessageBox.warning(self, "입력 오류", "Client ID와 Client Secret을 입력하세요.")
             return
         
-        # 인증 확인 중 표시
+        # 인증 확인 중 표시 (확인이 끝날 때까지 입력값을 바꾸지 못하도록 잠금)
         self.verify_button.setEnabled(False)
         self.verify_button.setText("인증 확인 중...")
-        QApplication.processEvents()
+        self.set_api_fields_enabled(False)
         
-        # API 인증 확인
-        is_verified = verify_naver_api(input_client_id, input_client_secret)
+        # 저장된 설정 확인(verify_worker)이 아직 진행 중일 수 있으므로 따로 보관
+        self.verify_button_worker = VerifyWorker((input_client_id, input_client_secret), force=True)
+        self.verify_button_worker.verified.connect(self.on_api_keys_verified)
+        self.verify_button_worker.start()
+    
+    def set_api_fields_enabled(self, enabled):
+        self.settings_client_id.setEnabled(enabled)
+        self.settings_client_secret.setEnabled(enabled)
+        self.settings_customer_id.setEnabled(enabled)
+        self.settings_access_license.setEnabled(enabled)
+        self.settings_secret_key.setEnabled(enabled)
+    
+    def on_api_keys_verified(self, is_verified):
+        """인증 확인 버튼 결과 반영"""
+        global client_id, client_secret, CUSTOMER_ID, ACCESS_LICENSE, SECRET_KEY
         
         if is_verified:
             # 인증 성공
-            client_id = input_client_id
-            client_secret = input_client_secret
+            client_id = self.settings_client_id.text().strip()
+            client_secret = self.settings_client_secret.text().strip()
             CUSTOMER_ID = self.settings_customer_id.text().strip()
             ACCESS_LICENSE = self.settings_access_license.text().strip()
             SECRET_KEY = self.settings_secret_key.text().strip()
@@ -1220,11 +1727,7 @@ class RankCheckerApp(QWidget):
                 """)
                 
                 # 필드 비활성화
-                self.settings_client_id.setEnabled(False)
-                self.settings_client_secret.setEnabled(False)
-                self.settings_customer_id.setEnabled(False)
-                self.settings_access_license.setEnabled(False)
-                self.settings_secret_key.setEnabled(False)
+                self.set_api_fields_enabled(False)
                 self.verify_button.setEnabled(False)
                 
                 QMessageBox.information(self, "인증 성공", "API 키 인증이 완료되었습니다.\n설정이 저장되었습니다.")
@@ -1253,35 +1756,46 @@ class RankCheckerApp(QWidget):
                 "3. 인터넷 연결을 확인하세요."
             )
         
+        if not self.api_verified:
+            self.set_api_fields_enabled(True)
         self.verify_button.setEnabled(True)
         self.verify_button.setText("✅ API 인증 확인")
     
     def check_saved_api_config(self):
-        """저장된 API 설정이 유효한지 확인"""
-        global client_id, client_secret
-        if client_id and client_secret:
-            # 간단히 인증 확인
-            if verify_naver_api(client_id, client_secret):
-                self.api_verified = True
-                self.auth_status_label.setText("인증 상태: ✅ 인증 완료 (저장된 설정)")
-                self.auth_status_label.setStyleSheet("""
-                    QLabel {
-                        color: #2e7d32;
-                        font-weight: bold;
-                        padding: 10px;
-                        background-color: #c8e6c9;
-                        border-radius: 6px;
-                        font-size: 10pt;
-                    }
-                """)
-                
-                # 필드 비활성화
-                self.settings_client_id.setEnabled(False)
-                self.settings_client_secret.setEnabled(False)
-                self.settings_customer_id.setEnabled(False)
-                self.settings_access_license.setEnabled(False)
-                self.settings_secret_key.setEnabled(False)
-                self.verify_button.setEnabled(False)
+        """저장된 API 설정이 유효한지 확인 (화면을 멈추지 않도록 백그라운드에서)"""
+        if not client_id or not client_secret:
+            return
+        # 유효 시간 안에 확인한 결과가 있으면 바로 사용
+        cached = get_verifier().cached((client_id, client_secret))
+        if cached is not None:
+            self.on_saved_api_verified(cached)
+            return
+        self.auth_status_label.setText("인증 상태: 🔄 저장된 설정 확인 중...")
+        self.verify_worker = VerifyWorker((client_id, client_secret))
+        self.verify_worker.verified.connect(self.on_saved_api_verified)
+        self.verify_worker.start()
+    
+    def on_saved_api_verified(self, is_verified):
+        """저장된 API 설정 인증 결과 반영"""
+        if not is_verified:
+            self.auth_status_label.setText("인증 상태: 미인증")
+            return
+        self.api_verified = True
+        self.auth_status_label.setText("인증 상태: ✅ 인증 완료 (저장된 설정)")
+        self.auth_status_label.setStyleSheet("""
+            QLabel {
+                color: #2e7d32;
+                font-weight: bold;
+                padding: 10px;
+                background-color: #c8e6c9;
+                border-radius: 6px;
+                font-size: 10pt;
+            }
+        """)
+        
+        # 필드 비활성화
+        self.set_api_fields_enabled(False)
+        self.verify_button.setEnabled(False)
     
     def setup_rank_tracking_tab(self, parent, layout):
         """순위 추적/모니터링 탭 UI 구성"""
@@ -1376,6 +1890,43 @@ class RankCheckerApp(QWidget):
         self.track_button.clicked.connect(self.start_rank_tracking)
         button_layout.addWidget(self.track_button)
         
+        self.track_all_button = QPushButton("🔁 전체 대상 체크")
+        self.track_all_button.setFont(bold_font)
+        self.track_all_button.setStyleSheet("""
+            QPushButton {
+                background-color: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+                    stop:0 #42a5f5, stop:1 #1e88e5);
+                color: #ffffff;
+                border: none;
+                border-radius: 10px;
+                padding: 15px 30px;
+                font-weight: bold;
+                font-size: 11pt;
+            }
+        """)
+        self.track_all_button.clicked.connect(self.check_all_tracking_targets)
+        button_layout.addWidget(self.track_all_button)
+        
+        self.stop_tracking_button = QPushButton("⏹ 중지")
+        self.stop_tracking_button.setFont(bold_font)
+        self.stop_tracking_button.setStyleSheet("""
+            QPushButton {
+                background-color: #9e9e9e;
+                color: #ffffff;
+                border: none;
+                border-radius: 10px;
+                padding: 15px 30px;
+                font-weight: bold;
+                font-size: 11pt;
+            }
+            QPushButton:disabled {
+                background-color: #e0e0e0;
+            }
+        """)
+        self.stop_tracking_button.setEnabled(False)
+        self.stop_tracking_button.clicked.connect(self.stop_tracking)
+        button_layout.addWidget(self.stop_tracking_button)
+        
         self.clear_tracking_button = QPushButton("🗑️ 추적 데이터 초기화")
         self.clear_tracking_button.setFont(bold_font)
         self.clear_tracking_button.setStyleSheet("""
@@ -1422,25 +1973,14 @@ class RankCheckerApp(QWidget):
         graph_label.setStyleSheet("color: #2e7d32; font-size: 11pt; padding: 5px;")
         graph_container_layout.addWidget(graph_label)
         
-        # Matplotlib 그래프 (더 작게)
-        self.tracking_figure = Figure(figsize=(5, 3))
-        self.tracking_canvas = FigureCanvas(self.tracking_figure)
-        self.tracking_canvas.setFixedSize(400, 250)  # 고정 크기로 설정
-        self.tracking_ax = self.tracking_figure.add_subplot(111)
-        
-        # 한글 폰트 설정
-        try:
-            self.tracking_ax.set_xlabel("체크 횟수", fontsize=8, fontfamily='Malgun Gothic')
-            self.tracking_ax.set_ylabel("순위", fontsize=8, fontfamily='Malgun Gothic')
-            self.tracking_ax.set_title("순위 추이", fontsize=10, fontweight='bold', fontfamily='Malgun Gothic')
-        except:
-            self.tracking_ax.set_xlabel("체크 횟수", fontsize=8)
-            self.tracking_ax.set_ylabel("순위", fontsize=8)
-            self.tracking_ax.set_title("순위 추이", fontsize=10, fontweight='bold')
-        
-        self.tracking_ax.grid(True, alpha=0.3)
-        self.tracking_figure.tight_layout()
-        graph_container_layout.addWidget(self.tracking_canvas)
+        # Matplotlib 그래프 (더 작게) - 추적 데이터를 처음 표시할 때 생성
+        self.tracking_chart = None
+        self.tracking_chart_placeholder = QLabel("검색어와 판매처명을 입력하면\n순위 추이 그래프가 표시됩니다.")
+        self.tracking_chart_placeholder.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.tracking_chart_placeholder.setFixedSize(400, 250)
+        self.tracking_chart_placeholder.setStyleSheet("color: #888; border: 1px solid #ddd; border-radius: 6px;")
+        self.tracking_graph_layout = graph_container_layout
+        graph_container_layout.addWidget(self.tracking_chart_placeholder)
         graph_container.setLayout(graph_container_layout)
         graph_table_layout.addWidget(graph_container)
         
@@ -1454,19 +1994,13 @@ class RankCheckerApp(QWidget):
         table_label.setStyleSheet("color: #2e7d32; font-size: 11pt; padding: 5px;")
         table_container_layout.addWidget(table_label)
         
-        self.tracking_table = QTableWidget()
-        self.tracking_table.setColumnCount(4)
-        self.tracking_table.setHorizontalHeaderLabels(["날짜/시간", "순위", "상품명", "가격"])
-        self.tracking_table.verticalHeader().setVisible(False)
-        
-        header = self.tracking_table.horizontalHeader()
-        header.setSectionResizeMode(0, QHeaderView.ResizeMode.ResizeToContents)
-        header.setSectionResizeMode(1, QHeaderView.ResizeMode.ResizeToContents)
-        header.setSectionResizeMode(2, QHeaderView.ResizeMode.Stretch)
-        header.setSectionResizeMode(3, QHeaderView.ResizeMode.ResizeToContents)
-        
-        self.tracking_table.setAlternatingRowColors(True)
-        self.tracking_table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+        self.tracking_model = TrackingHistoryModel(self)
+        self.tracking_table = make_table_view(self.tracking_model, (
+            QHeaderView.ResizeMode.ResizeToContents,
+            QHeaderView.ResizeMode.ResizeToContents,
+            QHeaderView.ResizeMode.Stretch,
+            QHeaderView.ResizeMode.ResizeToContents,
+        ))
         self.tracking_table.setMinimumHeight(250)
         self.tracking_table.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
         
@@ -1539,7 +2073,30 @@ class RankCheckerApp(QWidget):
             }
         """)
         self.analyze_button.clicked.connect(self.start_competitor_analysis)
-        layout.addWidget(self.analyze_button)
+        
+        self.stop_competitor_button = QPushButton("⏹ 중지")
+        self.stop_competitor_button.setFont(bold_font)
+        self.stop_competitor_button.setStyleSheet("""
+            QPushButton {
+                background-color: #9e9e9e;
+                color: #ffffff;
+                border: none;
+                border-radius: 10px;
+                padding: 15px 30px;
+                font-weight: bold;
+                font-size: 11pt;
+            }
+            QPushButton:disabled {
+                background-color: #e0e0e0;
+            }
+        """)
+        self.stop_competitor_button.setEnabled(False)
+        self.stop_competitor_button.clicked.connect(self.stop_competitor_analysis)
+        
+        analyze_button_layout = QHBoxLayout()
+        analyze_button_layout.addWidget(self.analyze_button, stretch=1)
+        analyze_button_layout.addWidget(self.stop_competitor_button)
+        layout.addLayout(analyze_button_layout)
         
         # 진행률
         self.competitor_progress = QProgressBar()
@@ -1565,19 +2122,13 @@ class RankCheckerApp(QWidget):
         result_label.setStyleSheet("color: #2e7d32; font-size: 12pt; padding: 5px;")
         layout.addWidget(result_label)
         
-        self.competitor_table = QTableWidget()
-        self.competitor_table.setColumnCount(4)
-        self.competitor_table.setHorizontalHeaderLabels(["판매처", "순위", "상품명", "가격"])
-        self.competitor_table.verticalHeader().setVisible(False)
-        
-        header = self.competitor_table.horizontalHeader()
-        header.setSectionResizeMode(0, QHeaderView.ResizeMode.ResizeToContents)
-        header.setSectionResizeMode(1, QHeaderView.ResizeMode.ResizeToContents)
-        header.setSectionResizeMode(2, QHeaderView.ResizeMode.Stretch)
-        header.setSectionResizeMode(3, QHeaderView.ResizeMode.ResizeToContents)
-        
-        self.competitor_table.setAlternatingRowColors(True)
-        self.competitor_table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+        self.competitor_model = CompetitorModel(self)
+        self.competitor_table = make_table_view(self.competitor_model, (
+            QHeaderView.ResizeMode.ResizeToContents,
+            QHeaderView.ResizeMode.ResizeToContents,
+            QHeaderView.ResizeMode.Stretch,
+            QHeaderView.ResizeMode.ResizeToContents,
+        ), sortable=True)
         
         layout.addWidget(self.competitor_table)
     
@@ -1585,44 +2136,79 @@ class RankCheckerApp(QWidget):
         """GUI가 표시된 후에 상태 체크"""
         pass
 
+    def closeEvent(self, event):
+        """창을 닫을 때 실행 중인 분석을 중지하고 끝날 때까지 대기"""
+        workers = list(self.tracking_workers) + list(self.competitor_workers) + list(self.retired_workers)
+        for name in ("worker", "product_list_worker"):
+            if hasattr(self, name) and getattr(self, name).isRunning():
+                workers.append(getattr(self, name))
+        for worker in workers:
+            worker.cancel()
+        for worker in workers:
+            worker.wait()
+        self.remove_product_list_spool()
+        if hasattr(self, "product_list_worker"):
+            remove_file(self.product_list_worker.spool_path)
+        super().closeEvent(event)
+
     def animate_status(self):
         dots = self.dots[self.dot_index]
         self.label_status.setText(f"🔄 검색 중{dots} {self.progress_bar.value()}% 완료")
         self.dot_index = (self.dot_index + 1) % len(self.dots)
 
+    def retire_worker(self, worker, *signals):
+        """실행 중인 Worker에 취소를 요청하고 결과 시그널을 끊음 (terminate 대신)
+        
+        이미 보낸 요청은 응답을 끝까지 받아 연결을 풀에 돌려주고,
+        스레드가 끝날 때까지 참조를 유지해 QThread가 실행 중에 삭제되지 않도록 합니다.
+        """
+        worker.cancel()
+        self.ui_updates.unsubscribe(worker, deliver=False)
+        for signal in signals:
+            try:
+                signal.disconnect()
+            except (RuntimeError, TypeError):
+                pass
+        self.retired_workers.add(worker)
+        worker.finished.connect(lambda worker=worker: self.retired_workers.discard(worker))
+
     def start_check(self):
-        # 기존 Worker가 실행 중이면 중지
-        if hasattr(self, 'worker') and self.worker.isRunning():
-            self.worker.terminate()
-            self.worker.wait()
-        
-        self.keywords = [k.strip() for k in self.input_keywords.toPlainText().split(",") if k.strip()]
+        self.keywords = parse_keywords(self.input_keywords.toPlainText())
         self.mall_name = self.input_mall.text().strip()
 
         if not self.keywords or not self.mall_name:
             QMessageBox.warning(self, "입력 오류", "검색어와 판매처명을 모두 입력하세요.")
             return
 
-        if len(self.keywords) > 10:
-            QMessageBox.warning(self, "제한 초과", "검색어는 최대 10개까지 가능합니다.")
-            return
+        # 기존 Worker가 실행 중이면 중지 (이전 검색 결과는 더 이상 표시하지 않음)
+        if hasattr(self, 'worker') and self.worker.isRunning():
+            self.retire_worker(self.worker, self.worker.finished_all)
 
-        self.result_display.clear()
+        self.rank_result_model.clear()
         self.progress_bar.setValue(0)
         self.label_status.setText("🔄 검색 중")
         self.dot_index = 0
         self.status_timer.start(300)
 
-        self.worker = Worker(self.keywords, self.mall_name)
-        self.worker.result_ready.connect(self.append_result)
-        self.worker.progress_update.connect(self.update_status)
+        self.worker = Worker(self.keywords, self.mall_name, self.ui_updates, resume=self.check_resume.isChecked())
+        self.ui_updates.subscribe(self.worker, self.rank_result_model.append_rows, self.update_status)
         self.worker.finished_all.connect(lambda results: self.on_search_completed(results))
         self.worker.finished_all.connect(lambda _: self.status_timer.stop())
         self.button_excel.setEnabled(False)  # 검색 시작 시 버튼 비활성화
+        self.button_stop.setEnabled(True)
         self.worker.start()
 
-    def append_result(self, html):
-        self.result_display.append(html)
+    def stop_check(self):
+        """순위 확인 중지 (이미 확인한 검색어 결과는 유지)"""
+        if hasattr(self, 'worker') and self.worker.isRunning():
+            self.worker.cancel()
+            self.label_status.setText("⏹ 중지하는 중...")
+
+    def open_result_link(self, index):
+        """결과 표에서 더블클릭한 상품의 링크를 브라우저로 열기"""
+        link = self.rank_result_model.link(index.row())
+        if link:
+            QDesktopServices.openUrl(QUrl(link))
 
     def update_status(self, percent, keyword):
         self.progress_bar.setValue(percent)
@@ -1632,8 +2218,13 @@ class RankCheckerApp(QWidget):
     
     def on_search_completed(self, results):
         """검색 완료 후 엑셀 다운로드 버튼 활성화"""
+        self.ui_updates.unsubscribe(self.worker)  # 남은 결과를 먼저 표에 반영
         self.main_results = results
         self.button_excel.setEnabled(True)
+        self.button_stop.setEnabled(False)
+        if self.worker.cancelled:
+            self.status_timer.stop()
+            self.label_status.setText(f"⏹ 중지됨 - 검색어 {len(self.keywords)}개 중 {len(results)}개 확인")
     
     def download_main_excel(self):
         """메인 탭 결과를 엑셀로 다운로드"""
@@ -1671,7 +2262,7 @@ class RankCheckerApp(QWidget):
                     excel_data.append({
                         "검색어": keyword,
                         "순위": "",
-                        "상품명": "검색 결과 없음",
+                        "상품명": result,
                         "판매처": "",
                         "브랜드": "",
                         "상품타입": "",
@@ -1680,6 +2271,7 @@ class RankCheckerApp(QWidget):
                     })
             
             # DataFrame 생성
+            import pandas as pd
             df = pd.DataFrame(excel_data)
             
             # 엑셀 저장
@@ -1716,124 +2308,146 @@ class RankCheckerApp(QWidget):
             QMessageBox.warning(self, "API 설정 오류", "먼저 설정 탭에서 API 키를 인증하세요.")
             return
         
-        self.track_button.setEnabled(False)
-        self.tracking_status.setText("🔄 순위 확인 중...")
-        QApplication.processEvents()
+        self.start_tracking_worker([{"keyword": keyword, "mall_name": mall_name, "product_name": product_name}])
+    
+    def check_all_tracking_targets(self):
+        """저장된 모든 추적 대상을 검색어별로 한 번씩만 스캔하여 순위 기록"""
+        if not client_id or not client_secret:
+            QMessageBox.warning(self, "API 설정 오류", "먼저 설정 탭에서 API 키를 인증하세요.")
+            return
         
-        # 순위 조회
-        product = get_product_rank(keyword, mall_name, product_name)
+        tracking_targets = get_tracking_store().targets()
+        if not tracking_targets:
+            QMessageBox.information(self, "추적 대상 없음", "저장된 추적 대상이 없습니다.")
+            return
         
-        if product:
-            # 추적 데이터 저장
-            tracking_data = load_tracking_data()
-            tracking_key = f"{keyword}_{mall_name}"
-            
-            if tracking_key not in tracking_data:
-                tracking_data[tracking_key] = {
-                    "keyword": keyword,
-                    "mall_name": mall_name,
-                    "product_name": product_name,
-                    "history": []
-                }
-            
-            # 현재 순위 기록
-            record = {
-                "datetime": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-                "rank": product["rank"],
-                "title": product["title"],
-                "price": product["price"]
-            }
-            
-            tracking_data[tracking_key]["history"].append(record)
-            save_tracking_data(tracking_data)
-            
-            # 알림 체크
-            if self.alert_enabled.isChecked():
-                target_rank = self.alert_target_rank.value()
-                if product["rank"] <= target_rank:
-                    QMessageBox.information(
-                        self,
-                        "🎉 목표 달성!",
-                        f"축하합니다! 목표 순위 {target_rank}위를 달성했습니다.\n\n"
-                        f"현재 순위: {product['rank']}위\n"
-                        f"상품명: {product['title']}"
-                    )
-            
+        self.start_tracking_worker(tracking_targets)
+    
+    def start_tracking_worker(self, entries):
+        """추적 대상 목록을 백그라운드에서 확인"""
+        worker = TrackingWorker(entries, self.ui_updates)
+        self.ui_updates.subscribe(worker, on_progress=self.on_tracking_progress)
+        worker.finished_all.connect(
+            lambda records, errors, worker=worker: self.on_tracking_finished(worker, entries, records, errors)
+        )
+        worker.finished.connect(lambda worker=worker: self.tracking_workers.discard(worker))
+        self.tracking_workers.add(worker)
+        self.stop_tracking_button.setEnabled(True)
+        self.tracking_status.setText("🔄 순위 확인 중..." + self.running_text(self.tracking_workers))
+        worker.start()
+    
+    def on_tracking_progress(self, percent, keyword):
+        if keyword:
             self.tracking_status.setText(
-                f"✅ 순위 확인 완료! 현재 순위: {product['rank']}위 | "
-                f"상품명: {product['title'][:30]}..."
+                f"🔄 {keyword} 확인 중... ({percent}%)" + self.running_text(self.tracking_workers)
             )
+    
+    @staticmethod
+    def running_text(workers):
+        running = sum(1 for worker in workers if worker.isRunning())
+        return f" | 진행 중 {running}개" if running > 1 else ""
+    
+    def stop_tracking(self):
+        """실행 중인 순위 추적 중지 (그때까지 찾은 순위는 기록)"""
+        for worker in list(self.tracking_workers):
+            worker.cancel()
+        self.tracking_status.setText("⏹ 중지 요청됨 - 진행 중인 페이지를 마무리하는 중...")
+    
+    def on_tracking_finished(self, worker, entries, records, errors):
+        """순위 추적 Worker 완료 처리"""
+        self.ui_updates.unsubscribe(worker)
+        if not any(w.isRunning() for w in self.tracking_workers if w is not worker):
+            self.stop_tracking_button.setEnabled(False)
+        failed_text = f" | ⚠️ 조회 실패: {', '.join(errors)}" if errors else ""
+        cancelled_text = " (중지됨)" if worker.cancelled else ""
+        
+        if len(entries) == 1:
+            entry = entries[0]
+            if errors:
+                error = next(iter(errors.values()))
+                self.tracking_status.setText(f"⚠️ 순위 조회 실패: {error}")
+                QMessageBox.critical(self, "조회 실패", f"네이버 API 호출에 실패했습니다.\n{error}")
+            elif records:
+                product = records[0][3]
+                # 알림 체크
+                if self.alert_enabled.isChecked():
+                    target_rank = self.alert_target_rank.value()
+                    if product["rank"] <= target_rank:
+                        QMessageBox.information(
+                            self,
+                            "🎉 목표 달성!",
+                            f"축하합니다! 목표 순위 {target_rank}위를 달성했습니다.\n\n"
+                            f"현재 순위: {product['rank']}위\n"
+                            f"상품명: {product['title']}"
+                        )
+                
+                self.tracking_status.setText(
+                    f"✅ 순위 확인 완료! [{entry['keyword']}] 현재 순위: {product['rank']}위 | "
+                    f"상품명: {product['title'][:30]}..."
+                )
+            elif worker.cancelled:
+                self.tracking_status.setText("⏹ 순위 확인이 중지되었습니다.")
+            else:
+                self.tracking_status.setText("❌ 검색 결과를 찾을 수 없습니다.")
+                QMessageBox.warning(self, "결과 없음", "해당 조건의 상품을 찾을 수 없습니다.")
         else:
-            self.tracking_status.setText("❌ 검색 결과를 찾을 수 없습니다.")
-            QMessageBox.warning(self, "결과 없음", "해당 조건의 상품을 찾을 수 없습니다.")
-        
-        self.track_button.setEnabled(True)
+            self.tracking_status.setText(
+                f"✅ 전체 체크 완료{cancelled_text}! 검색어 {len(worker.groups)}개 | "
+                f"대상 {len(entries)}개 중 {len(records)}개 순위 기록" + failed_text
+            )
         
         # 그래프 및 테이블 업데이트
         self.load_tracking_data()
     
+    def ensure_tracking_chart(self):
+        """순위 추이 그래프를 처음 사용할 때 생성"""
+        if self.tracking_chart is not None:
+            return
+        self.tracking_chart = TrackingChart()
+        self.tracking_graph_layout.replaceWidget(self.tracking_chart_placeholder, self.tracking_chart.canvas)
+        self.tracking_chart_placeholder.deleteLater()
+    
     def load_tracking_data(self):
-        """추적 데이터 로드 및 표시"""
+        """추적 데이터 로드 및 표시
+        
+        같은 대상을 다시 불러오면 그래프와 표에 새 기록만 덧붙이고,
+        대상이 바뀌었거나 기록 순서가 맞지 않으면 전체를 다시 채웁니다.
+        """
         keyword = self.tracking_keyword.text().strip()
         mall_name = self.tracking_mall.text().strip()
         
         if not keyword or not mall_name:
             return
         
-        tracking_key = f"{keyword}_{mall_name}"
-        tracking_data = load_tracking_data()
-        
-        if tracking_key not in tracking_data:
-            self.tracking_table.setRowCount(0)
-            self.tracking_ax.clear()
-            try:
-                self.tracking_ax.set_xlabel("체크 횟수", fontsize=8, fontfamily='Malgun Gothic')
-                self.tracking_ax.set_ylabel("순위", fontsize=8, fontfamily='Malgun Gothic')
-                self.tracking_ax.set_title("순위 추이", fontsize=10, fontweight='bold', fontfamily='Malgun Gothic')
-            except:
-                self.tracking_ax.set_xlabel("체크 횟수", fontsize=8)
-                self.tracking_ax.set_ylabel("순위", fontsize=8)
-                self.tracking_ax.set_title("순위 추이", fontsize=10, fontweight='bold')
-            self.tracking_ax.grid(True, alpha=0.3)
-            self.tracking_canvas.draw()
-            return
-        
-        history = tracking_data[tracking_key]["history"]
-        
-        if not history:
+        self.ensure_tracking_chart()
+        chart = self.tracking_chart
+        store = get_tracking_store()
+        key = (keyword, mall_name)
+        
+        if chart.key == key:
+            new_records = store.history(keyword, mall_name, offset=len(chart.series))
+            if new_records is not None:
+                if not new_records:
+                    return
+                # 새 기록이 마지막으로 표시한 기록보다 뒤일 때만 덧붙임
+                if not chart.series.times or parse_time(new_records[0]["datetime"]) >= chart.series.times[-1]:
+                    chart.append(new_records)
+                    self.append_tracking_rows(new_records)
+                    return
+        
+        history = store.history(keyword, mall_name)
+        if history is None:
+            self.tracking_model.clear()
+            chart.reset()
             return
-        
-        # 테이블 업데이트
-        self.tracking_table.setRowCount(len(history))
-        for i, record in enumerate(history):
-            self.tracking_table.setItem(i, 0, QTableWidgetItem(record["datetime"]))
-            self.tracking_table.setItem(i, 1, QTableWidgetItem(str(record["rank"])))
-            self.tracking_table.setItem(i, 2, QTableWidgetItem(record["title"][:50]))
-            self.tracking_table.setItem(i, 3, QTableWidgetItem(f"{record['price']:,}원"))
-        
-        # 그래프 업데이트
-        self.tracking_ax.clear()
-        dates = [record["datetime"] for record in history]
-        ranks = [record["rank"] for record in history]
-        
-        self.tracking_ax.plot(range(len(dates)), ranks, marker='o', linewidth=2, markersize=5, color='#4caf50')
-        
-        # 한글 폰트 설정
-        try:
-            self.tracking_ax.set_xlabel("체크 횟수", fontsize=8, fontfamily='Malgun Gothic')
-            self.tracking_ax.set_ylabel("순위", fontsize=8, fontfamily='Malgun Gothic')
-            title_text = f"{keyword}\n({mall_name})" if len(keyword) + len(mall_name) > 20 else f"순위 추이 - {keyword} ({mall_name})"
-            self.tracking_ax.set_title(title_text, fontsize=10, fontweight='bold', fontfamily='Malgun Gothic')
-        except:
-            self.tracking_ax.set_xlabel("체크 횟수", fontsize=8)
-            self.tracking_ax.set_ylabel("순위", fontsize=8)
-            title_text = f"{keyword}\n({mall_name})" if len(keyword) + len(mall_name) > 20 else f"순위 추이 - {keyword} ({mall_name})"
-            self.tracking_ax.set_title(title_text, fontsize=10, fontweight='bold')
-        
-        self.tracking_ax.grid(True, alpha=0.3)
-        self.tracking_ax.invert_yaxis()  # 순위는 낮을수록 좋으므로 Y축 반전
-        self.tracking_figure.tight_layout()
-        self.tracking_canvas.draw()
+        chart.reset(key, history)
+        self.tracking_model.set_rows(map(TrackingHistoryModel.make_row, history))
+        self.tracking_table.scrollToBottom()
+    
+    def append_tracking_rows(self, records):
+        """추적 이력 표 끝에 기록 추가"""
+        self.tracking_model.append_rows(map(TrackingHistoryModel.make_row, records))
+        self.tracking_table.scrollToBottom()
     
     def clear_tracking_data(self):
         """추적 데이터 초기화"""
@@ -1845,20 +2459,10 @@ class RankCheckerApp(QWidget):
         )
         
         if reply == QMessageBox.StandardButton.Yes:
-            if os.path.exists(RANK_TRACKING_FILE):
-                os.remove(RANK_TRACKING_FILE)
-            self.tracking_table.setRowCount(0)
-            self.tracking_ax.clear()
-            try:
-                self.tracking_ax.set_xlabel("체크 횟수", fontsize=8, fontfamily='Malgun Gothic')
-                self.tracking_ax.set_ylabel("순위", fontsize=8, fontfamily='Malgun Gothic')
-                self.tracking_ax.set_title("순위 추이", fontsize=10, fontweight='bold', fontfamily='Malgun Gothic')
-            except:
-                self.tracking_ax.set_xlabel("체크 횟수", fontsize=8)
-                self.tracking_ax.set_ylabel("순위", fontsize=8)
-                self.tracking_ax.set_title("순위 추이", fontsize=10, fontweight='bold')
-            self.tracking_ax.grid(True, alpha=0.3)
-            self.tracking_canvas.draw()
+            get_tracking_store().clear()
+            self.ensure_tracking_chart()
+            self.tracking_model.clear()
+            self.tracking_chart.reset()
             self.tracking_status.setText("🗑️ 추적 데이터가 초기화되었습니다.")
             QMessageBox.information(self, "완료", "추적 데이터가 초기화되었습니다.")
     
@@ -1875,103 +2479,68 @@ class RankCheckerApp(QWidget):
             QMessageBox.warning(self, "API 설정 오류", "먼저 설정 탭에서 API 키를 인증하세요.")
             return
         
-        self.analyze_button.setEnabled(False)
         self.competitor_progress.setVisible(True)
         self.competitor_progress.setValue(0)
-        self.competitor_status.setText("🔄 경쟁사 분석 중...")
-        QApplication.processEvents()
-        
-        # 입력한 판매처의 상품과 주변 경쟁사 상품들 찾기
-        self.competitor_progress.setValue(30)
-        self.competitor_status.setText(f"🔄 {mall_name} 상품 검색 중...")
-        QApplication.processEvents()
-        
-        target_product, competitors = get_competitor_products(keyword, mall_name, competitor_count=10)
         
+        worker = CompetitorWorker(keyword, mall_name, self.ui_updates, competitor_count=10)
+        self.ui_updates.subscribe(worker, on_progress=self.on_competitor_progress)
+        worker.finished_result.connect(self.on_competitor_analysis_finished)
+        worker.error_occurred.connect(self.on_competitor_analysis_error)
+        worker.finished.connect(lambda worker=worker: self.on_competitor_worker_done(worker))
+        self.competitor_workers.add(worker)
+        self.stop_competitor_button.setEnabled(True)
+        self.competitor_status.setText(
+            f"🔄 {mall_name} 상품 검색 중..." + self.running_text(self.competitor_workers)
+        )
+        worker.start()
+    
+    def on_competitor_progress(self, percent, message):
+        self.competitor_progress.setValue(percent)
+        self.competitor_status.setText(f"🔄 경쟁사 분석 중... {message}" + self.running_text(self.competitor_workers))
+    
+    def stop_competitor_analysis(self):
+        """실행 중인 경쟁사 분석 중지"""
+        for worker in list(self.competitor_workers):
+            worker.cancel()
+        self.competitor_status.setText("⏹ 경쟁사 분석이 중지되었습니다.")
+    
+    def on_competitor_worker_done(self, worker):
+        self.ui_updates.unsubscribe(worker, deliver=False)
+        self.competitor_workers.discard(worker)
+        if not self.competitor_workers:
+            self.stop_competitor_button.setEnabled(False)
+            self.competitor_progress.setVisible(False)
+    
+    def on_competitor_analysis_error(self, keyword, error):
+        self.ui_updates.flush()  # 남은 진행률이 오류 표시를 덮지 않도록 먼저 반영
+        self.competitor_status.setText(f"⚠️ 경쟁사 조회 실패 ({keyword}): {error}")
+        QMessageBox.critical(self, "조회 실패", f"네이버 API 호출에 실패했습니다.\n{error}")
+    
+    def on_competitor_analysis_finished(self, keyword, mall_name, target_product, competitors):
+        """경쟁사 분석 결과 표시"""
+        self.ui_updates.flush()  # 남은 진행률이 결과 표시를 덮지 않도록 먼저 반영
         if not target_product:
+            self.competitor_status.setText(f"❌ '{mall_name}' 판매처의 상품을 찾을 수 없습니다. ({keyword})")
             QMessageBox.warning(self, "검색 실패", f"'{mall_name}' 판매처의 상품을 찾을 수 없습니다.")
-            self.competitor_progress.setValue(0)
-            self.competitor_progress.setVisible(False)
-            self.analyze_button.setEnabled(True)
             return
         
-        # 결과 준비 (타겟 상품 + 경쟁사 상품들)
-        results = []
-        
-        # 타겟 상품 추가 (강조 표시용)
-        results.append({
-            "mall": target_product["mallName"],
-            "rank": target_product["rank"],
-            "title": target_product["title"],
-            "price": target_product["price"],
-            "is_target": True
-        })
-        
-        # 경쟁사 상품들 추가
-        for comp in competitors:
-            results.append({
-                "mall": comp["mallName"],
-                "rank": comp["rank"],
-                "title": comp["title"],
-                "price": comp["price"],
-                "is_target": False
-            })
-        
-        # 순위 순으로 정렬
-        results.sort(key=lambda x: x["rank"])
-        
-        # 결과 표시
-        self.competitor_table.setRowCount(len(results))
-        
-        # 폰트 설정
-        bold_font = QFont()
-        bold_font.setBold(True)
+        # 결과 준비 (타겟 상품 + 경쟁사 상품들, 순위 순)
+        results = [(target_product["mallName"], target_product["rank"], target_product["title"],
+                    target_product["price"], True)]
+        results.extend((comp["mallName"], comp["rank"], comp["title"], comp["price"], False) for comp in competitors)
+        results.sort(key=lambda result: result[1])
         
-        for i, result in enumerate(results):
-            # 판매처명
-            mall_item = QTableWidgetItem(result["mall"])
-            if result["is_target"]:
-                mall_item.setFont(bold_font)
-                mall_item.setForeground(QColor(0, 100, 0))  # 진한 녹색
-            self.competitor_table.setItem(i, 0, mall_item)
-            
-            # 순위
-            rank_item = QTableWidgetItem(str(result["rank"]))
-            rank_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            if result["is_target"]:
-                rank_item.setFont(bold_font)
-                rank_item.setForeground(QColor(0, 100, 0))  # 진한 녹색
-            elif result["rank"] <= 10:
-                rank_item.setForeground(QColor(0, 128, 0))  # darkGreen
-            elif result["rank"] <= 50:
-                rank_item.setForeground(QColor(184, 134, 11))  # darkYellow
-            elif result["rank"] <= 100:
-                rank_item.setForeground(QColor(255, 140, 0))  # orange
-            self.competitor_table.setItem(i, 1, rank_item)
-            
-            # 상품명
-            title_item = QTableWidgetItem(result["title"][:60] + "..." if len(result["title"]) > 60 else result["title"])
-            if result["is_target"]:
-                title_item.setFont(bold_font)
-            self.competitor_table.setItem(i, 2, title_item)
-            
-            # 가격
-            if result["price"] > 0:
-                price_item = QTableWidgetItem(f"{result['price']:,}원")
-                price_item.setTextAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
-                if result["is_target"]:
-                    price_item.setFont(bold_font)
-                self.competitor_table.setItem(i, 3, price_item)
-            else:
-                self.competitor_table.setItem(i, 3, QTableWidgetItem("-"))
+        # 결과 표시 (모델이 보이는 셀만 글자/색을 계산)
+        self.competitor_model.set_rows(results)
         
         # 통계 정보 표시
-        avg_price = sum(r["price"] for r in results if r["price"] > 0) / len([r for r in results if r["price"] > 0]) if results else 0
+        prices = [result[3] for result in results if result[3] > 0]
+        avg_price = sum(prices) / len(prices) if prices else 0
         target_price = target_product["price"]
         price_diff = avg_price - target_price if avg_price > 0 else 0
         
         status_text = (
-            f"✅ 분석 완료! | "
+            f"✅ 분석 완료! [{keyword}] | "
             f"타겟: {target_product['mallName']} ({target_product['rank']}위, {target_price:,}원) | "
             f"경쟁사: {len(competitors)}개 | "
             f"평균 가격: {avg_price:,.0f}원"
@@ -1979,9 +2548,8 @@ class RankCheckerApp(QWidget):
         if price_diff != 0:
             status_text += f" ({'+' if price_diff > 0 else ''}{price_diff:,.0f}원)"
         
-        self.competitor_status.setText(status_text)
+        self.competitor_status.setText(status_text + self.running_text(self.competitor_workers))
         self.competitor_progress.setValue(100)
-        self.analyze_button.setEnabled(True)
 
 if __name__ == "__main__":
     app = QApplication(sys.argv)
@@ -0,0 +1,7 @@
+"""
+네이버 쇼핑 순위 확인 엔진
+
+데스크톱 앱, Streamlit 앱, 명령행 도구(python -m naver_rank)가 함께 사용하는
+검색 클라이언트, 순위 스캔, 대량 확인, 추적 저장소 모듈입니다.
+PySide6/Streamlit/matplotlib 없이 가져올 수 있습니다.
+"""
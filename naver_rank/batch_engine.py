@@ -0,0 +1,165 @@
+"""
+대량 검색어 순위 확인 엔진
+
+수백 개의 검색어를 Worker 풀에 나눠 확인하고, 끝나는 순서대로 결과를 돌려줍니다.
+API 호출 속도는 공용 클라이언트의 토큰 버킷이 전체적으로 제한합니다.
+완료된 검색어는 체크포인트 파일에 바로 기록되므로, 중간에 끊긴 배치를
+같은 검색어/판매처로 다시 실행하면 남은 검색어부터 이어서 확인합니다.
+순위는 시간이 지나면 바뀌므로 CHECKPOINT_MAX_AGE보다 오래된 결과는 이어받지 않고 다시 확인합니다.
+"""
+
+import hashlib
+import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from .cancellation import CancelToken, CancelledError
+from .rank_scanner import find_top_product
+
+DEFAULT_WORKERS = 4
+CHECKPOINT_DIR = "batch_checkpoints"
+CHECKPOINT_MAX_AGE = 60 * 60  # 초 (이보다 오래된 체크포인트 결과는 다시 확인)
+
+
+def parse_keywords(text):
+    """쉼표 또는 줄바꿈으로 구분된 검색어 목록 (중복 제거, 입력 순서 유지)"""
+    keywords = [k.strip() for k in text.replace("\n", ",").split(",")]
+    return list(dict.fromkeys(k for k in keywords if k))
+
+
+class BatchRankChecker:
+    """검색어 목록 × 판매처 하나의 순위 확인 배치
+
+    resume=False면 체크포인트를 지우고 모든 검색어를 처음부터 확인합니다.
+    """
+
+    def __init__(self, keywords, mall_name, credentials, workers=DEFAULT_WORKERS,
+                 checkpoint_dir=CHECKPOINT_DIR, cancel_token=None, resume=True,
+                 checkpoint_max_age=CHECKPOINT_MAX_AGE):
+        self.keywords = list(dict.fromkeys(keywords))
+        self.mall_name = mall_name
+        self.credentials = credentials
+        self.workers = workers
+        self.resume = resume
+        self.checkpoint_max_age = checkpoint_max_age
+        self.errors = {}
+        self.cancel_token = cancel_token if cancel_token is not None else CancelToken()
+
+        batch_key = "\n".join([mall_name] + self.keywords).encode("utf-8")
+        self.batch_id = hashlib.sha1(batch_key).hexdigest()[:12]
+        self.checkpoint_path = (
+            os.path.join(checkpoint_dir, f"batch_{self.batch_id}.jsonl") if checkpoint_dir else None
+        )
+
+    def cancel(self):
+        """남은 검색어 확인 중단 (진행 중인 검색어도 다음 페이지 요청부터 멈춤)"""
+        self.cancel_token.cancel()
+
+    @property
+    def cancelled(self):
+        return self.cancel_token.cancelled
+
+    def load_checkpoint(self):
+        """이전에 완료된 검색어 결과 {검색어: 결과}
+
+        checkpoint_max_age보다 오래된 결과(확인 시각이 없는 예전 형식 포함)는 제외하고,
+        남은 결과가 없으면 체크포인트 파일을 지웁니다.
+        """
+        done = {}
+        if not self.checkpoint_path or not os.path.exists(self.checkpoint_path):
+            return done
+        oldest = time.time() - self.checkpoint_max_age
+        try:
+            with open(self.checkpoint_path, "r", encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except json.JSONDecodeError:
+                        continue  # 중단 시점에 잘린 마지막 줄
+                    if entry.get("checked_at", 0) < oldest:
+                        continue
+                    done[entry["keyword"]] = entry["result"]
+        except OSError as e:
+            print(f"⚠️ 체크포인트 로드 실패: {e}")
+            return done
+        if not done:
+            self._remove_checkpoint()
+        return done
+
+    def _append_checkpoint(self, keyword, result):
+        if not self.checkpoint_path:
+            return
+        entry = {"keyword": keyword, "result": result, "checked_at": time.time()}
+        try:
+            os.makedirs(os.path.dirname(self.checkpoint_path) or ".", exist_ok=True)
+            with open(self.checkpoint_path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+        except OSError as e:
+            print(f"⚠️ 체크포인트 저장 실패: {e}")
+
+    def _remove_checkpoint(self):
+        if self.checkpoint_path and os.path.exists(self.checkpoint_path):
+            try:
+                os.remove(self.checkpoint_path)
+            except OSError as e:
+                print(f"⚠️ 체크포인트 삭제 실패: {e}")
+
+    def _check(self, keyword):
+        if self.cancelled:
+            return None
+        try:
+            return find_top_product(keyword, self.mall_name, self.credentials, cancel=self.cancel_token)
+        except CancelledError:
+            return None  # 취소 후에는 결과를 기록하지 않으므로 다시 실행하면 재확인
+        except Exception as e:
+            print(f"⚠️ 검색 중 오류 발생 ({keyword}): {e}")
+            self.errors[keyword] = str(e)
+            return None
+
+    def iter_results(self):
+        """(검색어, 결과) 를 끝나는 순서대로 반환하는 제너레이터
+
+        결과는 상품 정보 dict 또는 None(검색 결과 없음)입니다.
+        체크포인트에 있던 결과가 먼저 나옵니다. (resume=False면 체크포인트를 지우고 시작)
+        """
+        if not self.resume:
+            self._remove_checkpoint()
+        done = self.load_checkpoint()
+        for keyword in self.keywords:
+            if keyword in done:
+                yield keyword, done[keyword]
+
+        pending = [k for k in self.keywords if k not in done]
+        if not pending:
+            self._remove_checkpoint()
+            return
+
+        pool = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="batch-keyword")
+        futures = {pool.submit(self._check, keyword): keyword for keyword in pending}
+        completed = 0
+        try:
+            for future in as_completed(futures):
+                if self.cancelled:
+                    break
+                keyword = futures[future]
+                result = future.result()
+                # 오류가 난 검색어는 기록하지 않아 다시 실행할 때 재시도
+                if keyword not in self.errors:
+                    self._append_checkpoint(keyword, result)
+                completed += 1
+                yield keyword, result
+        finally:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+        if completed == len(pending) and not self.errors:
+            self._remove_checkpoint()
+
+    def run(self, on_result=None):
+        """배치 전체 실행 후 {검색어: 결과} 반환, on_result(검색어, 결과)로 중간 결과 전달"""
+        results = {}
+        for keyword, result in self.iter_results():
+            results[keyword] = result
+            if on_result:
+                on_result(keyword, result)
+        return results
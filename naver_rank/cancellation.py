@@ -0,0 +1,40 @@
+"""
+작업 취소 토큰
+
+Worker 스레드를 강제로 끝내면(QThread.terminate) 읽던 소켓이 연결 풀에 돌아가지 않고
+결과도 반쯤 남습니다. 대신 토큰으로 취소를 요청하면 검색 클라이언트가
+새 요청을 보내지 않고, 대기(속도 제한/재시도 백오프) 중이면 바로 빠져나옵니다.
+이미 보낸 요청은 응답을 끝까지 받아 연결을 풀에 돌려준 뒤 결과만 버립니다.
+"""
+
+import threading
+import time
+
+
+class CancelledError(Exception):
+    """취소된 작업에서 더 이상 요청하지 않음"""
+
+
+class CancelToken(threading.Event):
+    """작업 하나의 취소 상태 (threading.Event를 받는 곳에도 그대로 사용 가능)"""
+
+    def cancel(self):
+        self.set()
+
+    @property
+    def cancelled(self):
+        return self.is_set()
+
+
+def check_cancelled(cancel):
+    """cancel(CancelToken 또는 threading.Event)이 설정되어 있으면 CancelledError"""
+    if cancel is not None and cancel.is_set():
+        raise CancelledError()
+
+
+def sleep(seconds, cancel=None):
+    """취소되면 바로 깨어나는 time.sleep"""
+    if cancel is None:
+        time.sleep(seconds)
+    elif cancel.wait(seconds):
+        raise CancelledError()
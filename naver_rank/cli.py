@@ -0,0 +1,237 @@
+"""
+명령행 도구 (화면 없는 서버/cron 실행용)
+
+    python -m naver_rank check -i targets.xlsx -o result.csv
+    python -m naver_rank check -k "키보드,마우스" -m "OO스토어" -o result.jsonl
+    python -m naver_rank track --interval 3600
+    python -m naver_rank products -k "키보드" -n 1000 -o products.xlsx
+
+check: CSV/XLSX의 (검색어, 판매처, 상품명) 목록을 동시에 스캔해 CSV/XLSX/JSONL로 저장
+track: 저장된 추적 대상을 주기적으로 확인해 추적 저장소에 기록
+products: 검색어의 1위~n위 상품 리스트를 받은 페이지부터 CSV/XLSX로 저장
+"""
+
+import argparse
+import csv
+import json
+import os
+import signal
+import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime
+
+from .batch_engine import DEFAULT_WORKERS, parse_keywords
+from .config import API_CONFIG_FILE, load_credentials
+from .naver_client import MAX_RANK, PAGE_SIZE
+from .product_export import ProductListWriter, export_format
+from .rank_scanner import RankTarget, iter_product_list, scan_ranks, product_info
+from .tracking_daemon import DEFAULT_INTERVAL, TrackingScheduler
+from .tracking_store import get_tracking_store
+
+KEYWORD_COLUMNS = ("keyword", "검색어")
+MALL_COLUMNS = ("mall_name", "mall", "판매처명", "판매처")
+PRODUCT_COLUMNS = ("product_name", "상품명")
+
+OUTPUT_COLUMNS = [
+    "keyword", "mall_name", "product_name", "rank", "title", "price",
+    "link", "mallName", "brand", "category", "checked_at", "error",
+]
+OUTPUT_FORMATS = ("csv", "xlsx", "jsonl")
+
+
+def _pick(row, names):
+    for name in names:
+        value = row.get(name)
+        if value is not None and str(value).strip():
+            return str(value).strip()
+    return ""
+
+
+def read_targets(path, default_mall=""):
+    """CSV/XLSX 파일에서 (검색어, RankTarget) 목록 읽기
+
+    열 이름은 keyword/검색어, mall_name/판매처명, product_name/상품명을 인식합니다.
+    판매처 열이 없거나 비어 있으면 default_mall을 사용합니다.
+    """
+    if path.lower().endswith((".xlsx", ".xls")):
+        import pandas as pd
+        rows = pd.read_excel(path, dtype=str).fillna("").to_dict("records")
+    else:
+        with open(path, "r", encoding="utf-8-sig", newline="") as f:
+            rows = list(csv.DictReader(f))
+
+    targets = []
+    for row in rows:
+        keyword = _pick(row, KEYWORD_COLUMNS)
+        mall_name = _pick(row, MALL_COLUMNS) or default_mall
+        if keyword and mall_name:
+            targets.append((keyword, RankTarget(mall_name, _pick(row, PRODUCT_COLUMNS))))
+    return targets
+
+
+def check_targets(targets, credentials, workers=DEFAULT_WORKERS):
+    """검색어별로 묶어 동시에 스캔하고 결과 행(dict)을 끝나는 순서대로 반환"""
+    by_keyword = {}
+    for keyword, target in targets:
+        by_keyword.setdefault(keyword, []).append(target)
+
+    def scan(keyword):
+        return scan_ranks(keyword, credentials, by_keyword[keyword])[0]
+
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="cli-keyword") as pool:
+        futures = {pool.submit(scan, keyword): keyword for keyword in by_keyword}
+        for future in as_completed(futures):
+            keyword = futures[future]
+            checked_at = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            try:
+                best, error = future.result(), ""
+            except Exception as e:
+                best, error = {}, str(e)
+            for target in dict.fromkeys(by_keyword[keyword]):
+                row = dict.fromkeys(OUTPUT_COLUMNS, "")
+                row.update(keyword=keyword, mall_name=target.mall_name,
+                           product_name=target.product_name, checked_at=checked_at, error=error)
+                if target in best:
+                    row.update(product_info(best[target]))
+                yield row
+
+
+class ResultWriter:
+    """결과 행 저장 (CSV/JSONL은 한 행씩 바로 기록, XLSX는 끝나고 한 번에 기록)"""
+
+    def __init__(self, path, fmt):
+        self.path = path
+        self.fmt = fmt
+        self._rows = []
+        self._file = None
+        self._csv = None
+        if fmt != "xlsx":
+            if path == "-":
+                self._file = sys.stdout
+            else:
+                # CSV는 엑셀에서 한글이 깨지지 않도록 BOM 포함
+                encoding = "utf-8-sig" if fmt == "csv" else "utf-8"
+                self._file = open(path, "w", encoding=encoding, newline="")
+            if fmt == "csv":
+                self._csv = csv.DictWriter(self._file, fieldnames=OUTPUT_COLUMNS)
+                self._csv.writeheader()
+
+    def write(self, row):
+        if self.fmt == "csv":
+            self._csv.writerow(row)
+        elif self.fmt == "jsonl":
+            self._file.write(json.dumps(row, ensure_ascii=False) + "\n")
+        else:
+            self._rows.append(row)
+            return
+        self._file.flush()
+
+    def close(self):
+        if self.fmt == "xlsx":
+            import pandas as pd
+            pd.DataFrame(self._rows, columns=OUTPUT_COLUMNS).to_excel(self.path, index=False, engine="openpyxl")
+        elif self._file is not sys.stdout:
+            self._file.close()
+
+
+def output_format(path, fmt=None):
+    if fmt:
+        return fmt
+    ext = os.path.splitext(path)[1].lower().lstrip(".")
+    return ext if ext in OUTPUT_FORMATS else "jsonl"
+
+
+def cmd_check(args):
+    credentials = load_credentials(args.config)
+
+    targets = []
+    if args.input:
+        targets.extend(read_targets(args.input, default_mall=args.mall or ""))
+    if args.keywords:
+        if not args.mall:
+            raise SystemExit("--keywords를 사용할 때는 --mall이 필요합니다.")
+        targets.extend((keyword, RankTarget(args.mall, args.product or "")) for keyword in parse_keywords(args.keywords))
+    if not targets:
+        raise SystemExit("확인할 대상이 없습니다. --input 또는 --keywords/--mall을 지정하세요.")
+
+    fmt = output_format(args.output, args.format)
+    if fmt == "xlsx" and args.output == "-":
+        raise SystemExit("XLSX는 표준 출력으로 쓸 수 없습니다. -o로 파일 경로를 지정하세요.")
+
+    writer = ResultWriter(args.output, fmt)
+    found = failed = total = 0
+    try:
+        for row in check_targets(targets, credentials, workers=args.workers):
+            writer.write(row)
+            total += 1
+            found += row["rank"] != ""
+            failed += bool(row["error"])
+    finally:
+        writer.close()
+
+    print(f"✅ 대상 {total}개 중 {found}개 순위 확인, 조회 실패 {failed}개", file=sys.stderr)
+    return 1 if failed else 0
+
+
+def cmd_track(args):
+    credentials = load_credentials(args.config)
+    scheduler = TrackingScheduler(credentials, interval=args.interval)
+    if args.once:
+        scheduler.run_cycle(spread=False)
+        return 0
+
+    signal.signal(signal.SIGINT, lambda *_: scheduler.stop())
+    signal.signal(signal.SIGTERM, lambda *_: scheduler.stop())
+    print(f"🔄 순위 추적 스케줄러 시작 (주기 {args.interval}초, Ctrl+C로 종료)")
+    scheduler.run_forever()
+    get_tracking_store().close()
+    return 0
+
+
+def cmd_products(args):
+    credentials = load_credentials(args.config)
+    max_rank = max(1, min(args.max_rank, MAX_RANK))
+    with ProductListWriter(args.output, args.format or export_format(args.output)) as writer:
+        for start, products in iter_product_list(args.keyword, credentials, max_rank=max_rank):
+            writer.write_page(products)
+            print(f"🔄 {min(start + PAGE_SIZE - 1, max_rank)}위까지 수집 ({writer.count}개)", file=sys.stderr)
+    print(f"✅ 상품 {writer.count}개 저장: {args.output}", file=sys.stderr)
+    return 0
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="naver_rank", description="네이버 쇼핑 순위 확인 도구")
+    parser.add_argument("--config", default=API_CONFIG_FILE, help="API 설정 파일 경로 (기본: api_config.json)")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    check = sub.add_parser("check", help="검색어/판매처 목록의 순위 확인")
+    check.add_argument("-i", "--input", help="대상 목록 CSV/XLSX (열: 검색어, 판매처명, 상품명)")
+    check.add_argument("-k", "--keywords", help="쉼표로 구분한 검색어 목록")
+    check.add_argument("-m", "--mall", help="판매처명 (--keywords 사용 시 또는 입력 파일에 판매처가 없을 때)")
+    check.add_argument("-p", "--product", help="상품명 필터 (--keywords 사용 시)")
+    check.add_argument("-o", "--output", default="-", help="결과 파일 경로 (기본: 표준 출력)")
+    check.add_argument("-f", "--format", choices=OUTPUT_FORMATS, help="결과 형식 (기본: 확장자로 판단)")
+    check.add_argument("-w", "--workers", type=int, default=DEFAULT_WORKERS, help="동시에 확인할 검색어 수")
+    check.set_defaults(func=cmd_check)
+
+    track = sub.add_parser("track", help="저장된 추적 대상을 주기적으로 확인")
+    track.add_argument("--interval", type=int, default=DEFAULT_INTERVAL, help="확인 주기 (초)")
+    track.add_argument("--once", action="store_true", help="모든 대상을 한 번 바로 확인하고 종료")
+    track.set_defaults(func=cmd_track)
+
+    products = sub.add_parser("products", help="검색어의 상품 리스트 저장 (최대 1000위)")
+    products.add_argument("-k", "--keyword", required=True, help="검색어")
+    products.add_argument("-n", "--max-rank", type=int, default=PAGE_SIZE, help=f"수집할 순위 (기본: {PAGE_SIZE}, 최대 {MAX_RANK})")
+    products.add_argument("-o", "--output", required=True, help="결과 파일 경로 (.csv 또는 .xlsx)")
+    products.add_argument("-f", "--format", choices=("csv", "xlsx"), help="결과 형식 (기본: 확장자로 판단)")
+    products.set_defaults(func=cmd_products)
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    try:
+        return args.func(args)
+    except ValueError as e:
+        print(f"⚠️ {e}", file=sys.stderr)
+        return 2
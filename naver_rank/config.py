@@ -0,0 +1,54 @@
+"""
+api_config.json 설정 불러오기 (UI 없이 실행하는 도구용)
+
+데스크톱/Streamlit 앱이 저장한 api_config.json을 읽어 공용 클라이언트와
+추적 저장소 설정을 적용하고, 검색에 사용할 인증 정보를 돌려줍니다.
+"""
+
+import json
+import os
+
+from .naver_client import get_client, DEFAULT_MAX_CONCURRENCY
+from .page_cache import DEFAULT_TTL, DEFAULT_DISK_PATH
+from .key_pool import get_key_pool, LEAST_USED
+from .tracking_store import set_tracking_backend, SQLITE_BACKEND
+
+API_CONFIG_FILE = "api_config.json"
+
+
+def load_config(config_path=API_CONFIG_FILE):
+    """설정 파일 내용 (없으면 빈 dict)"""
+    if not os.path.exists(config_path):
+        return {}
+    with open(config_path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def load_credentials(config_path=API_CONFIG_FILE):
+    """설정을 적용하고 인증 정보 반환
+
+    추가 키가 있으면 키 풀, 없으면 (client_id, client_secret)을 반환합니다.
+    설정 파일에 키가 없으면 NAVER_CLIENT_ID / NAVER_CLIENT_SECRET 환경 변수를 사용합니다.
+    """
+    config = load_config(config_path)
+
+    client = get_client()
+    client.max_concurrency = int(config.get("max_concurrency", DEFAULT_MAX_CONCURRENCY))
+    client.cache.ttl = int(config.get("cache_ttl", DEFAULT_TTL))
+    client.cache.set_disk_path(DEFAULT_DISK_PATH if config.get("cache_on_disk") else None)
+    set_tracking_backend(config.get("tracking_backend", SQLITE_BACKEND))
+
+    primary = (
+        config.get("client_id") or os.environ.get("NAVER_CLIENT_ID", ""),
+        config.get("client_secret") or os.environ.get("NAVER_CLIENT_SECRET", ""),
+    )
+    if not all(primary):
+        raise ValueError(
+            f"네이버 API 키가 없습니다. {config_path} 파일이나 "
+            "NAVER_CLIENT_ID / NAVER_CLIENT_SECRET 환경 변수를 설정하세요."
+        )
+    extra = [(c["client_id"], c["client_secret"]) for c in config.get("extra_credentials", [])]
+    if extra:
+        return get_key_pool([primary] + extra, strategy=config.get("key_strategy", LEAST_USED),
+                            quota=client.quota)
+    return primary
@@ -0,0 +1,143 @@
+"""
+네이버 API 키 인증 확인 (결과 캐시)
+
+인증 확인은 shop.json에 검색 요청을 한 번 보내는 방식이라 네트워크가 느리면 몇 초씩 걸립니다.
+인증 정보별 확인 결과를 유효 시간 동안 파일에 보관해 프로그램 시작이나 Streamlit 재실행마다
+다시 요청하지 않고, 확인이 필요하면 백그라운드 스레드에서 실행합니다.
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+from .naver_client import get_client
+from .rate_limiter import RetryPolicy
+
+DEFAULT_VALIDITY = 6 * 3600  # 인증 결과 유효 시간 (초)
+VERIFY_CACHE_FILE = "api_verify_cache.json"
+
+
+def _credential_key(credentials):
+    # 파일에 키 원문이 남지 않도록 해시로 저장
+    return hashlib.sha256(":".join(credentials).encode("utf-8")).hexdigest()
+
+
+class CredentialVerifier:
+    """인증 정보별 확인 결과 캐시 + 백그라운드 확인"""
+
+    def __init__(self, validity=DEFAULT_VALIDITY, path=VERIFY_CACHE_FILE):
+        self.validity = validity
+        self.path = path
+        self._results = {}  # key -> (확인 시각, 성공 여부)
+        self._pending = {}  # key -> 진행 중인 Future
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="verify-api")
+        self._load()
+
+    def _load(self):
+        if not self.path or not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                self._results = {k: tuple(v) for k, v in json.load(f).items()}
+        except Exception as e:
+            print(f"⚠️ 인증 확인 기록 로드 실패: {e}")
+
+    def _save(self):
+        if not self.path:
+            return
+        try:
+            with open(self.path, "w", encoding="utf-8") as f:
+                json.dump(self._results, f)
+        except OSError as e:
+            print(f"⚠️ 인증 확인 기록 저장 실패: {e}")
+
+    def cached(self, credentials):
+        """유효 시간 안의 확인 결과 (True/False), 없으면 None"""
+        with self._lock:
+            entry = self._results.get(_credential_key(credentials))
+        if entry is None or time.time() - entry[0] >= self.validity:
+            return None
+        return entry[1]
+
+    def invalidate(self, credentials):
+        with self._lock:
+            self._results.pop(_credential_key(credentials), None)
+            self._save()
+
+    @staticmethod
+    def _probe(credentials):
+        """간단한 검색 요청으로 인증 확인
+
+        성공하면 True, 401/403이면 False, 네트워크 오류 등 판단할 수 없으면 None입니다.
+        인증 확인은 사용자가 결과를 기다리므로 재시도하지 않고 한 번만 요청합니다.
+        """
+        try:
+            result = get_client().search("테스트", credentials, display=1, timeout=5, use_cache=False,
+                                         retry_policy=RetryPolicy(max_retries=0))
+            # 응답에 items가 있으면 인증 성공
+            return bool(result.get("items"))
+        except requests.HTTPError as e:
+            if e.response.status_code in (401, 403):
+                return False  # 인증 실패
+            print(f"⚠️ HTTP 오류: {e.response.status_code} - {e.response.reason}")
+        except Exception as e:
+            print(f"⚠️ API 인증 확인 중 오류: {e}")
+        return None
+
+    def verify(self, credentials, force=False):
+        """인증 확인 (유효한 캐시가 있으면 요청하지 않음)
+
+        True/False를 반환하며, 판단할 수 없는 오류는 False로 돌려주되 캐시하지 않습니다.
+        """
+        credentials = tuple(credentials)
+        if not force:
+            result = self.cached(credentials)
+            if result is not None:
+                return result
+        result = self._probe(credentials)
+        if result is None:
+            return False
+        with self._lock:
+            self._results[_credential_key(credentials)] = (time.time(), result)
+            self._save()
+        return result
+
+    def verify_async(self, credentials, force=False):
+        """백그라운드에서 인증 확인, 결과(True/False)를 담은 Future 반환
+
+        같은 인증 정보의 확인이 이미 진행 중이면 그 Future를 돌려줍니다.
+        """
+        credentials = tuple(credentials)
+        key = _credential_key(credentials)
+        with self._lock:
+            future = self._pending.get(key)
+            if future is not None:
+                return future
+            future = self._executor.submit(self.verify, credentials, force)
+            self._pending[key] = future
+        future.add_done_callback(lambda _: self._forget(key, future))
+        return future
+
+    def _forget(self, key, future):
+        with self._lock:
+            if self._pending.get(key) is future:
+                del self._pending[key]
+
+
+_verifier = None
+_verifier_lock = threading.Lock()
+
+
+def get_verifier():
+    """앱 전체에서 공유하는 인증 확인기"""
+    global _verifier
+    with _verifier_lock:
+        if _verifier is None:
+            _verifier = CredentialVerifier()
+        return _verifier
@@ -0,0 +1,173 @@
+"""
+검색 결과 item 정리
+
+API가 돌려주는 item(dict)은 상품명에 <b> 태그가 섞여 있고 가격이 문자열이며 카테고리가 네 칸으로
+나뉘어 있습니다. 페이지를 받으면 한 번에 Product 레코드 목록으로 바꿔 두고, 순위 스캔·상품 리스트·
+경쟁사 분석은 모두 이 레코드를 사용합니다. 태그 제거 정규식은 미리 컴파일해 두고 '<'가 없는
+상품명은 정규식을 거치지 않습니다.
+"""
+
+import re
+from array import array
+from collections import namedtuple
+
+TAG_RE = re.compile(r"<.*?>")
+
+
+class Product(namedtuple("Product", [
+    "rank", "title", "price", "link", "mall_name", "brand", "maker", "category", "image", "product_id",
+])):
+    """정리된 검색 결과 상품 한 개 (순위, 태그 없는 상품명, 정수 가격 ...)"""
+
+    __slots__ = ()
+
+
+def normalize_page(start, items):
+    """API 응답의 items 목록을 Product 목록으로 변환 (start는 첫 item의 순위)"""
+    sub = TAG_RE.sub
+    new = tuple.__new__  # Product(...)의 인자 처리를 건너뛰고 바로 생성
+    products = []
+    append = products.append
+    for rank, item in enumerate(items, start):
+        get = item.get
+        title = get("title") or ""
+        if "<" in title:
+            title = sub("", title)
+        lprice = get("lprice")
+        cat1, cat2, cat3 = get("category1"), get("category2"), get("category3")
+        if cat1 and cat2 and cat3:
+            category = f"{cat1} > {cat2} > {cat3}"
+        else:
+            category = " > ".join([c for c in (cat1, cat2, cat3) if c])
+        append(new(Product, (
+            rank,
+            title,
+            int(lprice) if lprice and lprice.isdigit() else 0,
+            get("link") or "",
+            get("mallName") or "",
+            get("brand") or "",
+            get("maker") or "",
+            category,
+            get("image") or "",
+            get("productId") or "",
+        )))
+    return products
+
+
+def normalize_item(rank, item):
+    """item 하나를 Product로 변환"""
+    return normalize_page(rank, [item])[0]
+
+
+def product_list_row(product):
+    """상품 리스트 표/엑셀용 행 (한글 열 이름)"""
+    return {
+        "순위": product.rank,
+        "상품명": product.title,
+        "가격": product.price,
+        "카테고리": product.category,
+        "판매처": product.mall_name,
+        "브랜드": product.brand,
+        "제조사": product.maker,
+        "상품링크": product.link,
+        "이미지": product.image,
+    }
+
+
+def unique_titles(products, seen=None):
+    """상품명이 같은 상품은 가장 높은 순위 하나만 남김
+
+    seen(이미 나온 상품명 집합)을 넘기면 페이지를 나눠 받을 때도 앞 페이지와 중복을 뺄 수 있습니다.
+    """
+    if seen is None:
+        seen = set()
+    unique = []
+    for product in products:
+        if product.title not in seen:
+            seen.add(product.title)
+            unique.append(product)
+    return unique
+
+
+class ProductColumns:
+    """스캔한 상품을 열(column)별로 보관하는 순위순 목록
+
+    상품마다 dict/튜플을 만들지 않고 열마다 리스트(가격은 정수 array) 하나에 모읍니다.
+    순위는 연속이므로 rank - first_rank가 곧 위치이고, 판매처별 순위 목록을 함께 만들어 두어
+    주변 순위 조회나 판매처 필터가 전체를 다시 훑지 않습니다.
+    Product를 돌려주는 순회·인덱싱은 기존 Product 목록처럼 사용할 수 있습니다.
+    """
+
+    __slots__ = ("first_rank", "titles", "prices", "links", "mall_names", "brands", "makers",
+                 "categories", "images", "product_ids", "mall_ranks")
+
+    def __init__(self, products=()):
+        self.first_rank = 1
+        self.titles = []
+        self.prices = array("q")
+        self.links = []
+        self.mall_names = []
+        self.brands = []
+        self.makers = []
+        self.categories = []
+        self.images = []
+        self.product_ids = []
+        self.mall_ranks = {}  # 판매처명 -> 그 판매처 상품의 순위 목록 (오름차순)
+        self.extend(products)
+
+    def extend(self, products):
+        """순위가 이어지는 Product 목록(한 페이지) 추가"""
+        if not products:
+            return
+        if not self.titles:
+            self.first_rank = products[0].rank
+        elif products[0].rank != self.first_rank + len(self.titles):
+            raise ValueError(f"순위가 이어지지 않습니다: {products[0].rank}위")
+        mall_ranks = self.mall_ranks
+        for product in products:
+            mall_ranks.setdefault(product.mall_name, []).append(product.rank)
+        _, titles, prices, links, malls, brands, makers, categories, images, ids = zip(*products)
+        self.titles.extend(titles)
+        self.prices.extend(prices)
+        self.links.extend(links)
+        self.mall_names.extend(malls)
+        self.brands.extend(brands)
+        self.makers.extend(makers)
+        self.categories.extend(categories)
+        self.images.extend(images)
+        self.product_ids.extend(ids)
+
+    def __len__(self):
+        return len(self.titles)
+
+    @property
+    def last_rank(self):
+        return self.first_rank + len(self.titles) - 1
+
+    def __contains__(self, rank):
+        return self.first_rank <= rank <= self.last_rank
+
+    def product(self, rank):
+        """rank위 Product (스캔하지 않은 순위면 IndexError)"""
+        if rank not in self:
+            raise IndexError(rank)
+        i = rank - self.first_rank
+        return Product(rank, self.titles[i], self.prices[i], self.links[i], self.mall_names[i], self.brands[i],
+                       self.makers[i], self.categories[i], self.images[i], self.product_ids[i])
+
+    def __getitem__(self, index):
+        # 목록처럼 0부터 시작하는 위치로 조회 (음수 위치 지원)
+        if index < 0:
+            index += len(self)
+        return self.product(self.first_rank + index)
+
+    def __iter__(self):
+        return (self.product(rank) for rank in self.ranks(self.first_rank, self.last_rank))
+
+    def ranks(self, low, high):
+        """low~high위 중 스캔한 순위 range"""
+        return range(max(low, self.first_rank), min(high, self.last_rank) + 1)
+
+    def malls_matching(self, mall_name):
+        """mall_name이 포함된 판매처명 집합 (판매처 종류 수만큼만 확인)"""
+        return {name for name in self.mall_ranks if name and mall_name in name}
@@ -0,0 +1,202 @@
+"""
+백그라운드 작업 실행기
+
+Streamlit은 위젯을 건드릴 때마다 스크립트를 처음부터 다시 실행하므로, 스크립트 안에서 돌던
+긴 스캔은 그때 끊깁니다. 스캔을 이 실행기의 스레드에 맡기면 화면은 작업을 등록하고 진행 상황과
+중간 결과만 읽어 그리면 되고, 다시 실행되거나 탭을 닫아도 스캔은 계속됩니다.
+실행기는 프로세스 전체에서 하나이므로 다른 사용자가 등록한 작업도 함께 보입니다.
+"""
+
+import itertools
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+from .batch_engine import BatchRankChecker
+from .cancellation import CancelledError, CancelToken, check_cancelled
+from .naver_client import PAGE_SIZE
+from .rank_scanner import iter_product_list
+
+DEFAULT_MAX_RUNNING = 2  # 동시에 실행할 작업 수 (나머지는 대기)
+DEFAULT_KEEP = 50  # 보관할 끝난 작업 수
+
+PENDING = "대기"
+RUNNING = "실행 중"
+DONE = "완료"
+CANCELLED = "중지됨"
+FAILED = "실패"
+
+
+class Job:
+    """백그라운드 작업 하나의 상태와 중간 결과"""
+
+    def __init__(self, job_id, description, total, params=None):
+        self.id = job_id
+        self.description = description
+        self.total = total
+        self.params = params or {}
+        self.created_at = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        self.status = PENDING
+        self.error = None
+        self.cancel_token = CancelToken()
+        self._results = {}
+        self._errors = {}
+        self._lock = threading.Lock()
+        self._future = None
+
+    def add_result(self, key, value, error=None):
+        """중간 결과 하나 기록 (실행 스레드에서 호출)"""
+        with self._lock:
+            self._results[key] = value
+            if error is not None:
+                self._errors[key] = error
+
+    def snapshot(self):
+        """지금까지의 ({키: 결과}, {키: 오류}) 복사본 (끝난 순서)"""
+        with self._lock:
+            return dict(self._results), dict(self._errors)
+
+    @property
+    def done(self):
+        with self._lock:
+            return len(self._results)
+
+    @property
+    def progress(self):
+        return self.done / self.total if self.total else 1.0
+
+    @property
+    def finished(self):
+        return self.status in (DONE, CANCELLED, FAILED)
+
+    def cancel(self):
+        """작업 중지 요청 (대기 중이면 시작하지 않음, 실행 중이면 다음 요청부터 멈춤)"""
+        self.cancel_token.cancel()
+        if self._future is not None and self._future.cancel():
+            self.status = CANCELLED
+
+
+class JobRunner:
+    """작업을 스레드 풀에서 실행하고 최근 작업 목록을 보관"""
+
+    def __init__(self, max_running=DEFAULT_MAX_RUNNING, keep=DEFAULT_KEEP):
+        self.keep = keep
+        self._executor = ThreadPoolExecutor(max_workers=max_running, thread_name_prefix="job")
+        self._jobs = OrderedDict()  # id -> Job (등록 순)
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+
+    def submit(self, description, total, run, params=None):
+        """run(job)을 백그라운드에서 실행할 작업 등록 후 Job 반환
+
+        run은 job.add_result로 중간 결과를 기록하고 job.cancel_token을 확인해야 합니다.
+        취소되면 그대로 끝내거나 CancelledError를 발생시키면 됩니다.
+        """
+        with self._lock:
+            job = Job(next(self._ids), description, total, params)
+            self._jobs[job.id] = job
+            self._trim()
+        job._future = self._executor.submit(self._run, job, run)
+        return job
+
+    def _run(self, job, run):
+        if job.cancel_token.cancelled:
+            job.status = CANCELLED
+            return
+        job.status = RUNNING
+        try:
+            run(job)
+        except CancelledError:
+            job.status = CANCELLED
+            return
+        except Exception as e:
+            print(f"⚠️ 백그라운드 작업 실패 ({job.description}): {e}")
+            job.error = str(e)
+            job.status = FAILED
+            return
+        job.status = CANCELLED if job.cancel_token.cancelled else DONE
+
+    def _trim(self):
+        # 끝난 작업은 최근 keep개만 보관
+        finished = [job_id for job_id, job in self._jobs.items() if job.finished]
+        for job_id in finished[:max(0, len(finished) - self.keep)]:
+            del self._jobs[job_id]
+
+    def get(self, job_id):
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def jobs(self):
+        """최근 작업 목록 (최신순)"""
+        with self._lock:
+            return list(reversed(self._jobs.values()))
+
+    def submit_rank_check(self, keywords, mall_name, credentials, resume=True):
+        """검색어 목록 × 판매처 순위 확인 작업 등록
+
+        결과는 검색어별 상품 정보 dict 또는 "검색 결과 없음"/"조회 실패"입니다.
+        체크포인트를 사용하므로 중지한 작업을 같은 조건으로 다시 등록하면 이어서 확인하고,
+        resume=False면 이전 결과를 버리고 처음부터 확인합니다.
+        """
+        keywords = list(dict.fromkeys(keywords))
+
+        def run(job):
+            batch = BatchRankChecker(
+                keywords, mall_name, credentials, cancel_token=job.cancel_token, resume=resume
+            )
+            for keyword, result in batch.iter_results():
+                if result:
+                    job.add_result(keyword, result)
+                elif keyword in batch.errors:
+                    # API 호출 실패는 '검색 결과 없음'과 구분
+                    job.add_result(keyword, "조회 실패", error=batch.errors[keyword])
+                else:
+                    job.add_result(keyword, "검색 결과 없음")
+
+        description = f"순위 확인 - {mall_name} (검색어 {len(keywords)}개)"
+        return self.submit(description, len(keywords), run, params={"keywords": keywords, "mall_name": mall_name, "resume": resume})
+
+    def submit_product_list(self, keyword, credentials, max_rank=PAGE_SIZE, cache=None):
+        """검색어의 1위~max_rank위 상품 리스트 수집 작업 등록
+
+        결과는 {페이지 시작 순위: 그 페이지의 Product 목록}이며 페이지를 받는 대로 기록됩니다.
+        cache(ResultCache)를 주면 같은 조건의 목록을 다른 작업과 함께 쓰고,
+        다른 작업이 수집 중이면 그 결과를 기다려 한 번에 기록합니다.
+        중지하면 받은 페이지까지만 남기며, 중간까지의 목록은 캐시하거나 다른 작업에 넘기지 않습니다.
+        """
+        pages = -(-max_rank // PAGE_SIZE)
+
+        def run(job):
+            def collect():
+                collected = []
+                for start, products in iter_product_list(keyword, credentials, max_rank=max_rank,
+                                                         cancel=job.cancel_token):
+                    collected.append((start, products))
+                    job.add_result(start, products)
+                return collected
+
+            collected = cache.get_or_compute(("product_list", keyword, max_rank), collect) if cache else collect()
+            # 다른 작업의 결과를 기다리는 동안 중지했으면 기록하지 않음
+            check_cancelled(job.cancel_token)
+            recorded = job.snapshot()[0]
+            for start, products in collected:
+                if start not in recorded:
+                    job.add_result(start, products)
+
+        description = f"상품 리스트 - {keyword} (1~{max_rank}위)"
+        params = {"kind": "product_list", "keyword": keyword, "max_rank": max_rank}
+        return self.submit(description, pages, run, params=params)
+
+
+_job_runner = None
+_job_runner_lock = threading.Lock()
+
+
+def get_job_runner():
+    """프로세스 전체에서 공유하는 작업 실행기"""
+    global _job_runner
+    with _job_runner_lock:
+        if _job_runner is None:
+            _job_runner = JobRunner()
+        return _job_runner
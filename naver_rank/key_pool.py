@@ -0,0 +1,125 @@
+"""
+네이버 API 인증 정보 풀
+
+여러 애플리케이션 키에 요청을 나눠 보내 키 하나의 호출 한도를 넘어서 확장합니다.
+키별 일일 남은 호출 수를 확인하고, 401/429가 반복되는 키는 자동으로 제외합니다.
+"""
+
+import itertools
+import threading
+import time
+
+from .rate_limiter import QuotaExceededError
+
+ROUND_ROBIN = "round_robin"
+LEAST_USED = "least_used"
+
+MAX_CONSECUTIVE_FAILURES = 3  # 연속 401/429 횟수가 이만큼 쌓이면 제외
+RATE_LIMIT_COOLDOWN = 300  # 429로 제외된 키를 다시 쓰기까지 대기 시간 (초)
+
+
+def parse_credentials(text):
+    """'client_id:client_secret' 형식(한 줄에 하나)의 추가 키 목록 파싱"""
+    credentials = []
+    for line in text.splitlines():
+        if ":" not in line:
+            continue
+        cid, secret = line.split(":", 1)
+        if cid.strip() and secret.strip():
+            credentials.append((cid.strip(), secret.strip()))
+    return credentials
+
+
+class KeyPool:
+    """여러 (client_id, client_secret) 중 하나를 골라 주는 스레드 안전 풀"""
+
+    def __init__(self, credentials, strategy=LEAST_USED, quota=None,
+                 max_failures=MAX_CONSECUTIVE_FAILURES):
+        self.credentials = list(dict.fromkeys(tuple(c) for c in credentials))
+        self.strategy = strategy
+        self.quota = quota
+        self.max_failures = max_failures
+        self._failures = {c: 0 for c in self.credentials}
+        self._disabled_until = {c: 0.0 for c in self.credentials}
+        self._in_use = {c: 0 for c in self.credentials}
+        self._cycle = itertools.cycle(self.credentials)
+        self._lock = threading.Lock()
+
+    def _available(self, credential, now):
+        if self._disabled_until[credential] > now:
+            return False
+        if self.quota is not None and self.quota.remaining(credential[0]) <= 0:
+            return False
+        return True
+
+    def acquire(self):
+        """다음 요청에 사용할 인증 정보 반환
+
+        사용 가능한 키가 없으면 QuotaExceededError가 발생합니다.
+        """
+        now = time.monotonic()
+        with self._lock:
+            candidates = [c for c in self.credentials if self._available(c, now)]
+            if not candidates:
+                raise QuotaExceededError("사용 가능한 API 키가 없습니다. (한도 소진 또는 인증 실패)")
+
+            if self.strategy == ROUND_ROBIN:
+                credential = next(c for c in self._cycle if c in candidates)
+            else:
+                # 오늘 가장 적게 쓴 키 → 동시에 사용 중인 요청이 적은 키 순
+                def usage(c):
+                    used = self.quota.used(c[0]) if self.quota is not None else 0
+                    return (used + self._in_use[c], self._in_use[c])
+                credential = min(candidates, key=usage)
+
+            self._in_use[credential] += 1
+            return credential
+
+    def release(self, credential, status_code=None):
+        """요청 결과 보고 (status_code가 None이면 연결 오류)"""
+        with self._lock:
+            self._in_use[credential] = max(0, self._in_use[credential] - 1)
+            if status_code in (401, 429):
+                self._failures[credential] += 1
+                if self._failures[credential] >= self.max_failures:
+                    # 인증 실패 키는 계속 제외, 호출 한도 초과 키는 잠시 후 다시 사용
+                    cooldown = float("inf") if status_code == 401 else RATE_LIMIT_COOLDOWN
+                    self._disabled_until[credential] = time.monotonic() + cooldown
+                    print(f"⚠️ API 키 제외: {credential[0][:6]}... (HTTP {status_code} 반복)")
+            elif status_code is not None and status_code < 400:
+                self._failures[credential] = 0
+
+    def has_available(self):
+        now = time.monotonic()
+        with self._lock:
+            return any(self._available(c, now) for c in self.credentials)
+
+    def status(self):
+        """키별 상태 목록 (UI 표시용)"""
+        now = time.monotonic()
+        with self._lock:
+            rows = []
+            for c in self.credentials:
+                rows.append({
+                    "client_id": c[0],
+                    "active": self._disabled_until[c] <= now,
+                    "failures": self._failures[c],
+                    "used": self.quota.used(c[0]) if self.quota is not None else None,
+                    "remaining": self.quota.remaining(c[0]) if self.quota is not None else None,
+                })
+            return rows
+
+
+_pools = {}
+_pools_lock = threading.Lock()
+
+
+def get_key_pool(credentials, strategy=LEAST_USED, quota=None):
+    """같은 키 목록에 대해서는 같은 풀을 재사용 (실패 횟수/제외 상태 유지)"""
+    key = (tuple(tuple(c) for c in credentials), strategy)
+    with _pools_lock:
+        pool = _pools.get(key)
+        if pool is None:
+            pool = KeyPool(credentials, strategy=strategy, quota=quota)
+            _pools[key] = pool
+        return pool
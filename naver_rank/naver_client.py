@@ -0,0 +1,220 @@
+"""
+네이버 쇼핑 검색 API 공용 클라이언트
+
+모든 shop.json 호출은 이 모듈의 공유 세션을 통해 이루어집니다.
+keep-alive 연결 풀을 재사용하므로 페이지마다 TLS 핸드셰이크를 다시 하지 않습니다.
+"""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from .cancellation import check_cancelled, sleep
+from .page_cache import PageCache
+from .key_pool import KeyPool
+from .rate_limiter import KeyedRateLimiter, RetryPolicy, DailyQuota, USAGE_FILE
+
+SHOP_SEARCH_URL = "https://openapi.naver.com/v1/search/shop.json"
+
+# 요청 기본값
+DEFAULT_TIMEOUT = 10
+DEFAULT_POOL_SIZE = 10
+DEFAULT_MAX_CONCURRENCY = 4  # 동시 페이지 요청 수 (초당 호출 한도 이내로 유지)
+PAGE_SIZE = 100  # display 최대값
+MAX_RANK = 1000  # start 최대값
+
+DEFAULT_HEADERS = {
+    "Accept": "application/json",
+    "Accept-Encoding": "gzip, deflate",
+    "Connection": "keep-alive",
+}
+
+
+class NaverSearchClient:
+    """연결 풀을 공유하는 네이버 쇼핑 검색 클라이언트"""
+
+    def __init__(self, pool_size=DEFAULT_POOL_SIZE, timeout=DEFAULT_TIMEOUT,
+                 max_concurrency=DEFAULT_MAX_CONCURRENCY, cache=None, rate_limiter=None,
+                 retry_policy=None, quota=None):
+        self.timeout = timeout
+        self.max_concurrency = max_concurrency
+        self.cache = cache
+        self.rate_limiter = rate_limiter
+        self.retry_policy = retry_policy or RetryPolicy(max_retries=0)
+        self.quota = quota
+        self.session = requests.Session()
+        self.session.headers.update(DEFAULT_HEADERS)
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+        self.session.mount("https://", adapter)
+        # 페이지 요청 스레드는 모든 스캔이 함께 사용 (스레드 수 = 연결 풀 크기)
+        # 스캔을 취소하고 다시 시작해도 스레드와 연결이 늘어나지 않고 재사용됨
+        self._page_pool = ThreadPoolExecutor(max_workers=pool_size, thread_name_prefix="naver-page")
+
+    def search(self, query, credentials, start=1, display=PAGE_SIZE, timeout=None, use_cache=True,
+               cancel=None, retry_policy=None):
+        """shop.json 한 페이지 조회
+
+        credentials는 (client_id, client_secret) 튜플 또는 KeyPool입니다.
+        KeyPool이면 요청(재시도 포함)마다 풀에서 키를 골라 사용합니다.
+        HTTP 오류는 requests.HTTPError로 전달됩니다.
+        캐시가 있으면 (query, start, display) 단위로 먼저 캐시를 확인합니다.
+        429/5xx/연결 오류는 retry_policy(없으면 클라이언트 기본값)에 따라 백오프 후 재시도하며,
+        일일 한도를 다 쓰면 QuotaExceededError가 발생합니다.
+        cancel(CancelToken)이 설정되면 새 요청을 보내지 않고 CancelledError가 발생합니다.
+        """
+        cache_key = None
+        if self.cache is not None and use_cache:
+            cache_key = PageCache.make_key(query, start, display)
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                return cached
+
+        retry_policy = retry_policy or self.retry_policy
+        key_pool = credentials if isinstance(credentials, KeyPool) else None
+        attempt = 0
+        while True:
+            check_cancelled(cancel)
+            credential = key_pool.acquire() if key_pool else credentials
+            client_id, client_secret = credential
+            status_code = None
+            try:
+                if self.rate_limiter is not None:
+                    self.rate_limiter.acquire(client_id, cancel=cancel)
+                if self.quota is not None:
+                    self.quota.consume(client_id)
+                response = self.session.get(
+                    SHOP_SEARCH_URL,
+                    params={"query": query, "display": display, "start": start},
+                    headers={
+                        "X-Naver-Client-Id": client_id,
+                        "X-Naver-Client-Secret": client_secret,
+                    },
+                    timeout=timeout or self.timeout,
+                )
+                status_code = response.status_code
+            except (requests.ConnectionError, requests.Timeout):
+                if not retry_policy.should_retry(attempt):
+                    raise
+                sleep(retry_policy.delay(attempt), cancel)
+                attempt += 1
+                continue
+            finally:
+                if key_pool:
+                    key_pool.release(credential, status_code)
+
+            if response.ok:
+                break
+            if (key_pool and status_code == 401 and attempt < retry_policy.max_retries
+                    and key_pool.has_available()):
+                # 인증 실패한 키 대신 다른 키로 바로 재시도
+                attempt += 1
+                continue
+            if not retry_policy.should_retry(attempt, status_code):
+                break
+            delay = retry_policy.delay(attempt, response.headers.get("Retry-After"))
+            if status_code == 429 and self.rate_limiter is not None:
+                # 같은 키를 쓰는 모든 Worker가 함께 쉬어야 함
+                self.rate_limiter.pause(client_id, delay)
+            sleep(delay, cancel)
+            attempt += 1
+
+        response.raise_for_status()
+        result = response.json()
+        if cache_key is not None:
+            self.cache.put(cache_key, result)
+        return result
+
+    def iter_pages(self, query, credentials, max_rank=MAX_RANK, concurrency=None, early_exit=False,
+                   cancel=None, use_cache=True):
+        """1위부터 max_rank위까지 페이지를 순위 순서대로 반환하는 제너레이터
+
+        (start, items) 튜플을 yield 합니다. 페이지는 최대 concurrency개씩
+        병렬로 받아오며, 빈 페이지가 나오면 이후 페이지는 버리고 종료합니다.
+
+        early_exit=True면 첫 페이지만 먼저 받아 본 뒤 나머지를 병렬로 받습니다.
+        호출 측이 중간에 멈추면(close) 아직 시작하지 않은 요청은 취소됩니다.
+        cancel(CancelToken)이 설정되면 받는 중인 페이지를 기다리지 않고 CancelledError가 발생합니다.
+        use_cache=False면 페이지 캐시를 읽지도 채우지도 않고 항상 새로 요청합니다.
+        """
+        starts = list(range(1, max_rank + 1, PAGE_SIZE))
+        workers = min(concurrency or self.max_concurrency, len(starts))
+
+        if workers <= 1:
+            for start in starts:
+                items = self.search(query, credentials, start=start, cancel=cancel,
+                                    use_cache=use_cache).get("items", [])
+                if not items:
+                    return
+                yield start, items
+            return
+
+        futures = {}
+        submitted = 0
+        # 동시에 진행 중인 요청은 항상 workers개 이하 (early_exit면 1페이지 → workers페이지로 확대)
+        window = 1 if early_exit else workers
+        try:
+            for i, start in enumerate(starts):
+                # 기다리는 페이지(i)부터 window개까지만 미리 요청
+                while submitted < len(starts) and submitted < i + window:
+                    futures[submitted] = self._page_pool.submit(
+                        self.search, query, credentials, start=starts[submitted], cancel=cancel,
+                        use_cache=use_cache
+                    )
+                    submitted += 1
+                future = futures.pop(i)
+                # 취소를 확인하며 대기 (진행 중인 요청은 백그라운드에서 끝나고 연결을 돌려줌)
+                while not wait([future], timeout=0.2).done:
+                    check_cancelled(cancel)
+                items = future.result().get("items", [])
+                if not items:
+                    return
+                yield start, items
+                window = max(window, workers)
+        finally:
+            for future in futures.values():
+                future.cancel()
+
+    def find_first(self, query, credentials, match, max_rank=MAX_RANK, concurrency=None, cancel=None):
+        """match(item)을 만족하는 첫 상품의 (순위, item) 반환
+
+        결과는 순위 순서대로 오므로 첫 일치가 곧 최고 순위입니다.
+        찾는 즉시 남은 페이지 요청을 멈춥니다. 없으면 None.
+        취소되면 CancelledError가 발생합니다.
+        """
+        pages = self.iter_pages(query, credentials, max_rank=max_rank,
+                                concurrency=concurrency, early_exit=True, cancel=cancel)
+        try:
+            for start, items in pages:
+                for idx, item in enumerate(items):
+                    if match(item):
+                        return start + idx, item
+        finally:
+            pages.close()
+        return None
+
+    def close(self):
+        self._page_pool.shutdown(wait=False, cancel_futures=True)
+        self.session.close()
+        if self.quota is not None:
+            self.quota.flush()
+
+
+_client = None
+_client_lock = threading.Lock()
+
+
+def get_client():
+    """프로세스 전체에서 공유하는 클라이언트 반환"""
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = NaverSearchClient(
+                    cache=PageCache(),
+                    rate_limiter=KeyedRateLimiter(),
+                    retry_policy=RetryPolicy(),
+                    quota=DailyQuota(path=USAGE_FILE),
+                )
+    return _client
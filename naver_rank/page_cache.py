@@ -0,0 +1,118 @@
+"""
+검색 결과 페이지 캐시
+
+(검색어, start, display) 단위로 shop.json 응답을 보관합니다.
+메모리 LRU + TTL을 기본으로 하고, 필요하면 SQLite 파일에도 저장해
+프로그램을 다시 켜도 TTL 안의 결과는 재사용합니다.
+"""
+
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+
+DEFAULT_TTL = 600  # 초
+DEFAULT_MAX_ENTRIES = 2000  # 페이지 수 (검색어 200개 × 10페이지)
+DEFAULT_DISK_PATH = "page_cache.db"
+
+
+class PageCache:
+    """TTL이 있는 LRU 페이지 캐시 (선택적 디스크 저장)"""
+
+    def __init__(self, ttl=DEFAULT_TTL, max_entries=DEFAULT_MAX_ENTRIES, disk_path=None):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.disk_hits = 0
+        self._entries = OrderedDict()  # key -> (저장 시각, payload)
+        self._lock = threading.Lock()
+        self._db = None
+        self.disk_path = None
+        if disk_path:
+            self.set_disk_path(disk_path)
+
+    def set_disk_path(self, disk_path):
+        """디스크 저장소 연결 (None이면 해제)"""
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+            self.disk_path = disk_path
+            if disk_path:
+                self._db = sqlite3.connect(disk_path, check_same_thread=False)
+                self._db.execute(
+                    "CREATE TABLE IF NOT EXISTS pages ("
+                    "key TEXT PRIMARY KEY, stored_at REAL NOT NULL, payload TEXT NOT NULL)"
+                )
+                self._db.commit()
+
+    @staticmethod
+    def make_key(query, start, display):
+        return json.dumps([query, start, display], ensure_ascii=False)
+
+    def get(self, key):
+        """TTL 안에 저장된 페이지 반환, 없으면 None"""
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                stored_at, payload = entry
+                if now - stored_at < self.ttl:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return payload
+                del self._entries[key]
+
+            if self._db is not None:
+                row = self._db.execute(
+                    "SELECT stored_at, payload FROM pages WHERE key = ?", (key,)
+                ).fetchone()
+                if row and now - row[0] < self.ttl:
+                    payload = json.loads(row[1])
+                    self._remember(key, row[0], payload)
+                    self.hits += 1
+                    self.disk_hits += 1
+                    return payload
+
+            self.misses += 1
+            return None
+
+    def put(self, key, payload):
+        now = time.time()
+        with self._lock:
+            self._remember(key, now, payload)
+            if self._db is not None:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO pages (key, stored_at, payload) VALUES (?, ?, ?)",
+                    (key, now, json.dumps(payload, ensure_ascii=False)),
+                )
+                self._db.execute("DELETE FROM pages WHERE stored_at < ?", (now - self.ttl,))
+                self._db.commit()
+
+    def _remember(self, key, stored_at, payload):
+        self._entries[key] = (stored_at, payload)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            if self._db is not None:
+                self._db.execute("DELETE FROM pages")
+                self._db.commit()
+            self.hits = self.misses = self.disk_hits = 0
+
+    def stats(self):
+        """캐시 적중/실패 통계"""
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "disk_hits": self.disk_hits,
+                "entries": len(self._entries),
+                "hit_rate": self.hits / total if total else 0.0,
+            }
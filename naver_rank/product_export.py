@@ -0,0 +1,91 @@
+"""
+상품 리스트 파일 저장 (페이지 단위 스트리밍)
+
+상품 리스트는 최대 1000개이므로 모두 모은 뒤 DataFrame으로 만들지 않고,
+페이지를 받을 때마다 바로 CSV 또는 XLSX(openpyxl write-only)에 한 줄씩 기록합니다.
+"""
+
+import csv
+import shutil
+
+EXPORT_COLUMNS = ["순위", "상품명", "판매처", "브랜드", "상품타입", "가격", "링크"]
+_INT_COLUMNS = (0, 5)  # 순위, 가격
+
+
+def export_row(product):
+    """Product를 저장용 행(EXPORT_COLUMNS 순서)으로 변환"""
+    return [product.rank, product.title, product.mall_name, product.brand, product.category, product.price,
+            product.link]
+
+
+def export_format(path):
+    return "xlsx" if path.lower().endswith(".xlsx") else "csv"
+
+
+class ProductListWriter:
+    """상품 리스트를 받은 페이지부터 바로 파일에 기록 (with 문으로 사용)"""
+
+    def __init__(self, path, fmt=None):
+        self.path = path
+        self.fmt = fmt or export_format(path)
+        self.count = 0
+        self._file = self._csv = self._book = self._sheet = None
+        if self.fmt == "xlsx":
+            from openpyxl import Workbook
+            # write-only 모드는 행을 메모리에 모아 두지 않고 바로 내보냄
+            self._book = Workbook(write_only=True)
+            self._sheet = self._book.create_sheet("상품리스트")
+            self._sheet.append(EXPORT_COLUMNS)
+        else:
+            # 엑셀에서 한글이 깨지지 않도록 BOM 포함
+            self._file = open(path, "w", encoding="utf-8-sig", newline="")
+            self._csv = csv.writer(self._file)
+            self._csv.writerow(EXPORT_COLUMNS)
+
+    def write_rows(self, rows):
+        for row in rows:
+            if self._sheet is not None:
+                self._sheet.append(row)
+            else:
+                self._csv.writerow(row)
+            self.count += 1
+        if self._file is not None:
+            self._file.flush()
+
+    def write_page(self, products):
+        """Product 목록(페이지 하나) 기록"""
+        self.write_rows(export_row(product) for product in products)
+
+    def close(self):
+        if self._book is not None:
+            self._book.save(self.path)
+            self._book = None
+        elif self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def copy_product_list(csv_path, save_path):
+    """ProductListWriter로 기록한 CSV를 save_path(CSV/XLSX)로 저장하고 저장한 상품 수 반환
+
+    XLSX로 저장할 때도 CSV를 한 줄씩 읽어 옮기므로 상품 수와 관계없이 메모리 사용량이 일정합니다.
+    """
+    if export_format(save_path) == "csv":
+        shutil.copyfile(csv_path, save_path)
+        with open(csv_path, "r", encoding="utf-8-sig", newline="") as f:
+            return max(0, sum(1 for _ in csv.reader(f)) - 1)
+
+    with open(csv_path, "r", encoding="utf-8-sig", newline="") as f, ProductListWriter(save_path) as writer:
+        reader = csv.reader(f)
+        next(reader, None)  # 머리글
+        for row in reader:
+            for i in _INT_COLUMNS:
+                row[i] = int(row[i]) if row[i].isdigit() else row[i]
+            writer.write_rows([row])
+        return writer.count
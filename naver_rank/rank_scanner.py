@@ -0,0 +1,197 @@
+"""
+판매처/상품 순위 스캔
+
+검색 결과를 한 번만 훑어서 여러 판매처·상품의 최고 순위를 함께 구합니다.
+API 호출 수가 (검색어 × 판매처)가 아니라 검색어 수에 비례합니다.
+"""
+
+from collections import namedtuple
+
+from .cancellation import CancelledError
+from .items import ProductColumns, normalize_item, normalize_page, unique_titles
+from .naver_client import get_client, MAX_RANK, PAGE_SIZE
+
+
+class RankTarget(namedtuple("RankTarget", ["mall_name", "product_name"])):
+    """순위를 찾을 대상 (판매처명, 선택적 상품명 필터)"""
+
+    __slots__ = ()
+
+    def __new__(cls, mall_name, product_name=""):
+        return super().__new__(cls, mall_name.strip(), (product_name or "").strip())
+
+    def matches(self, product):
+        """product(Product)가 이 대상인지 확인"""
+        if not product.mall_name or self.mall_name not in product.mall_name:
+            return False
+        # 상품명이 지정된 경우 상품명에 포함되는지 확인
+        return not self.product_name or self.product_name in product.title
+
+
+def find_top_product(keyword, mall_name, credentials, client=None, cancel=None):
+    """판매처의 최고 순위 상품 정보 조회 (없으면 None)
+
+    순위 순서대로 보므로 첫 일치가 최고 순위이며, 찾는 즉시 페이지 요청을 멈춥니다.
+    취소되면 CancelledError가 발생합니다.
+    """
+    client = client or get_client()
+    found = client.find_first(
+        keyword, credentials,
+        lambda item: item.get("mallName") and mall_name in item["mallName"],
+        cancel=cancel
+    )
+    if not found:
+        return None
+    return product_info(normalize_item(*found))
+
+
+def product_info(product):
+    """Product를 순위 조회 결과용 상품 정보(dict)로 변환"""
+    return {
+        "rank": product.rank,
+        "title": product.title,
+        "price": product.price,
+        "link": product.link,
+        "mallName": product.mall_name,
+        "brand": product.brand,
+        "category": product.category
+    }
+
+
+def scan_ranks(keyword, credentials, targets, collect_items=False, max_rank=MAX_RANK, client=None,
+               cancel=None, on_page=None, collect_margin=None, use_cache=True):
+    """검색어 한 번의 스캔으로 여러 대상의 최고 순위 조회
+
+    반환값은 (best, products) 입니다.
+    - best: {RankTarget: Product} — 찾지 못한 대상은 포함되지 않음
+    - products: collect_items=True면 스캔한 모든 상품의 ProductColumns(순위순), 아니면 빈 ProductColumns
+
+    collect_items=False면 모든 대상을 찾는 즉시 페이지 요청을 멈춥니다.
+    collect_items=True여도 collect_margin을 주면 모든 대상을 찾고 가장 낮은 순위 + collect_margin위까지
+    모은 뒤 멈춥니다 (주변 순위만 필요한 경쟁사 분석용).
+    cancel(CancelToken)이 설정되면 남은 페이지를 기다리지 않고 그때까지의 결과를 반환하며,
+    on_page(start, products)는 페이지 하나를 확인할 때마다 정리된 Product 목록으로 호출됩니다.
+    use_cache=False면 페이지 캐시를 거치지 않고 항상 새로 조회합니다 (지금 순위를 기록하는 추적용).
+    """
+    client = client or get_client()
+    pending = list(dict.fromkeys(targets))
+    best = {}
+    scanned = ProductColumns()
+
+    pages = client.iter_pages(keyword, credentials, max_rank=max_rank,
+                              early_exit=not collect_items or collect_margin is not None, cancel=cancel,
+                              use_cache=use_cache)
+    try:
+        for start, items in pages:
+            if cancel is not None and cancel.is_set():
+                break
+            products = normalize_page(start, items)
+            if collect_items:
+                scanned.extend(products)
+            if pending:
+                for product in products:
+                    matched = [target for target in pending if target.matches(product)]
+                    for target in matched:
+                        best[target] = product
+                        pending.remove(target)
+                    if not pending:
+                        break
+            if on_page:
+                on_page(start, products)
+            if not pending:
+                if not collect_items:
+                    break
+                if collect_margin is not None and \
+                        scanned.last_rank >= max(product.rank for product in best.values()) + collect_margin:
+                    break
+    except CancelledError:
+        pass  # 순위 순서대로 확인하므로 그때까지 찾은 순위는 그대로 유효
+    finally:
+        pages.close()
+    return best, scanned
+
+
+def iter_product_list(keyword, credentials, max_rank=PAGE_SIZE, client=None, cancel=None):
+    """상품 리스트 추출: (start, Product 목록)을 페이지마다 순위 순서대로 반환하는 제너레이터
+
+    max_rank(최대 1000)위까지의 페이지를 동시에 받아 오며, 받은 페이지부터 바로 돌려주므로
+    호출 측은 전체를 모으지 않고 표나 파일에 곧바로 쓸 수 있습니다.
+    상품명이 앞 순위 상품과 같은 상품은 뺍니다. 취소되면 CancelledError가 발생합니다.
+    """
+    client = client or get_client()
+    max_rank = min(max_rank, MAX_RANK)
+    seen_titles = set()
+    pages = client.iter_pages(keyword, credentials, max_rank=max_rank, cancel=cancel)
+    try:
+        for start, items in pages:
+            page = normalize_page(start, items[:max_rank - start + 1])
+            yield start, unique_titles(page, seen_titles)
+    finally:
+        pages.close()
+
+
+DEFAULT_WINDOWS = (5, 10)  # 경쟁사를 찾을 순위 범위 (앞에서부터 차례로 넓힘)
+
+
+def nearby_competitors(products, target_rank, target_mall_name, count=10, windows=DEFAULT_WINDOWS,
+                       max_per_mall=1):
+    """target_rank 주변 다른 판매처 상품 (Product 목록, 순위순)
+
+    products는 scan_ranks가 돌려준 ProductColumns입니다.
+    windows의 범위를 차례로 넓혀 가며(기본: ±5위, 부족하면 ±10위) 가까운 범위의 상품부터
+    count개까지 고릅니다. 입력한 판매처명이 포함된 판매처는 제외하고,
+    한 판매처에서는 높은 순위부터 max_per_mall개까지만 고릅니다 (None이면 제한 없음).
+    순위 범위를 직접 계산하므로 전체 상품 수와 관계없이 2×max(windows)개만 확인합니다.
+    """
+    excluded = products.malls_matching(target_mall_name)
+    mall_names = products.mall_names
+    first = products.first_rank
+    competitors = []
+    per_mall = {}
+
+    inner = 0
+    for radius in windows:
+        if len(competitors) >= count:
+            break
+        # 이전 범위 바깥, 이번 범위 안쪽 (위쪽 → 아래쪽 순서로 순위순)
+        ring = list(products.ranks(target_rank - radius, target_rank - inner - 1))
+        ring += products.ranks(target_rank + inner + 1, target_rank + radius)
+        for rank in ring:
+            mall = mall_names[rank - first]
+            if mall in excluded:
+                continue
+            if max_per_mall is not None:
+                if per_mall.get(mall, 0) >= max_per_mall:
+                    continue
+                per_mall[mall] = per_mall.get(mall, 0) + 1
+            competitors.append(rank)
+            if len(competitors) >= count:
+                break
+        inner = max(inner, radius)
+
+    competitors.sort()
+    return [products.product(rank) for rank in competitors]
+
+
+def analyze_competitors(keyword, credentials, mall_names, count=10, windows=DEFAULT_WINDOWS, max_per_mall=1,
+                        max_rank=MAX_RANK, client=None, cancel=None, on_page=None):
+    """여러 판매처의 경쟁사를 검색어 한 번의 스캔으로 분석
+
+    {판매처명: (판매처의 최고 순위 Product, 경쟁사 Product 목록)}을 반환하며,
+    max_rank위 안에서 찾지 못한 판매처는 (None, [])입니다.
+    모든 판매처를 찾고 가장 낮은 순위 + max(windows)위까지만 받아 옵니다.
+    windows/max_per_mall/count는 nearby_competitors와 같습니다.
+    """
+    targets = {mall_name: RankTarget(mall_name) for mall_name in dict.fromkeys(mall_names)}
+    best, scanned = scan_ranks(keyword, credentials, list(targets.values()), collect_items=True,
+                               max_rank=max_rank, client=client, cancel=cancel, on_page=on_page,
+                               collect_margin=max(windows, default=0))
+    analysis = {}
+    for mall_name, target in targets.items():
+        found = best.get(target)
+        if found is None:
+            analysis[mall_name] = (None, [])
+        else:
+            analysis[mall_name] = (found, nearby_competitors(scanned, found.rank, target.mall_name, count,
+                                                             windows, max_per_mall))
+    return analysis
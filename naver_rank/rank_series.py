@@ -0,0 +1,65 @@
+"""
+순위 추적 기록의 시계열 (그래프용)
+
+추적 기록은 확인할 때마다 한 건씩 늘어나므로 새 기록만 덧붙이고,
+기록이 많으면 화면에 그릴 점 수를 구간별 최고/최저 순위만 남기는 방식으로 줄입니다.
+(순위가 튀었던 지점은 사라지지 않습니다.)
+"""
+
+from datetime import datetime
+
+TIME_FORMAT = "%Y-%m-%d %H:%M:%S"
+MAX_CHART_POINTS = 400  # 그래프에 그릴 최대 점 수
+
+
+def parse_time(text):
+    try:
+        return datetime.strptime(text, TIME_FORMAT)
+    except (TypeError, ValueError):
+        return datetime.fromisoformat(text)
+
+
+class RankSeries:
+    """추적 대상 하나의 (확인 시각, 순위) 목록"""
+
+    __slots__ = ("times", "ranks")
+
+    def __init__(self, history=()):
+        self.times = []
+        self.ranks = []
+        self.extend(history)
+
+    def extend(self, history):
+        """history(store.history 형식의 dict 목록)의 기록을 뒤에 덧붙임"""
+        for record in history:
+            self.times.append(parse_time(record["datetime"]))
+            self.ranks.append(record["rank"])
+
+    def __len__(self):
+        return len(self.ranks)
+
+    def display_points(self, max_points=MAX_CHART_POINTS):
+        """그래프에 그릴 (시각 목록, 순위 목록)
+
+        max_points개 이하면 그대로, 넘으면 구간마다 최고/최저 순위 점만 시간 순서대로 남깁니다.
+        첫 기록과 마지막(최신) 기록은 항상 포함합니다.
+        """
+        count = len(self.ranks)
+        if count <= max_points:
+            return list(self.times), list(self.ranks)
+
+        ranks = self.ranks
+        buckets = max(1, (max_points - 2) // 2)
+        step = (count - 2) / buckets
+        keep = [0]
+        for b in range(buckets):
+            lo = 1 + int(b * step)
+            hi = 1 + int((b + 1) * step)
+            if lo >= hi:
+                continue
+            segment = range(lo, hi)
+            best = min(segment, key=ranks.__getitem__)
+            worst = max(segment, key=ranks.__getitem__)
+            keep.extend(sorted({best, worst}))
+        keep.append(count - 1)
+        return [self.times[i] for i in keep], [ranks[i] for i in keep]
@@ -0,0 +1,213 @@
+"""
+네이버 Open API 호출 속도 제한
+
+여러 Worker와 페이지 요청 스레드가 동시에 호출해도
+전체 초당 호출 수가 한도를 넘지 않도록 토큰 버킷으로 조절합니다.
+429(호출 한도 초과)나 일시적 오류는 지수 백오프 + 지터로 재시도하고,
+인증 정보별 하루 호출 수를 세어 일일 한도를 넘기 전에 멈춥니다.
+"""
+
+import atexit
+import json
+import os
+import random
+import threading
+import time
+from datetime import date
+
+from .cancellation import sleep
+
+DEFAULT_RATE = 8.0  # 초당 호출 수 (네이버 검색 API 초당 한도 이내)
+DEFAULT_BURST = 8  # 한 번에 몰아서 보낼 수 있는 최대 호출 수
+DAILY_LIMIT = 25000  # 네이버 검색 API 일일 호출 한도 (애플리케이션당)
+USAGE_FILE = "api_usage.json"
+USAGE_SAVE_EVERY = 50  # 이만큼 호출할 때마다 사용량 파일 저장
+USAGE_SAVE_INTERVAL = 5.0  # 초 (마지막 저장 후 이 시간이 지나면 다음 호출 때 저장)
+
+
+class QuotaExceededError(Exception):
+    """일일 호출 한도 소진"""
+
+
+class TokenBucket:
+    """스레드 안전 토큰 버킷"""
+
+    def __init__(self, rate=DEFAULT_RATE, capacity=DEFAULT_BURST):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def _refill(self):
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def acquire(self, tokens=1, cancel=None):
+        """토큰을 얻을 때까지 대기 (cancel이 설정되면 CancelledError)"""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                if now < self._paused_until:
+                    wait = self._paused_until - now
+                else:
+                    self._refill()
+                    if self._tokens >= tokens:
+                        self._tokens -= tokens
+                        return
+                    wait = (tokens - self._tokens) / self.rate
+            sleep(wait, cancel)
+
+    def pause(self, seconds):
+        """429 응답을 받으면 모든 호출자를 잠시 멈춤"""
+        with self._lock:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+            self._tokens = 0.0
+
+
+class KeyedRateLimiter:
+    """인증 정보(client_id)별 토큰 버킷
+
+    네이버 초당 호출 한도는 애플리케이션 키마다 따로 적용되므로
+    키가 여러 개면 전체 처리량도 그만큼 늘어납니다.
+    """
+
+    def __init__(self, rate=DEFAULT_RATE, capacity=DEFAULT_BURST):
+        self.rate = rate
+        self.capacity = capacity
+        self._buckets = {}
+        self._lock = threading.Lock()
+
+    def bucket(self, key):
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                bucket = TokenBucket(self.rate, self.capacity)
+                self._buckets[key] = bucket
+            return bucket
+
+    def acquire(self, key, cancel=None):
+        self.bucket(key).acquire(cancel=cancel)
+
+    def pause(self, key, seconds):
+        self.bucket(key).pause(seconds)
+
+
+class RetryPolicy:
+    """지수 백오프 + 지터 재시도 정책"""
+
+    RETRY_STATUS = (429, 500, 502, 503, 504)
+
+    def __init__(self, max_retries=4, base_delay=0.5, max_delay=16.0):
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+
+    def should_retry(self, attempt, status_code=None):
+        if attempt >= self.max_retries:
+            return False
+        return status_code is None or status_code in self.RETRY_STATUS
+
+    def delay(self, attempt, retry_after=None):
+        """attempt번째 재시도 전 대기 시간 (Retry-After 헤더가 있으면 우선)"""
+        if retry_after:
+            try:
+                return min(float(retry_after), self.max_delay)
+            except ValueError:
+                pass
+        backoff = min(self.max_delay, self.base_delay * (2 ** attempt))
+        # full jitter: 여러 Worker가 동시에 재시도하지 않도록 분산
+        return random.uniform(backoff / 2, backoff)
+
+
+class DailyQuota:
+    """인증 정보(client_id)별 일일 호출 수 카운터
+
+    path가 있으면 파일에 저장해 프로그램을 다시 켜도 당일 사용량을 이어서 셉니다.
+    호출마다 파일을 쓰면 모든 요청 스레드가 디스크 쓰기를 기다리므로, 메모리의 카운트를 기준으로
+    save_every번 호출하거나 save_interval초가 지날 때마다, 그리고 프로그램 종료 시에 저장합니다.
+    """
+
+    def __init__(self, limit=DAILY_LIMIT, path=None, save_every=USAGE_SAVE_EVERY,
+                 save_interval=USAGE_SAVE_INTERVAL):
+        self.limit = limit
+        self.path = path
+        self.save_every = save_every
+        self.save_interval = save_interval
+        self._day = date.today().isoformat()
+        self._counts = {}
+        self._dirty = 0  # 저장하지 않은 호출 수
+        self._saved_at = time.monotonic()
+        self._lock = threading.Lock()
+        self._save_lock = threading.Lock()
+        self._load()
+        if self.path:
+            atexit.register(self.flush)
+
+    def _load(self):
+        if not self.path or not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("date") == self._day:
+                self._counts = data.get("counts", {})
+        except Exception as e:
+            print(f"⚠️ API 사용량 로드 실패: {e}")
+
+    def flush(self):
+        """저장하지 않은 사용량을 파일에 기록"""
+        if not self.path:
+            return
+        with self._save_lock:
+            self._write()
+
+    def _write(self):
+        # _save_lock 안에서 호출 (나중에 찍은 스냅샷이 항상 나중에 기록됨)
+        with self._lock:
+            if not self._dirty:
+                return
+            data = {"date": self._day, "counts": dict(self._counts)}
+            self._dirty = 0
+            self._saved_at = time.monotonic()
+        try:
+            with open(self.path, "w", encoding="utf-8") as f:
+                json.dump(data, f)
+        except OSError as e:
+            print(f"⚠️ API 사용량 저장 실패: {e}")
+
+    def _roll_day(self):
+        today = date.today().isoformat()
+        if today != self._day:
+            self._day = today
+            self._counts = {}
+            self._dirty += 1
+
+    def consume(self, key):
+        """호출 1회 기록, 한도를 넘으면 QuotaExceededError"""
+        with self._lock:
+            self._roll_day()
+            used = self._counts.get(key, 0)
+            if used >= self.limit:
+                raise QuotaExceededError(f"일일 호출 한도({self.limit:,}회)를 모두 사용했습니다.")
+            self._counts[key] = used + 1
+            self._dirty += 1
+            save = self.path and (
+                self._dirty >= self.save_every or time.monotonic() - self._saved_at >= self.save_interval
+            )
+        # 다른 스레드가 저장 중이면 기다리지 않음 (그 저장이나 다음 저장에 포함됨)
+        if save and self._save_lock.acquire(blocking=False):
+            try:
+                self._write()
+            finally:
+                self._save_lock.release()
+
+    def used(self, key):
+        with self._lock:
+            self._roll_day()
+            return self._counts.get(key, 0)
+
+    def remaining(self, key):
+        return max(0, self.limit - self.used(key))
@@ -0,0 +1,118 @@
+"""
+조회 결과 캐시 (프로세스 전체 공유 + 동시 요청 합치기)
+
+Streamlit은 세션(브라우저 탭)마다 같은 프로세스에서 스크립트를 실행하므로, 이 모듈의 캐시는
+모든 세션이 함께 씁니다. 상품 리스트·순위·경쟁사 분석처럼 페이지 여러 개를 받아 가공한 결과를
+(종류, 검색어, 조건) 단위로 TTL 동안 보관하고, 같은 키를 다른 세션이 계산 중이면 새로
+요청하지 않고 그 결과를 기다립니다(single-flight).
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+
+from .cancellation import CancelledError
+from .page_cache import DEFAULT_TTL
+
+DEFAULT_MAX_ENTRIES = 500
+
+
+class _ComputeAbandoned(Exception):
+    """계산하던 호출이 취소되었거나 Exception이 아닌 예외(재실행 요청, KeyboardInterrupt 등)로 중단됨"""
+
+
+class ResultCache:
+    """TTL이 있는 LRU 결과 캐시 + 같은 키의 동시 계산을 한 번으로 합침"""
+
+    def __init__(self, ttl=DEFAULT_TTL, max_entries=DEFAULT_MAX_ENTRIES):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.shared = 0  # 다른 호출의 진행 중인 계산을 기다려 받은 횟수
+        self._entries = OrderedDict()  # key -> (저장 시각, 결과)
+        self._pending = {}  # key -> 계산 중인 Future
+        self._lock = threading.Lock()
+
+    def get_or_compute(self, key, compute):
+        """key의 결과 반환, 없으면 compute()로 계산해 보관
+
+        key는 해시 가능한 값(튜플 등)이어야 합니다.
+        같은 key를 다른 스레드가 계산 중이면 그 결과를 기다립니다.
+        compute()의 예외(Exception)는 캐시하지 않고, 기다리던 호출에도 같은 예외가 발생합니다.
+        CancelledError와 Exception이 아닌 예외(Streamlit 재실행, KeyboardInterrupt 등)는 계산한 호출에서만
+        발생하고, 기다리던 호출은 그 예외나 중간까지의 결과를 받지 않고 직접 다시 계산합니다.
+        """
+        while True:
+            now = time.time()
+            with self._lock:
+                entry = self._entries.get(key)
+                if entry is not None:
+                    if now - entry[0] < self.ttl:
+                        self._entries.move_to_end(key)
+                        self.hits += 1
+                        return entry[1]
+                    del self._entries[key]
+                waiting = self._pending.get(key)
+                if waiting is None:
+                    self.misses += 1
+                    future = self._pending[key] = Future()
+                else:
+                    self.shared += 1
+            if waiting is None:
+                break
+            try:
+                return waiting.result()
+            except _ComputeAbandoned:
+                continue  # 계산하던 호출이 중단됨 → 다시 시도 (필요하면 직접 계산)
+
+        try:
+            result = compute()
+        except CancelledError:
+            self._abandon(key, future)
+            raise
+        except Exception as e:
+            with self._lock:
+                del self._pending[key]
+            future.set_exception(e)
+            raise
+        except BaseException:
+            self._abandon(key, future)
+            raise
+        with self._lock:
+            del self._pending[key]
+            self._entries[key] = (time.time(), result)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        future.set_result(result)
+        return result
+
+    def _abandon(self, key, future):
+        # 취소와 제어 흐름용 예외는 계산한 호출의 것이므로 기다리던 호출에 넘기지 않음
+        with self._lock:
+            del self._pending[key]
+        future.set_exception(_ComputeAbandoned())
+
+    def clear(self):
+        """보관한 결과 삭제 (진행 중인 계산은 그대로 끝남)"""
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = self.shared = 0
+
+    def stats(self):
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "shared": self.shared, "entries": len(self._entries)}
+
+
+_result_cache = None
+_result_cache_lock = threading.Lock()
+
+
+def get_result_cache():
+    """프로세스 전체에서 공유하는 결과 캐시"""
+    global _result_cache
+    with _result_cache_lock:
+        if _result_cache is None:
+            _result_cache = ResultCache()
+        return _result_cache
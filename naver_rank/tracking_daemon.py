@@ -0,0 +1,86 @@
+"""
+순위 추적 스케줄러 (UI 없이 실행)
+
+저장된 모든 추적 대상(검색어, 판매처, 상품명)을 정해진 주기마다 확인해 추적 저장소에 기록합니다.
+대상은 검색어별로 묶어 한 번의 스캔으로 확인하고, 검색어 묶음들을 주기 안에 고르게 나눠
+실행해 API 호출이 한꺼번에 몰리지 않도록 합니다.
+
+실행은 명령행 도구로 합니다: python -m naver_rank track --help
+"""
+
+import threading
+import time
+from datetime import datetime
+
+from .rank_scanner import RankTarget, scan_ranks, product_info
+from .tracking_store import get_tracking_store
+
+DEFAULT_INTERVAL = 3600  # 초
+
+
+def group_targets(targets):
+    """추적 대상을 검색어별로 묶음 {검색어: [(대상 정보, RankTarget)]}"""
+    groups = {}
+    for entry in targets:
+        target = RankTarget(entry["mall_name"], entry["product_name"])
+        groups.setdefault(entry["keyword"], []).append((entry, target))
+    return groups
+
+
+def check_keyword(keyword, entries, credentials, store):
+    """검색어 하나를 스캔해 묶인 대상들의 순위를 기록하고 기록한 대상 수를 반환
+
+    지금 시각으로 기록하므로 페이지 캐시를 거치지 않고 항상 새로 조회합니다.
+    """
+    best, _ = scan_ranks(keyword, credentials, [target for _, target in entries], use_cache=False)
+    records = []
+    for entry, target in entries:
+        found = best.get(target)
+        if not found:
+            continue
+        records.append((entry["keyword"], entry["mall_name"], entry["product_name"], product_info(found)))
+    store.record_many(records)
+    return len(records)
+
+
+class TrackingScheduler:
+    """interval초마다 모든 추적 대상을 확인하는 스케줄러"""
+
+    def __init__(self, credentials, interval=DEFAULT_INTERVAL, store=None):
+        self.credentials = credentials
+        self.interval = interval
+        self.store = store or get_tracking_store()
+        self._stop = threading.Event()
+
+    def stop(self):
+        self._stop.set()
+
+    def run_cycle(self, spread=True):
+        """한 주기 실행: 검색어 묶음마다 interval / 묶음 수 간격으로 확인"""
+        cycle_start = time.monotonic()
+        groups = group_targets(self.store.targets())
+        if not groups:
+            print("ℹ️ 저장된 추적 대상이 없습니다.")
+            return
+        slot = self.interval / len(groups) if spread else 0
+        recorded = 0
+        for i, (keyword, entries) in enumerate(groups.items()):
+            # 이전 묶음이 늦게 끝났으면 기다리지 않고 바로 다음 묶음 실행
+            wait = cycle_start + i * slot - time.monotonic()
+            if wait > 0 and self._stop.wait(wait):
+                return
+            if self._stop.is_set():
+                return
+            try:
+                recorded += check_keyword(keyword, entries, self.credentials, self.store)
+            except Exception as e:
+                print(f"⚠️ 순위 조회 실패 ({keyword}): {e}")
+        print(f"✅ {datetime.now():%Y-%m-%d %H:%M:%S} 검색어 {len(groups)}개 확인, {recorded}개 순위 기록")
+
+    def run_forever(self):
+        while not self._stop.is_set():
+            cycle_start = time.monotonic()
+            self.run_cycle()
+            # 대상이 없거나 주기보다 빨리 끝나면 다음 주기 시작까지 대기
+            self._stop.wait(max(0.0, cycle_start + self.interval - time.monotonic()))
+
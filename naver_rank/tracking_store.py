@@ -0,0 +1,369 @@
+"""
+순위 추적 기록 저장소
+
+추적 대상(검색어, 판매처)과 순위 관측값을 SQLite에 저장합니다.
+순위 확인 한 번은 관측값 한 행 추가이므로 기록이 쌓여도 저장 비용이 늘지 않고,
+(검색어, 판매처, 일시) 인덱스로 특정 대상의 기록만 바로 읽습니다.
+예전 rank_tracking.json이 있으면 처음 열 때 한 번만 옮겨 옵니다.
+
+SQLite를 쓰기 어려운 환경을 위해 JSONL 저널 방식도 제공합니다.
+확인 한 번마다 한 줄을 덧붙이고, 저널이 길어지면 백그라운드에서 스냅샷으로 합칩니다.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+from datetime import datetime
+
+DEFAULT_DB_PATH = "rank_tracking.db"
+LEGACY_JSON_PATH = "rank_tracking.json"
+DEFAULT_JOURNAL_PATH = "rank_tracking.jsonl"
+DEFAULT_SNAPSHOT_PATH = "rank_tracking.snapshot.jsonl"
+COMPACT_EVERY = 500  # 저널 줄 수가 이만큼 쌓이면 스냅샷으로 합침
+
+SQLITE_BACKEND = "sqlite"
+JOURNAL_BACKEND = "journal"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS targets (
+    id INTEGER PRIMARY KEY,
+    keyword TEXT NOT NULL,
+    mall_name TEXT NOT NULL,
+    product_name TEXT NOT NULL DEFAULT '',
+    UNIQUE (keyword, mall_name)
+);
+CREATE TABLE IF NOT EXISTS observations (
+    id INTEGER PRIMARY KEY,
+    target_id INTEGER NOT NULL REFERENCES targets(id) ON DELETE CASCADE,
+    checked_at TEXT NOT NULL,
+    rank INTEGER NOT NULL,
+    title TEXT NOT NULL DEFAULT '',
+    price INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS idx_observations_target_time
+    ON observations (target_id, checked_at);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+
+def now_str():
+    return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
+
+class TrackingStore:
+    """추적 대상/순위 기록 SQLite 저장소 (스레드 안전)"""
+
+    def __init__(self, path=DEFAULT_DB_PATH, legacy_json_path=LEGACY_JSON_PATH):
+        self.path = path
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA foreign_keys=ON")
+        self._db.executescript(_SCHEMA)
+        self._db.commit()
+        if legacy_json_path:
+            self._migrate_json(legacy_json_path)
+
+    def _migrate_json(self, json_path):
+        """rank_tracking.json → SQLite 일회성 이전"""
+        with self._lock:
+            done = self._db.execute(
+                "SELECT 1 FROM meta WHERE key = 'migrated_json'"
+            ).fetchone()
+            if done or not os.path.exists(json_path):
+                return
+            try:
+                with open(json_path, "r", encoding="utf-8") as f:
+                    data = json.load(f)
+            except Exception as e:
+                print(f"⚠️ 추적 데이터 이전 실패: {e}")
+                return
+
+            try:
+                with self._db:
+                    for entry in data.values():
+                        target_id = self._target_id(
+                            entry["keyword"], entry["mall_name"], entry.get("product_name", "")
+                        )
+                        self._db.executemany(
+                            "INSERT INTO observations (target_id, checked_at, rank, title, price) "
+                            "VALUES (?, ?, ?, ?, ?)",
+                            [
+                                (target_id, h["datetime"], h["rank"], h.get("title", ""), int(h.get("price", 0)))
+                                for h in entry.get("history", [])
+                            ],
+                        )
+                    self._db.execute(
+                        "INSERT INTO meta (key, value) VALUES ('migrated_json', ?)", (now_str(),)
+                    )
+                print(f"✅ 추적 데이터 {len(data)}건을 {self.path}(으)로 이전했습니다.")
+            except Exception as e:
+                print(f"⚠️ 추적 데이터 이전 실패: {e}")
+
+    def _target_id(self, keyword, mall_name, product_name=""):
+        """대상 id 조회, 없으면 생성 (잠금을 잡은 상태에서 호출)"""
+        self._db.execute(
+            "INSERT OR IGNORE INTO targets (keyword, mall_name, product_name) VALUES (?, ?, ?)",
+            (keyword, mall_name, product_name or ""),
+        )
+        row = self._db.execute(
+            "SELECT id FROM targets WHERE keyword = ? AND mall_name = ?", (keyword, mall_name)
+        ).fetchone()
+        return row[0]
+
+    def record(self, keyword, mall_name, product_name, product, checked_at=None):
+        """순위 확인 결과 한 건 추가 (product는 rank/title/price를 가진 dict)"""
+        self.record_many([(keyword, mall_name, product_name, product)], checked_at)
+
+    def record_many(self, records, checked_at=None):
+        """(검색어, 판매처, 상품명, product) 목록을 한 트랜잭션으로 추가"""
+        checked_at = checked_at or now_str()
+        with self._lock, self._db:
+            for keyword, mall_name, product_name, product in records:
+                target_id = self._target_id(keyword, mall_name, product_name)
+                self._db.execute(
+                    "INSERT INTO observations (target_id, checked_at, rank, title, price) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    (target_id, checked_at, product["rank"], product.get("title", ""),
+                     int(product.get("price", 0))),
+                )
+
+    def targets(self):
+        """저장된 추적 대상 목록 [{keyword, mall_name, product_name}]"""
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT keyword, mall_name, product_name FROM targets ORDER BY id"
+            ).fetchall()
+        return [{"keyword": k, "mall_name": m, "product_name": p} for k, m, p in rows]
+
+    def history(self, keyword, mall_name, offset=0):
+        """대상의 순위 기록 (오래된 순), 대상이 없으면 None
+
+        offset을 주면 앞의 offset건을 건너뜀 (이미 표시한 기록 이후의 새 기록만 조회)
+        """
+        with self._lock:
+            row = self._db.execute(
+                "SELECT id FROM targets WHERE keyword = ? AND mall_name = ?", (keyword, mall_name)
+            ).fetchone()
+            if row is None:
+                return None
+            rows = self._db.execute(
+                "SELECT checked_at, rank, title, price FROM observations "
+                "WHERE target_id = ? ORDER BY checked_at, id LIMIT -1 OFFSET ?",
+                (row[0], offset),
+            ).fetchall()
+        return [{"datetime": d, "rank": r, "title": t, "price": p} for d, r, t, p in rows]
+
+    def clear(self):
+        """모든 추적 대상과 기록 삭제 (JSON 이전 여부는 유지)"""
+        with self._lock, self._db:
+            self._db.execute("DELETE FROM observations")
+            self._db.execute("DELETE FROM targets")
+
+    def close(self):
+        with self._lock:
+            self._db.close()
+
+
+class JournalTrackingStore:
+    """JSONL 저널 + 스냅샷 추적 저장소
+
+    - 저널(rank_tracking.jsonl): 확인 결과 한 건당 한 줄을 덧붙임
+    - 스냅샷(rank_tracking.snapshot.jsonl): 대상 하나당 한 줄 {keyword, mall_name, product_name, history}
+    읽을 때는 스냅샷 → 합치는 중인 저널 → 저널 순서로 한 줄씩 읽습니다.
+    스냅샷이 아직 없으면 예전 rank_tracking.json을 스냅샷 대신 읽습니다.
+    """
+
+    def __init__(self, journal_path=DEFAULT_JOURNAL_PATH, snapshot_path=DEFAULT_SNAPSHOT_PATH,
+                 legacy_json_path=LEGACY_JSON_PATH, compact_every=COMPACT_EVERY):
+        self.journal_path = journal_path
+        self.snapshot_path = snapshot_path
+        self.legacy_json_path = legacy_json_path
+        self.compact_every = compact_every
+        self._compacting_path = journal_path + ".compacting"
+        self._lock = threading.Lock()
+        self._compactor = None
+        self._pending = sum(1 for _ in self._iter_lines(journal_path))
+        # 이전 실행에서 합치다 중단된 저널이 있으면 마저 합침
+        if os.path.exists(self._compacting_path) or self._pending >= compact_every:
+            self.compact()
+
+    @staticmethod
+    def _iter_lines(path):
+        """JSONL 파일을 한 줄씩 읽어 dict로 반환 (깨진 줄은 건너뜀)"""
+        if not os.path.exists(path):
+            return
+        with open(path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError:
+                    continue  # 저장 중 중단되어 잘린 줄
+
+    def _iter_snapshot(self):
+        if os.path.exists(self.snapshot_path):
+            yield from self._iter_lines(self.snapshot_path)
+        elif self.legacy_json_path and os.path.exists(self.legacy_json_path):
+            try:
+                with open(self.legacy_json_path, "r", encoding="utf-8") as f:
+                    yield from json.load(f).values()
+            except Exception as e:
+                print(f"⚠️ 추적 데이터 로드 실패: {e}")
+
+    def _iter_entries(self):
+        """저장된 모든 항목을 기록 순서대로 반환 (잠금을 잡은 상태에서 호출)
+
+        스냅샷 줄은 history 목록을, 저널 줄은 관측값 하나를 담고 있습니다.
+        """
+        yield from self._iter_snapshot()
+        yield from self._iter_lines(self._compacting_path)
+        yield from self._iter_lines(self.journal_path)
+
+    @staticmethod
+    def _observations(entry):
+        if "history" in entry:
+            return entry["history"]
+        return [{k: entry[k] for k in ("datetime", "rank", "title", "price")}]
+
+    def record(self, keyword, mall_name, product_name, product, checked_at=None):
+        """순위 확인 결과 한 건 추가 (product는 rank/title/price를 가진 dict)"""
+        self.record_many([(keyword, mall_name, product_name, product)], checked_at)
+
+    def record_many(self, records, checked_at=None):
+        """(검색어, 판매처, 상품명, product) 목록을 저널 끝에 덧붙임"""
+        checked_at = checked_at or now_str()
+        lines = [
+            json.dumps({
+                "keyword": keyword,
+                "mall_name": mall_name,
+                "product_name": product_name or "",
+                "datetime": checked_at,
+                "rank": product["rank"],
+                "title": product.get("title", ""),
+                "price": int(product.get("price", 0)),
+            }, ensure_ascii=False, separators=(",", ":")) + "\n"
+            for keyword, mall_name, product_name, product in records
+        ]
+        if not lines:
+            return
+        with self._lock:
+            with open(self.journal_path, "a", encoding="utf-8") as f:
+                f.writelines(lines)
+            self._pending += len(lines)
+            compact = self._pending >= self.compact_every
+        if compact:
+            self.compact()
+
+    def targets(self):
+        """저장된 추적 대상 목록 [{keyword, mall_name, product_name}]"""
+        found = {}
+        with self._lock:
+            for entry in self._iter_entries():
+                key = (entry["keyword"], entry["mall_name"])
+                if key not in found:
+                    found[key] = entry.get("product_name", "")
+        return [{"keyword": k, "mall_name": m, "product_name": p} for (k, m), p in found.items()]
+
+    def history(self, keyword, mall_name, offset=0):
+        """대상의 순위 기록 (기록 순), 대상이 없으면 None
+
+        offset을 주면 앞의 offset건을 건너뜀 (이미 표시한 기록 이후의 새 기록만 조회)
+        """
+        history = None
+        with self._lock:
+            for entry in self._iter_entries():
+                if entry["keyword"] == keyword and entry["mall_name"] == mall_name:
+                    if history is None:
+                        history = []
+                    history.extend(self._observations(entry))
+        return history if history is None or not offset else history[offset:]
+
+    def compact(self, wait=False):
+        """저널을 스냅샷에 합치는 작업을 백그라운드에서 시작"""
+        with self._lock:
+            if self._compactor is None or not self._compactor.is_alive():
+                # 합치는 동안 새 확인 결과는 새 저널에 기록
+                if not os.path.exists(self._compacting_path) and os.path.exists(self.journal_path):
+                    os.replace(self.journal_path, self._compacting_path)
+                self._pending = 0
+                self._compactor = threading.Thread(
+                    target=self._compact, name="tracking-compactor", daemon=True
+                )
+                self._compactor.start()
+            compactor = self._compactor
+        if wait:
+            compactor.join()
+
+    def _compact(self):
+        # 스냅샷과 합치는 중인 저널은 이 스레드만 바꾸므로 잠금 없이 읽음
+        merged = {}
+        try:
+            entries = list(self._iter_snapshot())
+            entries.extend(self._iter_lines(self._compacting_path))
+            for entry in entries:
+                key = (entry["keyword"], entry["mall_name"])
+                if key not in merged:
+                    merged[key] = {
+                        "keyword": entry["keyword"],
+                        "mall_name": entry["mall_name"],
+                        "product_name": entry.get("product_name", ""),
+                        "history": [],
+                    }
+                merged[key]["history"].extend(self._observations(entry))
+
+            tmp_path = self.snapshot_path + ".tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                for target in merged.values():
+                    f.write(json.dumps(target, ensure_ascii=False, separators=(",", ":")) + "\n")
+            with self._lock:
+                os.replace(tmp_path, self.snapshot_path)
+                if os.path.exists(self._compacting_path):
+                    os.remove(self._compacting_path)
+        except Exception as e:
+            print(f"⚠️ 추적 저널 정리 실패: {e}")
+
+    def clear(self):
+        """모든 추적 대상과 기록 삭제"""
+        if self._compactor is not None:
+            self._compactor.join()
+        with self._lock:
+            for path in (self.journal_path, self._compacting_path):
+                if os.path.exists(path):
+                    os.remove(path)
+            # 빈 스냅샷을 남겨 예전 rank_tracking.json을 다시 읽지 않도록 함
+            open(self.snapshot_path, "w", encoding="utf-8").close()
+            self._pending = 0
+
+    def close(self):
+        if self._compactor is not None:
+            self._compactor.join()
+
+
+_stores = {}
+_store_lock = threading.Lock()
+_backend = SQLITE_BACKEND
+
+
+def set_tracking_backend(backend):
+    """get_tracking_store()가 사용할 저장 방식 (SQLITE_BACKEND 또는 JOURNAL_BACKEND)"""
+    global _backend
+    _backend = backend if backend in (SQLITE_BACKEND, JOURNAL_BACKEND) else SQLITE_BACKEND
+
+
+def get_tracking_backend():
+    return _backend
+
+
+def get_tracking_store(backend=None):
+    """앱 전체에서 공유하는 추적 저장소"""
+    backend = backend or _backend
+    with _store_lock:
+        store = _stores.get(backend)
+        if store is None:
+            store = JournalTrackingStore() if backend == JOURNAL_BACKEND else TrackingStore()
+            _stores[backend] = store
+        return store
@@ -0,0 +1,104 @@
+import json
+import time
+
+import pytest
+
+from naver_rank import batch_engine
+from naver_rank.batch_engine import BatchRankChecker
+
+
+class FakeScanner:
+    """find_top_product 대신 사용: 검색어마다 현재 순위를 돌려주고 호출된 검색어를 기록"""
+
+    def __init__(self, rank, failing=()):
+        self.rank = rank
+        self.failing = set(failing)
+        self.calls = []
+
+    def __call__(self, keyword, mall_name, credentials, cancel=None):
+        self.calls.append(keyword)
+        if keyword in self.failing:
+            raise RuntimeError("API 오류")
+        return {"rank": self.rank, "title": keyword, "mallName": mall_name}
+
+
+@pytest.fixture
+def scanner(monkeypatch):
+    def install(rank, failing=()):
+        fake = FakeScanner(rank, failing)
+        monkeypatch.setattr(batch_engine, "find_top_product", fake)
+        return fake
+    return install
+
+
+def make_batch(tmp_path, **kwargs):
+    return BatchRankChecker(["kw1", "kw2", "kw3"], "OO스토어", ("id", "secret"),
+                            checkpoint_dir=str(tmp_path), **kwargs)
+
+
+def ranks(results):
+    return {keyword: result and result["rank"] for keyword, result in results.items()}
+
+
+def test_failed_run_resumes_from_checkpoint(tmp_path, scanner):
+    scanner(10, failing={"kw3"})
+    first = make_batch(tmp_path).run()
+    assert ranks(first) == {"kw1": 10, "kw2": 10, "kw3": None}
+
+    fake = scanner(20)
+    second = make_batch(tmp_path).run()
+
+    assert fake.calls == ["kw3"]
+    assert ranks(second) == {"kw1": 10, "kw2": 10, "kw3": 20}
+
+
+def test_stale_checkpoint_is_rechecked(tmp_path, scanner):
+    scanner(10, failing={"kw3"})
+    batch = make_batch(tmp_path)
+    batch.run()
+
+    # 체크포인트 기록을 CHECKPOINT_MAX_AGE보다 오래된 것으로 바꿈 (다음 날 다시 실행)
+    with open(batch.checkpoint_path, encoding="utf-8") as f:
+        entries = [json.loads(line) for line in f]
+    for entry in entries:
+        entry["checked_at"] -= batch_engine.CHECKPOINT_MAX_AGE + 1
+    with open(batch.checkpoint_path, "w", encoding="utf-8") as f:
+        f.writelines(json.dumps(entry, ensure_ascii=False) + "\n" for entry in entries)
+
+    fake = scanner(20)
+    results = make_batch(tmp_path).run()
+
+    assert sorted(fake.calls) == ["kw1", "kw2", "kw3"]
+    assert ranks(results) == {"kw1": 20, "kw2": 20, "kw3": 20}
+
+
+def test_checkpoint_without_timestamp_is_ignored(tmp_path, scanner):
+    batch = make_batch(tmp_path)
+    with open(batch.checkpoint_path, "w", encoding="utf-8") as f:
+        f.write(json.dumps({"keyword": "kw1", "result": {"rank": 10}}) + "\n")
+
+    assert batch.load_checkpoint() == {}
+    assert not (tmp_path / f"batch_{batch.batch_id}.jsonl").exists()
+
+
+def test_resume_false_starts_fresh(tmp_path, scanner):
+    scanner(10, failing={"kw3"})
+    make_batch(tmp_path).run()
+
+    fake = scanner(20)
+    results = make_batch(tmp_path, resume=False).run()
+
+    assert sorted(fake.calls) == ["kw1", "kw2", "kw3"]
+    assert ranks(results) == {"kw1": 20, "kw2": 20, "kw3": 20}
+
+
+def test_checkpoint_records_checked_at(tmp_path, scanner):
+    scanner(10, failing={"kw3"})
+    batch = make_batch(tmp_path)
+    before = time.time()
+    batch.run()
+
+    with open(batch.checkpoint_path, encoding="utf-8") as f:
+        entries = [json.loads(line) for line in f]
+    assert {entry["keyword"] for entry in entries} == {"kw1", "kw2"}
+    assert all(before <= entry["checked_at"] <= time.time() for entry in entries)
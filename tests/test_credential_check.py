@@ -0,0 +1,32 @@
+import requests
+
+from naver_rank import credential_check
+from naver_rank.credential_check import CredentialVerifier
+from naver_rank.naver_client import NaverSearchClient
+from naver_rank.rate_limiter import RetryPolicy
+
+
+class DeadNetwork:
+    """session.get 대신 사용: 요청마다 연결 오류를 내고 호출 횟수를 기록"""
+
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self, *args, **kwargs):
+        self.calls += 1
+        raise requests.ConnectionError("연결 실패")
+
+
+def test_probe_sends_a_single_request_without_retries(monkeypatch):
+    client = NaverSearchClient(retry_policy=RetryPolicy(max_retries=4, base_delay=60))
+    network = client.session.get = DeadNetwork()
+    monkeypatch.setattr(credential_check, "get_client", lambda: client)
+    verifier = CredentialVerifier(path=None)
+
+    try:
+        assert verifier.verify(("id", "secret"), force=True) is False
+    finally:
+        client.close()
+
+    assert network.calls == 1
+    assert verifier.cached(("id", "secret")) is None  # 판단할 수 없는 결과는 캐시하지 않음
@@ -0,0 +1,85 @@
+import threading
+import time
+
+import pytest
+
+from naver_rank import job_runner
+from naver_rank.cancellation import check_cancelled
+from naver_rank.job_runner import CANCELLED, DONE, JobRunner
+from naver_rank.naver_client import PAGE_SIZE
+from naver_rank.result_cache import ResultCache
+
+
+def wait_until(condition, timeout=2.0):
+    deadline = time.time() + timeout
+    while not condition():
+        assert time.time() < deadline, "시간 초과"
+        time.sleep(0.001)
+
+
+class FakeProductList:
+    """iter_product_list 대신 사용: 첫 페이지는 바로 주고, 나머지는 release가 설정될 때까지 붙잡아 둠"""
+
+    def __init__(self):
+        self.release = threading.Event()
+        self.calls = 0
+
+    def __call__(self, keyword, credentials, max_rank=PAGE_SIZE, cancel=None):
+        self.calls += 1
+        for start in range(1, max_rank + 1, PAGE_SIZE):
+            while start > 1 and not self.release.wait(0.01):
+                check_cancelled(cancel)
+            yield start, [f"{keyword} {start}위"]
+
+
+@pytest.fixture
+def product_list(monkeypatch):
+    fake = FakeProductList()
+    monkeypatch.setattr(job_runner, "iter_product_list", fake)
+    yield fake
+    fake.release.set()  # 테스트가 실패해도 작업 스레드가 남지 않도록
+
+
+def test_cancelled_product_list_job_stops_scanning(product_list):
+    runner = JobRunner()
+    job = runner.submit_product_list("키보드", ("id", "secret"), max_rank=300)
+    wait_until(lambda: job.done == 1)
+
+    job.cancel()
+    wait_until(lambda: job.finished)
+
+    assert job.status == CANCELLED
+    assert list(job.snapshot()[0]) == [1]
+
+
+def test_cancelled_product_list_is_not_shared_or_cached(product_list):
+    runner = JobRunner(max_running=2)
+    cache = ResultCache()
+    owner = runner.submit_product_list("키보드", ("id", "secret"), max_rank=300, cache=cache)
+    wait_until(lambda: owner.done == 1)
+    waiter = runner.submit_product_list("키보드", ("id", "secret"), max_rank=300, cache=cache)
+    wait_until(lambda: cache.shared == 1)
+
+    owner.cancel()
+    wait_until(lambda: owner.finished)
+    # 기다리던 작업은 중간까지의 목록을 받지 않고 직접 다시 수집
+    wait_until(lambda: product_list.calls == 2)
+    product_list.release.set()
+    wait_until(lambda: waiter.finished)
+
+    assert owner.status == CANCELLED
+    assert waiter.status == DONE
+    assert sorted(waiter.snapshot()[0]) == [1, 101, 201]
+    assert cache.stats()["entries"] == 1
+    assert len(cache.get_or_compute(("product_list", "키보드", 300), lambda: [])) == 3
+
+
+def test_completed_product_list_job_records_every_page(product_list):
+    product_list.release.set()
+    runner = JobRunner()
+    job = runner.submit_product_list("키보드", ("id", "secret"), max_rank=250)
+    wait_until(lambda: job.finished)
+
+    assert job.status == DONE
+    assert sorted(job.snapshot()[0]) == [1, 101, 201]
+    assert job.progress == 1.0
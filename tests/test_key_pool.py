@@ -0,0 +1,112 @@
+from types import SimpleNamespace
+
+import pytest
+
+from naver_rank.key_pool import (
+    LEAST_USED, RATE_LIMIT_COOLDOWN, ROUND_ROBIN, KeyPool, parse_credentials,
+)
+from naver_rank.rate_limiter import DailyQuota, QuotaExceededError
+
+KEY_A = ("id_a", "secret_a")
+KEY_B = ("id_b", "secret_b")
+KEY_C = ("id_c", "secret_c")
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr("naver_rank.key_pool.time", SimpleNamespace(monotonic=lambda: now[0]))
+    return now
+
+
+def use(pool, status_code=200):
+    """키 하나를 받아 바로 결과를 보고하고 사용한 키를 반환"""
+    credential = pool.acquire()
+    pool.release(credential, status_code)
+    return credential
+
+
+def test_round_robin_rotates_through_keys():
+    pool = KeyPool([KEY_A, KEY_B, KEY_C], strategy=ROUND_ROBIN)
+
+    assert [use(pool) for _ in range(6)] == [KEY_A, KEY_B, KEY_C] * 2
+
+
+def test_duplicate_credentials_are_merged():
+    pool = KeyPool([KEY_A, list(KEY_A), KEY_B], strategy=ROUND_ROBIN)
+
+    assert pool.credentials == [KEY_A, KEY_B]
+
+
+def test_least_used_prefers_key_with_lowest_daily_usage():
+    quota = DailyQuota(limit=100)
+    for _ in range(5):
+        quota.consume(KEY_A[0])
+    quota.consume(KEY_B[0])
+    pool = KeyPool([KEY_A, KEY_B], strategy=LEAST_USED, quota=quota)
+
+    assert pool.acquire() == KEY_B
+
+
+def test_least_used_spreads_concurrent_requests():
+    pool = KeyPool([KEY_A, KEY_B], strategy=LEAST_USED)
+
+    first = pool.acquire()
+    second = pool.acquire()
+
+    assert {first, second} == {KEY_A, KEY_B}
+
+
+def test_key_with_exhausted_quota_is_skipped():
+    quota = DailyQuota(limit=1)
+    quota.consume(KEY_A[0])
+    pool = KeyPool([KEY_A, KEY_B], strategy=ROUND_ROBIN, quota=quota)
+
+    assert [use(pool) for _ in range(3)] == [KEY_B] * 3
+
+
+def test_repeated_401_disables_key_permanently(clock):
+    pool = KeyPool([KEY_A, KEY_B], strategy=ROUND_ROBIN, max_failures=2)
+    pool.release(pool.acquire(), 401)
+    pool.release(pool.acquire(), 200)
+    pool.release(pool.acquire(), 401)
+
+    clock[0] += 10 ** 6
+    assert [use(pool) for _ in range(3)] == [KEY_B] * 3
+    assert [row["active"] for row in pool.status()] == [False, True]
+
+
+def test_repeated_429_disables_key_until_cooldown(clock):
+    pool = KeyPool([KEY_A, KEY_B], strategy=ROUND_ROBIN, max_failures=2)
+    for _ in range(2):
+        pool.release(KEY_A, 429)
+
+    assert [use(pool) for _ in range(2)] == [KEY_B] * 2
+    clock[0] += RATE_LIMIT_COOLDOWN
+    assert KEY_A in [use(pool) for _ in range(2)]
+
+
+def test_success_resets_failure_count(clock):
+    pool = KeyPool([KEY_A], max_failures=2)
+    pool.release(KEY_A, 429)
+    pool.release(KEY_A, 200)
+    pool.release(KEY_A, 429)
+    pool.release(KEY_A, None)  # 연결 오류는 실패 횟수에 영향 없음
+
+    assert pool.has_available()
+    assert pool.status()[0]["failures"] == 1
+
+
+def test_acquire_raises_when_no_key_is_available(clock):
+    pool = KeyPool([KEY_A], max_failures=1)
+    pool.release(KEY_A, 401)
+
+    assert not pool.has_available()
+    with pytest.raises(QuotaExceededError):
+        pool.acquire()
+
+
+def test_parse_credentials_skips_invalid_lines():
+    text = "id_a:secret_a\n\n잘못된 줄\n id_b : sec:ret \n:secret_only\n"
+
+    assert parse_credentials(text) == [KEY_A, ("id_b", "sec:ret")]
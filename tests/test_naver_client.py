@@ -0,0 +1,88 @@
+import threading
+import time
+
+import pytest
+
+from naver_rank.naver_client import MAX_RANK, PAGE_SIZE, NaverSearchClient
+from naver_rank.page_cache import PageCache
+
+
+class ConcurrencyProbe:
+    """search 대신 사용: 동시에 실행 중인 호출 수의 최대값을 기록"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.running = 0
+        self.peak = 0
+        self.starts = []
+
+    def __call__(self, query, credentials, start=1, cancel=None, **kwargs):
+        with self.lock:
+            self.running += 1
+            self.peak = max(self.peak, self.running)
+            self.starts.append(start)
+        try:
+            time.sleep(0.02)
+            return {"items": [{"title": f"{query} {start + i}"} for i in range(PAGE_SIZE)]}
+        finally:
+            with self.lock:
+                self.running -= 1
+
+
+@pytest.fixture
+def client():
+    client = NaverSearchClient(pool_size=10, max_concurrency=2)
+    yield client
+    client.close()
+
+
+@pytest.mark.parametrize("early_exit", [False, True])
+def test_iter_pages_respects_max_concurrency(client, early_exit):
+    probe = client.search = ConcurrencyProbe()
+
+    pages = list(client.iter_pages("키보드", ("id", "secret"), early_exit=early_exit))
+
+    assert [start for start, _ in pages] == list(range(1, MAX_RANK + 1, PAGE_SIZE))
+    assert probe.peak == 2
+
+
+def test_iter_pages_concurrency_argument_overrides_client_default(client):
+    probe = client.search = ConcurrencyProbe()
+
+    list(client.iter_pages("키보드", ("id", "secret"), concurrency=3))
+
+    assert probe.peak == 3
+
+
+class FakeResponse:
+    def __init__(self, start):
+        self.ok = True
+        self.status_code = 200
+        self.headers = {}
+        self.start = start
+
+    def json(self):
+        return {"items": [{"title": f"상품 {self.start}"}] if self.start <= 200 else []}
+
+    def raise_for_status(self):
+        pass
+
+
+def test_iter_pages_without_cache_always_requests():
+    client = NaverSearchClient(cache=PageCache(), max_concurrency=1)
+    requested = []
+
+    def get(url, params, **kwargs):
+        requested.append(params["start"])
+        return FakeResponse(params["start"])
+
+    client.session.get = get
+    try:
+        list(client.iter_pages("키보드", ("id", "secret")))
+        list(client.iter_pages("키보드", ("id", "secret")))
+        assert requested == [1, 101, 201]
+
+        list(client.iter_pages("키보드", ("id", "secret"), use_cache=False))
+        assert requested == [1, 101, 201] * 2
+    finally:
+        client.close()
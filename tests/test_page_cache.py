@@ -0,0 +1,73 @@
+from types import SimpleNamespace
+
+import pytest
+
+from naver_rank.page_cache import PageCache
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr("naver_rank.page_cache.time", SimpleNamespace(time=lambda: now[0]))
+    return now
+
+
+def page(start):
+    return {"items": [{"title": f"상품 {start}"}]}
+
+
+def test_get_returns_page_within_ttl(clock):
+    cache = PageCache(ttl=60)
+    key = PageCache.make_key("키보드", 1, 100)
+    cache.put(key, page(1))
+
+    clock[0] += 59
+    assert cache.get(key) == page(1)
+    clock[0] += 1
+    assert cache.get(key) is None
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+
+
+def test_keys_differ_by_query_start_and_display():
+    keys = {
+        PageCache.make_key("키보드", 1, 100),
+        PageCache.make_key("키보드", 101, 100),
+        PageCache.make_key("키보드", 1, 50),
+        PageCache.make_key("마우스", 1, 100),
+    }
+    assert len(keys) == 4
+
+
+def test_least_recently_used_page_is_evicted():
+    cache = PageCache(max_entries=2)
+    cache.put("a", page(1))
+    cache.put("b", page(101))
+    assert cache.get("a") == page(1)  # a를 최근 사용으로
+    cache.put("c", page(201))
+
+    assert cache.get("a") == page(1)
+    assert cache.get("b") is None
+    assert cache.get("c") == page(201)
+
+
+def test_disk_cache_survives_restart_within_ttl(tmp_path, clock):
+    path = str(tmp_path / "page_cache.db")
+    PageCache(ttl=60, disk_path=path).put("a", page(1))
+
+    restarted = PageCache(ttl=60, disk_path=path)
+    assert restarted.get("a") == page(1)
+    assert restarted.stats()["disk_hits"] == 1
+
+    clock[0] += 60
+    assert PageCache(ttl=60, disk_path=path).get("a") is None
+
+
+def test_clear_removes_memory_and_disk_entries(tmp_path):
+    path = str(tmp_path / "page_cache.db")
+    cache = PageCache(disk_path=path)
+    cache.put("a", page(1))
+    cache.clear()
+
+    assert cache.get("a") is None
+    assert PageCache(disk_path=path).get("a") is None
@@ -0,0 +1,162 @@
+import json
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from naver_rank.cancellation import CancelledError, CancelToken, check_cancelled
+from naver_rank.rate_limiter import (
+    DailyQuota, KeyedRateLimiter, QuotaExceededError, RetryPolicy, TokenBucket,
+)
+
+
+def saved_counts(path):
+    if not path.exists():
+        return None
+    return json.loads(path.read_text(encoding="utf-8"))["counts"]
+
+
+def test_usage_is_saved_in_batches(tmp_path):
+    path = tmp_path / "api_usage.json"
+    quota = DailyQuota(path=str(path), save_every=10, save_interval=3600)
+
+    for _ in range(9):
+        quota.consume("id")
+    assert saved_counts(path) is None
+    assert quota.used("id") == 9
+
+    quota.consume("id")
+    assert saved_counts(path) == {"id": 10}
+
+    quota.consume("id")
+    assert saved_counts(path) == {"id": 10}
+    quota.flush()
+    assert saved_counts(path) == {"id": 11}
+
+
+def test_usage_is_saved_after_interval(tmp_path):
+    path = tmp_path / "api_usage.json"
+    quota = DailyQuota(path=str(path), save_every=1000, save_interval=0)
+
+    quota.consume("id")
+
+    assert saved_counts(path) == {"id": 1}
+
+
+def test_saved_usage_is_loaded_on_restart(tmp_path):
+    path = tmp_path / "api_usage.json"
+    quota = DailyQuota(limit=5, path=str(path), save_every=100)
+    for _ in range(3):
+        quota.consume("id")
+    quota.flush()
+
+    restarted = DailyQuota(limit=5, path=str(path))
+
+    assert restarted.used("id") == 3
+    restarted.consume("id")
+    restarted.consume("id")
+    with pytest.raises(QuotaExceededError):
+        restarted.consume("id")
+
+
+def test_concurrent_consume_counts_every_call(tmp_path):
+    path = tmp_path / "api_usage.json"
+    quota = DailyQuota(path=str(path), save_every=7, save_interval=3600)
+
+    def worker():
+        for _ in range(100):
+            quota.consume("id")
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    quota.flush()
+
+    assert quota.used("id") == 800
+    assert saved_counts(path) == {"id": 800}
+
+
+class FakeClock:
+    """time.monotonic과 sleep 대신 사용: sleep하면 시간이 그만큼 흐름"""
+
+    def __init__(self):
+        self.now = 100.0
+        self.slept = []
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds, cancel=None):
+        check_cancelled(cancel)
+        self.slept.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr("naver_rank.rate_limiter.time", SimpleNamespace(monotonic=fake.monotonic, time=time.time))
+    monkeypatch.setattr("naver_rank.rate_limiter.sleep", fake.sleep)
+    return fake
+
+
+def test_token_bucket_allows_burst_then_limits_rate(clock):
+    bucket = TokenBucket(rate=4.0, capacity=2)
+
+    bucket.acquire()
+    bucket.acquire()
+    assert clock.slept == []
+
+    started = clock.now
+    for _ in range(4):
+        bucket.acquire()
+    assert clock.now - started == pytest.approx(1.0)
+
+
+def test_token_bucket_pause_blocks_all_callers(clock):
+    bucket = TokenBucket(rate=10.0, capacity=5)
+    bucket.pause(3)
+
+    started = clock.now
+    bucket.acquire()
+
+    assert clock.now - started >= 3
+
+
+def test_token_bucket_wait_is_cancellable(clock):
+    bucket = TokenBucket(rate=1.0, capacity=1)
+    bucket.acquire()
+    cancel = CancelToken()
+    cancel.cancel()
+
+    with pytest.raises(CancelledError):
+        bucket.acquire(cancel=cancel)
+
+
+def test_keyed_rate_limiter_keeps_a_bucket_per_key(clock):
+    limiter = KeyedRateLimiter(rate=1.0, capacity=1)
+
+    limiter.acquire("key1")
+    limiter.acquire("key2")
+    assert clock.slept == []
+
+    limiter.pause("key1", 5)
+    limiter.acquire("key2")
+    assert sum(clock.slept) == pytest.approx(1.0)
+
+
+def test_retry_policy_backoff_and_retry_after():
+    policy = RetryPolicy(max_retries=3, base_delay=0.5, max_delay=4.0)
+
+    assert policy.should_retry(0, 429)
+    assert policy.should_retry(0, None)  # 연결 오류
+    assert not policy.should_retry(0, 404)
+    assert not policy.should_retry(3, 503)
+    for attempt in range(6):
+        backoff = min(4.0, 0.5 * 2 ** attempt)
+        assert backoff / 2 <= policy.delay(attempt) <= backoff
+    assert policy.delay(0, retry_after="2") == 2.0
+    assert policy.delay(0, retry_after="60") == 4.0
@@ -0,0 +1,131 @@
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from naver_rank.result_cache import ResultCache
+
+
+class RerunRequested(BaseException):
+    """Streamlit의 RerunException처럼 Exception이 아닌 제어 흐름용 예외"""
+
+
+def wait_until(condition, timeout=2.0):
+    deadline = time.time() + timeout
+    while not condition():
+        assert time.time() < deadline, "시간 초과"
+        time.sleep(0.001)
+
+
+def run_in_thread(target):
+    """target()을 스레드에서 실행하고 (스레드, {"result"/"error": ...}) 반환"""
+    outcome = {}
+
+    def run():
+        try:
+            outcome["result"] = target()
+        except BaseException as e:
+            outcome["error"] = e
+
+    thread = threading.Thread(target=run)
+    thread.start()
+    return thread, outcome
+
+
+def test_concurrent_calls_share_one_compute():
+    cache = ResultCache()
+    calls = []
+    release = threading.Event()
+
+    def compute():
+        calls.append(1)
+        release.wait(2)
+        return "result"
+
+    threads = [run_in_thread(lambda: cache.get_or_compute("key", compute)) for _ in range(8)]
+    wait_until(lambda: cache.shared == 7)
+    release.set()
+    for thread, _ in threads:
+        thread.join()
+
+    assert len(calls) == 1
+    assert [outcome["result"] for _, outcome in threads] == ["result"] * 8
+    assert cache.get_or_compute("key", compute) == "result"
+    assert cache.stats() == {"hits": 1, "misses": 1, "shared": 7, "entries": 1}
+
+
+def test_exception_is_shared_with_waiters_and_not_cached():
+    cache = ResultCache()
+    release = threading.Event()
+
+    def failing():
+        release.wait(2)
+        raise ValueError("API 오류")
+
+    owner, owner_outcome = run_in_thread(lambda: cache.get_or_compute("key", failing))
+    wait_until(lambda: cache.misses == 1)
+    waiter, waiter_outcome = run_in_thread(lambda: cache.get_or_compute("key", failing))
+    wait_until(lambda: cache.shared == 1)
+    release.set()
+    owner.join()
+    waiter.join()
+
+    assert isinstance(owner_outcome["error"], ValueError)
+    assert isinstance(waiter_outcome["error"], ValueError)
+    assert cache.get_or_compute("key", lambda: "retried") == "retried"
+
+
+def test_base_exception_stays_in_owner_and_waiter_recomputes():
+    cache = ResultCache()
+    release = threading.Event()
+
+    def interrupted():
+        release.wait(2)
+        raise RerunRequested()
+
+    owner, owner_outcome = run_in_thread(lambda: cache.get_or_compute("key", interrupted))
+    wait_until(lambda: cache.misses == 1)
+    waiter, waiter_outcome = run_in_thread(lambda: cache.get_or_compute("key", lambda: "waiter result"))
+    wait_until(lambda: cache.shared == 1)
+    release.set()
+    owner.join()
+    waiter.join()
+
+    assert isinstance(owner_outcome["error"], RerunRequested)
+    assert waiter_outcome == {"result": "waiter result"}
+    assert cache.get_or_compute("key", lambda: "unused") == "waiter result"
+
+
+def test_base_exception_in_owner_without_waiters_is_reraised():
+    cache = ResultCache()
+
+    def interrupted():
+        raise KeyboardInterrupt
+
+    with pytest.raises(KeyboardInterrupt):
+        cache.get_or_compute("key", interrupted)
+    assert cache.get_or_compute("key", lambda: "next") == "next"
+
+
+def test_expired_entries_are_recomputed(monkeypatch):
+    cache = ResultCache(ttl=10)
+    now = [1000.0]
+    monkeypatch.setattr("naver_rank.result_cache.time", SimpleNamespace(time=lambda: now[0]))
+
+    assert cache.get_or_compute("key", lambda: "old") == "old"
+    now[0] += 5
+    assert cache.get_or_compute("key", lambda: "new") == "old"
+    now[0] += 10
+    assert cache.get_or_compute("key", lambda: "new") == "new"
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = ResultCache(max_entries=2)
+    cache.get_or_compute("a", lambda: 1)
+    cache.get_or_compute("b", lambda: 2)
+    cache.get_or_compute("a", lambda: None)  # a를 최근 사용으로
+    cache.get_or_compute("c", lambda: 3)
+
+    assert cache.get_or_compute("a", lambda: "recomputed") == 1
+    assert cache.get_or_compute("b", lambda: "recomputed") == "recomputed"
@@ -0,0 +1,55 @@
+from types import SimpleNamespace
+
+import pytest
+
+from naver_rank import tracking_daemon
+from naver_rank.naver_client import get_client
+from naver_rank.tracking_daemon import TrackingScheduler
+from naver_rank.tracking_store import JournalTrackingStore
+
+
+def product(rank, mall_name):
+    return SimpleNamespace(rank=rank, title=f"상품 {rank}", price=10000, link="", mall_name=mall_name,
+                           brand="", category="")
+
+
+class FakeScan:
+    """scan_ranks 대신 사용: 모든 대상을 10위로 돌려주고 호출 인자를 기록"""
+
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, keyword, credentials, targets, **kwargs):
+        self.calls.append((keyword, kwargs))
+        return {target: product(10, target.mall_name) for target in targets}, None
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = JournalTrackingStore(journal_path=str(tmp_path / "rank_tracking.jsonl"),
+                                 snapshot_path=str(tmp_path / "rank_tracking.snapshot.jsonl"),
+                                 legacy_json_path=None)
+    store.record("키보드", "OO스토어", "", {"rank": 20})
+    store.record("키보드", "XX마켓", "", {"rank": 30})
+    store.record("마우스", "OO스토어", "", {"rank": 40})
+    return store
+
+
+def test_scheduler_leaves_shared_page_cache_alone(store):
+    cache = get_client().cache
+    ttl = cache.ttl
+
+    TrackingScheduler(("id", "secret"), interval=60, store=store)
+
+    assert cache.ttl == ttl
+
+
+def test_cycle_scans_each_keyword_once_without_page_cache(monkeypatch, store):
+    scan = FakeScan()
+    monkeypatch.setattr(tracking_daemon, "scan_ranks", scan)
+
+    TrackingScheduler(("id", "secret"), interval=60, store=store).run_cycle(spread=False)
+
+    assert [keyword for keyword, _ in scan.calls] == ["키보드", "마우스"]
+    assert all(kwargs.get("use_cache") is False for _, kwargs in scan.calls)
+    assert [h["rank"] for h in store.history("키보드", "XX마켓")] == [30, 10]
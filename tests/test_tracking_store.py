@@ -0,0 +1,126 @@
+import json
+import os
+
+import pytest
+
+from naver_rank.tracking_store import JournalTrackingStore, TrackingStore
+
+
+def product(rank):
+    return {"rank": rank, "title": f"상품 {rank}", "price": 10000}
+
+
+def read_lines(path):
+    if not os.path.exists(path):
+        return []
+    with open(path, encoding="utf-8") as f:
+        return [json.loads(line) for line in f]
+
+
+@pytest.fixture
+def paths(tmp_path):
+    return {
+        "journal_path": str(tmp_path / "rank_tracking.jsonl"),
+        "snapshot_path": str(tmp_path / "rank_tracking.snapshot.jsonl"),
+        "legacy_json_path": str(tmp_path / "rank_tracking.json"),
+    }
+
+
+def make_journal(paths, compact_every=100):
+    return JournalTrackingStore(compact_every=compact_every, **paths)
+
+
+def test_journal_appends_one_line_per_check(paths):
+    store = make_journal(paths)
+    store.record("키보드", "OO스토어", "기계식 키보드", product(5), checked_at="2024-01-01 09:00:00")
+    store.record_many([
+        ("키보드", "OO스토어", "기계식 키보드", product(3)),
+        ("마우스", "OO스토어", "", product(12)),
+    ], checked_at="2024-01-02 09:00:00")
+
+    assert len(read_lines(paths["journal_path"])) == 3
+    assert store.targets() == [
+        {"keyword": "키보드", "mall_name": "OO스토어", "product_name": "기계식 키보드"},
+        {"keyword": "마우스", "mall_name": "OO스토어", "product_name": ""},
+    ]
+    assert [h["rank"] for h in store.history("키보드", "OO스토어")] == [5, 3]
+    assert [h["rank"] for h in store.history("키보드", "OO스토어", offset=1)] == [3]
+    assert store.history("없는 검색어", "OO스토어") is None
+
+
+def test_compaction_merges_journal_into_snapshot(paths):
+    store = make_journal(paths, compact_every=3)
+    for rank in (5, 4):
+        store.record("키보드", "OO스토어", "", product(rank))
+    store.record("마우스", "OO스토어", "", product(12))
+    store.close()
+
+    assert not os.path.exists(paths["journal_path"])
+    assert not os.path.exists(paths["journal_path"] + ".compacting")
+    snapshot = read_lines(paths["snapshot_path"])
+    assert [(t["keyword"], [h["rank"] for h in t["history"]]) for t in snapshot] == [
+        ("키보드", [5, 4]), ("마우스", [12]),
+    ]
+
+    # 합친 뒤 새 기록은 다시 저널에 쌓이고, 읽을 때는 스냅샷과 이어짐
+    store.record("키보드", "OO스토어", "", product(2))
+    assert [h["rank"] for h in store.history("키보드", "OO스토어")] == [5, 4, 2]
+
+
+def test_interrupted_compaction_is_finished_on_open(paths):
+    with open(paths["journal_path"] + ".compacting", "w", encoding="utf-8") as f:
+        f.write(json.dumps({"keyword": "키보드", "mall_name": "OO스토어", "product_name": "",
+                            "datetime": "2024-01-01 09:00:00", "rank": 7, "title": "", "price": 0}) + "\n")
+        f.write('{"keyword": "잘린 줄')
+
+    store = make_journal(paths)
+    store.close()
+
+    assert not os.path.exists(paths["journal_path"] + ".compacting")
+    assert [h["rank"] for h in store.history("키보드", "OO스토어")] == [7]
+
+
+def test_legacy_json_is_read_until_first_compaction(paths):
+    legacy = {"키보드_OO스토어": {
+        "keyword": "키보드", "mall_name": "OO스토어", "product_name": "",
+        "history": [{"datetime": "2024-01-01 09:00:00", "rank": 9, "title": "", "price": 0}],
+    }}
+    with open(paths["legacy_json_path"], "w", encoding="utf-8") as f:
+        json.dump(legacy, f, ensure_ascii=False)
+
+    store = make_journal(paths)
+    store.record("키보드", "OO스토어", "", product(6))
+    store.compact(wait=True)
+    os.remove(paths["legacy_json_path"])
+
+    assert [h["rank"] for h in store.history("키보드", "OO스토어")] == [9, 6]
+
+
+def test_clear_leaves_empty_snapshot(paths):
+    with open(paths["legacy_json_path"], "w", encoding="utf-8") as f:
+        json.dump({"키보드_OO스토어": {"keyword": "키보드", "mall_name": "OO스토어", "history": []}}, f)
+    store = make_journal(paths)
+    store.record("마우스", "OO스토어", "", product(1))
+
+    store.clear()
+
+    assert store.targets() == []
+    assert os.path.exists(paths["snapshot_path"])
+
+
+def test_sqlite_store_migrates_legacy_json_once(tmp_path, paths):
+    legacy = {"키보드_OO스토어": {
+        "keyword": "키보드", "mall_name": "OO스토어", "product_name": "",
+        "history": [{"datetime": "2024-01-01 09:00:00", "rank": 9, "title": "", "price": 0}],
+    }}
+    with open(paths["legacy_json_path"], "w", encoding="utf-8") as f:
+        json.dump(legacy, f, ensure_ascii=False)
+    db_path = str(tmp_path / "rank_tracking.db")
+
+    TrackingStore(db_path, paths["legacy_json_path"]).close()
+    store = TrackingStore(db_path, paths["legacy_json_path"])
+    store.record("키보드", "OO스토어", "", product(6), checked_at="2024-01-02 09:00:00")
+
+    assert [h["rank"] for h in store.history("키보드", "OO스토어")] == [9, 6]
+    assert [h["rank"] for h in store.history("키보드", "OO스토어", offset=1)] == [6]
+    store.close()